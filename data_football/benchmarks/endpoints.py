@@ -0,0 +1,343 @@
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from statistics import mean, quantiles
+from time import perf_counter
+
+from fastapi.testclient import TestClient
+from httpx import Response
+from sqlalchemy import Engine, create_engine, make_url, select
+from sqlalchemy.orm import Session
+
+from football.adapters.database import get_read_session, get_session
+from football.adapters.models import Match, table_registry
+from football.app import app
+from football.dataset import SCALES, Scale, generate
+
+OPERATIONS: tuple[str, ...] = ("create", "get", "list", "update", "delete")
+# Database names the run may wipe without --recreate
+SCRATCH_NAMES: tuple[str, ...] = ("bench", "scratch", "test", "tmp")
+
+
+def payloads(references: dict[str, int]) -> dict:
+    # Build a unique create body and an update body per iteration
+    return {
+        "users": lambda index: {
+            "name": f"Bench User {index}",
+            "email": f"bench{index}@mail.com",
+            "password": "secret",
+        },
+        "stadiums": lambda index: {
+            "name": f"Bench Stadium {index}",
+            "capacity": 40_000 + index,
+            "city": "Bench City",
+            "country": "Brazil",
+        },
+        "championships": lambda index: {
+            "name": f"Bench Championship {index}",
+            "format": "league",
+            "context": "national",
+            "country": "Brazil",
+            "start_year": 2024,
+            "end_year": 2025,
+        },
+        "teams": lambda index: {
+            "name": f"Bench Team {index}",
+            "full_name": f"Bench Team {index} Football Club",
+            "code": f"B{index}",
+            "country": "Brazil",
+        },
+        "rounds": lambda index: {
+            "phase": f"Bench Round {index}",
+            "details": "",
+            "championship_id": references["championship_id"],
+        },
+        "players": lambda index: {
+            "name": f"Bench Player {index}",
+            "full_name": f"Bench Player {index} Surname",
+            "country": "Brazil",
+            "birth_date": "2000-01-01",
+            "current_team_id": references["home_team_id"],
+        },
+        "matches": lambda index: {
+            "date_hour": f"2024-08-01T{index % 24:02}:00:00",
+            "goals_home": index % 4,
+            "goals_away": index % 3,
+            "extra_time": False,
+            "goals_extra_time_home": 0,
+            "goals_extra_time_away": 0,
+            "penalty": False,
+            "goals_penalty_home": 0,
+            "goals_penalty_away": 0,
+            "stadium_id": references["stadium_id"],
+            "round_id": references["round_id"],
+            "home_team_id": references["home_team_id"],
+            "away_team_id": references["away_team_id"],
+        },
+        "goals": lambda index: {
+            "minute": index % 90 + 1,
+            "own_goal": False,
+            "match_id": references["match_id"],
+            "team_id": references["home_team_id"],
+            "player_id": references["player_id"],
+        },
+    }
+
+
+def disposable(url: str) -> bool:
+    database: str = (make_url(url).database or "").lower()
+    return any(name in database for name in SCRATCH_NAMES)
+
+
+def prepare(url: str, scale: Scale) -> Engine:
+    engine: Engine = create_engine(url)
+    table_registry.metadata.drop_all(engine)
+    table_registry.metadata.create_all(engine)
+    with engine.begin() as connection:
+        generate(connection, scale)
+    return engine
+
+
+def references(engine: Engine, scale: Scale) -> dict[str, int]:
+    with Session(engine) as session:
+        match: Match = session.scalar(select(Match).where(Match.id == 1))
+        return {
+            "championship_id": 1,
+            "match_id": match.id,
+            "round_id": match.round_id,
+            "stadium_id": match.stadium_id,
+            "home_team_id": match.home_team_id,
+            "away_team_id": match.away_team_id,
+            # Generated players are numbered consecutively per team
+            "player_id": (match.home_team_id - 1) * scale.players_per_team + 1,
+        }
+
+
+def timed(samples: dict[str, list]):
+    def measure(operation: str, request) -> Response:
+        start: float = perf_counter()
+        response: Response = request()
+        samples[operation].append(perf_counter() - start)
+        return response
+
+    return measure
+
+
+def traced(samples: dict[str, list]):
+    # Peak bytes allocated while serving the request
+    def measure(operation: str, request) -> Response:
+        current: int = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        response: Response = request()
+        samples[operation].append(tracemalloc.get_traced_memory()[1] - current)
+        return response
+
+    return measure
+
+
+def cycle(client: TestClient, resource: str, body, index: int, measure):
+    def call(operation: str, method: str, path: str, **kwargs) -> Response:
+        response: Response = measure(
+            operation, lambda: client.request(method, path, **kwargs)
+        )
+        assert response.is_success, (operation, path, response.text)
+        return response
+
+    url: str = f"/{resource}/"
+    created: Response = call("create", "POST", url, json=body(index))
+    record_id: int = created.json()["id"]
+    call("get", "GET", f"{url}{record_id}")
+    call("list", "GET", url)
+    call("update", "PUT", f"{url}{record_id}", json=body(index + 1_000_000))
+    call("delete", "DELETE", f"{url}{record_id}")
+
+
+def samples() -> dict[str, list]:
+    return {operation: [] for operation in OPERATIONS}
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    milliseconds: list[float] = sorted(sample * 1000 for sample in samples)
+    percentiles: list[float] = quantiles(
+        milliseconds, n=100, method="inclusive"
+    )
+    return {
+        "min_ms": round(milliseconds[0], 4),
+        "mean_ms": round(mean(milliseconds), 4),
+        "p50_ms": round(percentiles[49], 4),
+        "p95_ms": round(percentiles[94], 4),
+    }
+
+
+def run(url: str, backend: str, size: str, repeat: int, warmup: int) -> dict:
+    scale: Scale = SCALES[size]
+    engine: Engine = prepare(url, scale)
+    bodies: dict = payloads(references(engine, scale))
+
+    def get_session_override():
+        with Session(engine) as session:
+            yield session
+
+    results: dict = {}
+    app.dependency_overrides[get_session] = get_session_override
+    app.dependency_overrides[get_read_session] = get_session_override
+    try:
+        with TestClient(app) as client:
+            for resource, body in bodies.items():
+                for index in range(warmup):
+                    cycle(client, resource, body, index, timed(samples()))
+                timings: dict[str, list] = samples()
+                for index in range(warmup, warmup + repeat):
+                    cycle(client, resource, body, index, timed(timings))
+
+                # A separate traced pass, tracing would distort the timings
+                peaks: dict[str, list] = samples()
+                tracemalloc.start()
+                try:
+                    cycle(
+                        client, resource, body, warmup + repeat, traced(peaks)
+                    )
+                finally:
+                    tracemalloc.stop()
+
+                for operation in OPERATIONS:
+                    key: str = f"{backend}/{size}/{resource}/{operation}"
+                    results[key] = {
+                        **summarize(timings[operation]),
+                        "peak_kib": round(peaks[operation][0] / 1024, 1),
+                    }
+                    print(f"{key:<45} {results[key]['p50_ms']:>9.3f} ms")
+    finally:
+        app.dependency_overrides.clear()
+        engine.dispose()
+    return results
+
+
+def command_run(options: argparse.Namespace) -> int:
+    backends: dict[str, str] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        if "sqlite" in options.backends:
+            backends["sqlite"] = f"sqlite:///{Path(directory) / 'bench.db'}"
+        if "postgresql" in options.backends:
+            if not options.postgres_url:
+                print("Skipping postgresql, no --postgres-url given")
+            elif not options.recreate and not disposable(options.postgres_url):
+                # Every table is dropped and reloaded with the dataset
+                print(
+                    "Refusing to wipe a database not named like a scratch "
+                    "one, pass --recreate to use it anyway"
+                )
+                return 2
+            else:
+                backends["postgresql"] = options.postgres_url
+
+        results: dict = {}
+        for backend, url in backends.items():
+            for size in options.sizes:
+                results.update(
+                    run(url, backend, size, options.repeat, options.warmup)
+                )
+
+    report: dict = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "repeat": options.repeat,
+        },
+        "results": results,
+    }
+    options.output.write_text(json.dumps(report, indent=2))
+    print(f"Results saved to {options.output}")
+    return 0
+
+
+def compare(
+    baseline: dict, current: dict, metric: str, threshold: float
+) -> list[tuple[str, float, float, float]]:
+    regressions: list[tuple[str, float, float, float]] = []
+    for key, values in sorted(current["results"].items()):
+        before: dict = baseline["results"].get(key)
+        if not before or not before[metric]:
+            continue
+        change: float = values[metric] / before[metric] - 1
+        print(
+            f"{key:<45} {before[metric]:>10.3f} {values[metric]:>10.3f} "
+            f"{change:>+8.1%}"
+        )
+        if change > threshold:
+            regressions.append((key, before[metric], values[metric], change))
+    return regressions
+
+
+def command_compare(options: argparse.Namespace) -> int:
+    baseline: dict = json.loads(options.baseline.read_text())
+    current: dict = json.loads(options.current.read_text())
+    print(f"{'benchmark':<45} {'baseline':>10} {'current':>10} {'change':>8}")
+    regressions: list = compare(
+        baseline, current, options.metric, options.threshold
+    )
+    if regressions:
+        print(
+            f"\n{len(regressions)} regression(s) over {options.threshold:.0%}:"
+        )
+        for key, _, _, change in regressions:
+            print(f"  {key} {change:+.1%}")
+        return 1
+    print("\nNo regressions")
+    return 0
+
+
+def main(arguments: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark every endpoint through the ASGI app"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=["sqlite", "postgresql"],
+        default=["sqlite"],
+    )
+    run_parser.add_argument("--postgres-url", default="")
+    run_parser.add_argument(
+        "--recreate",
+        action="store_true",
+        help="Drop and reload the --postgres-url database whatever its name",
+    )
+    run_parser.add_argument(
+        "--sizes", nargs="+", choices=list(SCALES), default=["small"]
+    )
+    run_parser.add_argument("--repeat", type=int, default=50)
+    run_parser.add_argument("--warmup", type=int, default=5)
+    run_parser.add_argument(
+        "--output", type=Path, default=Path("benchmark-results.json")
+    )
+    run_parser.set_defaults(handler=command_run)
+
+    compare_parser = commands.add_parser(
+        "compare", help="Compare results against a baseline"
+    )
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--baseline", type=Path, required=True)
+    compare_parser.add_argument(
+        "--metric",
+        choices=["min_ms", "mean_ms", "p50_ms", "p95_ms", "peak_kib"],
+        default="p50_ms",
+    )
+    compare_parser.add_argument("--threshold", type=float, default=0.15)
+    compare_parser.set_defaults(handler=command_compare)
+
+    options = parser.parse_args(arguments)
+    return options.handler(options)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
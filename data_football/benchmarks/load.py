@@ -0,0 +1,393 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from itertools import count
+from pathlib import Path
+from statistics import quantiles
+from time import perf_counter
+
+import httpx
+from sqlalchemy import create_engine, text
+
+from football.adapters.models import table_registry
+from football.dataset import SCALES, Scale, generate
+
+# Read heavy, a few percent of writes
+MIX: list[dict] = [
+    {"method": "GET", "path": "/matches/?round_id={round_id}", "weight": 25},
+    {
+        "method": "GET",
+        "path": "/matches/?team_id={team_id}&expand=home_team,away_team",
+        "weight": 15,
+    },
+    {"method": "GET", "path": "/matches/{match_id}", "weight": 10},
+    {"method": "GET", "path": "/players/team/{team_id}", "weight": 20},
+    {"method": "GET", "path": "/players/{player_id}", "weight": 10},
+    {"method": "GET", "path": "/goals/?match_id={match_id}", "weight": 8},
+    {"method": "GET", "path": "/teams/{team_id}", "weight": 5},
+    {"method": "GET", "path": "/championships/{championship_id}", "weight": 3},
+    {
+        "method": "GET",
+        "path": "/championships/{championship_id}/standings",
+        "weight": 5,
+    },
+    {
+        "method": "POST",
+        "path": "/stadiums/",
+        "weight": 2,
+        "json": {
+            "name": "Load Stadium {unique}",
+            "capacity": 30_000,
+            "city": "Load City",
+            "country": "Brazil",
+        },
+    },
+    {
+        "method": "POST",
+        "path": "/teams/",
+        "weight": 2,
+        "json": {
+            "name": "Load Team {unique}",
+            "full_name": "Load Team {unique} Football Club",
+            "code": "L{unique}",
+            "country": "Brazil",
+        },
+    },
+]
+
+
+@dataclass
+class RouteStats:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+
+def free_port() -> int:
+    with socket.socket() as listener:
+        listener.bind(("127.0.0.1", 0))
+        return listener.getsockname()[1]
+
+
+def identifiers(scale: Scale) -> dict[str, int]:
+    # Upper bound of every generated id, placeholders draw from 1..bound
+    return {
+        "championship_id": scale.championships * scale.seasons,
+        "round_id": scale.championships * scale.seasons * scale.rounds,
+        "match_id": scale.matches,
+        "team_id": scale.teams,
+        "player_id": scale.players,
+        "stadium_id": scale.stadiums,
+    }
+
+
+def route(entry: dict) -> str:
+    # Report per template, the query string only varies the arguments
+    return f"{entry['method']} {entry['path'].split('?')[0]}"
+
+
+def render(value, values: dict):
+    if isinstance(value, str):
+        return value.format(**values)
+    if isinstance(value, dict):
+        return {key: render(item, values) for key, item in value.items()}
+    if isinstance(value, list):
+        return [render(item, values) for item in value]
+    return value
+
+
+def prepare(url: str, scale: Scale, seed: int):
+    engine = create_engine(url)
+    table_registry.metadata.drop_all(engine)
+    table_registry.metadata.create_all(engine)
+    with engine.begin() as connection:
+        generate(connection, scale, seed)
+        connection.execute(text("ANALYZE"))
+    engine.dispose()
+
+
+def start_server(url: str, port: int, workers: int) -> subprocess.Popen:
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "football.app:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--no-access-log",
+        ],
+        env={**os.environ, "DATABASE_URL": url},
+    )
+
+
+async def wait_ready(base_url: str, timeout: float):
+    deadline: float = perf_counter() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while True:
+            try:
+                if (await client.get("/")).is_success:
+                    return
+            except httpx.TransportError:
+                pass
+            if perf_counter() > deadline:
+                raise TimeoutError(f"Server not ready after {timeout:.0f}s")
+            await asyncio.sleep(0.1)
+
+
+async def worker(  # noqa: PLR0913, PLR0917
+    client: httpx.AsyncClient,
+    mix: list[dict],
+    bounds: dict[str, int],
+    generator: random.Random,
+    unique,
+    deadline: float,
+    stats: dict[str, RouteStats],
+):
+    weights: list[float] = [entry["weight"] for entry in mix]
+    while perf_counter() < deadline:
+        entry: dict = generator.choices(mix, weights)[0]
+        values: dict = {
+            name: generator.randint(1, bound) for name, bound in bounds.items()
+        }
+        values["unique"] = next(unique)
+        started: float = perf_counter()
+        try:
+            response: httpx.Response = await client.request(
+                entry["method"],
+                render(entry["path"], values),
+                json=render(entry.get("json"), values),
+            )
+            failed: bool = (
+                response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR
+            )
+        except httpx.HTTPError:
+            failed = True
+        elapsed: float = perf_counter() - started
+        route_stats: RouteStats = stats.setdefault(route(entry), RouteStats())
+        route_stats.latencies.append(elapsed)
+        route_stats.errors += failed
+
+
+async def replay(  # noqa: PLR0913, PLR0917
+    base_url: str,
+    mix: list[dict],
+    bounds: dict[str, int],
+    concurrency: int,
+    duration: float,
+    warmup: float,
+    seed: int,
+) -> tuple[dict[str, RouteStats], float]:
+    limits = httpx.Limits(max_connections=concurrency)
+    unique = count(1)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=30
+    ) as client:
+
+        async def phase(seconds: float) -> dict[str, RouteStats]:
+            stats: dict[str, RouteStats] = {}
+            deadline: float = perf_counter() + seconds
+            await asyncio.gather(
+                *(
+                    worker(
+                        client,
+                        mix,
+                        bounds,
+                        random.Random(f"{seed}:{index}"),
+                        unique,
+                        deadline,
+                        stats,
+                    )
+                    for index in range(concurrency)
+                )
+            )
+            return stats
+
+        if warmup:
+            await phase(warmup)
+        started: float = perf_counter()
+        stats: dict[str, RouteStats] = await phase(duration)
+        return stats, perf_counter() - started
+
+
+def summarize(stats: RouteStats, elapsed: float) -> dict[str, float]:
+    milliseconds: list[float] = sorted(
+        latency * 1000 for latency in stats.latencies
+    )
+    percentiles: list[float] = (
+        quantiles(milliseconds, n=100, method="inclusive")
+        if len(milliseconds) > 1
+        else milliseconds * 99
+    )
+    return {
+        "requests": len(milliseconds),
+        "errors": stats.errors,
+        "rps": round(len(milliseconds) / elapsed, 1),
+        "p50_ms": round(percentiles[49], 2),
+        "p95_ms": round(percentiles[94], 2),
+        "p99_ms": round(percentiles[98], 2),
+    }
+
+
+def report(stats: dict[str, RouteStats], elapsed: float) -> dict[str, dict]:
+    results: dict[str, dict] = {
+        name: summarize(route_stats, elapsed)
+        for name, route_stats in sorted(stats.items())
+    }
+    total = RouteStats()
+    for route_stats in stats.values():
+        total.latencies.extend(route_stats.latencies)
+        total.errors += route_stats.errors
+    if total.latencies:
+        results["total"] = summarize(total, elapsed)
+    return results
+
+
+def violations(results: dict[str, dict], slos: dict[str, dict]) -> list[str]:
+    # A route without its own objectives falls back to the "*" entry
+    missed: list[str] = []
+    for name, values in results.items():
+        objectives: dict = slos.get(name, slos.get("*", {}))
+        for metric, limit in objectives.items():
+            if metric == "min_rps":
+                if values["rps"] < limit:
+                    missed.append(f"{name}: rps {values['rps']} < {limit}")
+                continue
+            actual: float = (
+                values["errors"] / max(values["requests"], 1)
+                if metric == "error_rate"
+                else values[metric]
+            )
+            if actual > limit:
+                missed.append(f"{name}: {metric} {actual} > {limit}")
+    return missed
+
+
+def print_report(results: dict[str, dict]):
+    print(
+        f"{'route':<40} {'requests':>9} {'errors':>7} {'rps':>8} "
+        f"{'p50_ms':>9} {'p95_ms':>9} {'p99_ms':>9}"
+    )
+    for name, values in results.items():
+        print(
+            f"{name:<40} {values['requests']:>9} {values['errors']:>7} "
+            f"{values['rps']:>8.1f} {values['p50_ms']:>9.2f} "
+            f"{values['p95_ms']:>9.2f} {values['p99_ms']:>9.2f}"
+        )
+
+
+def command(options: argparse.Namespace, url: str) -> int:
+    config: dict = (
+        json.loads(options.config.read_text()) if options.config else {}
+    )
+    mix: list[dict] = config.get("mix", MIX)
+    slos: dict[str, dict] = config.get("slos", {})
+    if options.p95_ms is not None:
+        slos.setdefault("*", {})["p95_ms"] = options.p95_ms
+    if options.p99_ms is not None:
+        slos.setdefault("*", {})["p99_ms"] = options.p99_ms
+    if options.max_error_rate is not None:
+        slos.setdefault("*", {})["error_rate"] = options.max_error_rate
+
+    scale: Scale = SCALES[options.size]
+    if options.prepare:
+        print(f"Generating the {options.size} dataset")
+        prepare(url, scale, options.seed)
+
+    server: subprocess.Popen = None
+    base_url: str = options.base_url
+    if not base_url:
+        port: int = free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        server = start_server(url, port, options.workers)
+    try:
+        asyncio.run(wait_ready(base_url, options.startup_timeout))
+        stats, elapsed = asyncio.run(
+            replay(
+                base_url,
+                mix,
+                identifiers(scale),
+                options.concurrency,
+                options.duration,
+                options.warmup,
+                options.seed,
+            )
+        )
+    finally:
+        if server:
+            server.terminate()
+            server.wait(timeout=30)
+
+    results: dict[str, dict] = report(stats, elapsed)
+    print_report(results)
+    if options.output:
+        options.output.write_text(json.dumps(results, indent=2))
+        print(f"Results saved to {options.output}")
+
+    if missed := violations(results, slos):
+        print(f"\n{len(missed)} SLO violation(s):")
+        for line in missed:
+            print(f"  {line}")
+        return 1
+    print("\nAll SLOs met" if slos else "\nNo SLOs configured")
+    return 0
+
+
+def main(arguments: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Replay a traffic mix against a running uvicorn server"
+    )
+    parser.add_argument(
+        "--database-url",
+        default="",
+        help="Database for the server, a temporary SQLite file by default",
+    )
+    parser.add_argument(
+        "--base-url",
+        default="",
+        help="Target an already running server instead of starting one",
+    )
+    parser.add_argument(
+        "--prepare",
+        action="store_true",
+        help="Recreate the tables and load the synthetic dataset first",
+    )
+    parser.add_argument("--size", choices=list(SCALES), default="small")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--warmup", type=float, default=5.0)
+    parser.add_argument("--startup-timeout", type=float, default=30.0)
+    parser.add_argument(
+        "--config",
+        type=Path,
+        help='JSON file with a "mix" list and per route "slos"',
+    )
+    parser.add_argument("--p95-ms", type=float)
+    parser.add_argument("--p99-ms", type=float)
+    parser.add_argument("--max-error-rate", type=float)
+    parser.add_argument("--output", type=Path)
+    options = parser.parse_args(arguments)
+
+    if options.database_url:
+        return command(options, options.database_url)
+    with tempfile.TemporaryDirectory() as directory:
+        # A fresh temporary database always needs the dataset
+        options.prepare = True
+        return command(options, f"sqlite:///{Path(directory) / 'load.db'}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
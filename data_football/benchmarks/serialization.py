@@ -0,0 +1,86 @@
+import argparse
+import json
+from time import perf_counter
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from football.adapters.models import Match, table_registry
+from football.adapters.queries import dump_all, fetch, select_records
+from football.domain.entities import MatchModel
+from football.responses import json_response
+from football.utils import random_int, random_str
+
+
+def populate(session: Session, rows: int):
+    session.add_all(
+        Match(
+            date_hour=random_str(),
+            goals_home=random_int(0, 5),
+            goals_away=random_int(0, 5),
+            extra_time=False,
+            goals_extra_time_home=0,
+            goals_extra_time_away=0,
+            penalty=False,
+            goals_penalty_home=0,
+            goals_penalty_away=0,
+            stadium_id=1,
+            round_id=1,
+            home_team_id=1,
+            away_team_id=2,
+        )
+        for _ in range(rows)
+    )
+    session.commit()
+
+
+def orm_path(session: Session, rows: int) -> bytes:
+    # Per-row from_attributes validation and the default JSON encoder
+    matches: list[Match] = session.scalars(select(Match).limit(rows)).all()
+    content: dict = {
+        "matches": [
+            MatchModel.model_validate(match).model_dump(mode="json")
+            for match in matches
+        ]
+    }
+    return json.dumps(content).encode()
+
+
+def fast_path(session: Session, rows: int) -> bytes:
+    matches: list = fetch(session, select_records(Match, {}).limit(rows))
+    return json_response({"matches": dump_all(matches, {}, MatchModel)}).body
+
+
+def measure(engine, path, rows: int, repeat: int) -> float:
+    timings: list[float] = []
+    for _ in range(repeat):
+        with Session(engine) as session:
+            start: float = perf_counter()
+            path(session, rows)
+            timings.append(perf_counter() - start)
+    return min(timings) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare list serialization paths for /matches"
+    )
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    table_registry.metadata.create_all(engine)
+    with Session(engine) as session:
+        populate(session, max(args.rows))
+
+    print(f"{'rows':>8} {'orm (ms)':>10} {'fast (ms)':>10} {'speedup':>8}")
+    for rows in args.rows:
+        orm: float = measure(engine, orm_path, rows, args.repeat)
+        fast: float = measure(engine, fast_path, rows, args.repeat)
+        print(f"{rows:>8} {orm:>10.2f} {fast:>10.2f} {orm / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
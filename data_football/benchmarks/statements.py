@@ -0,0 +1,101 @@
+import argparse
+from time import process_time
+
+from sqlalchemy import Engine, create_engine, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from football.adapters.models import Match, Player, Team, table_registry
+from football.adapters.queries import (
+    build_select,
+    fetch,
+    fetch_one,
+    freeze,
+    lookup,
+    parse_expand,
+    select_by_id,
+    select_records,
+)
+from football.dataset import SCALES, Scale, generate
+
+
+def rebuilt_lookup(session: Session, index: int):
+    # What the handlers did before, a new statement for every request
+    return session.scalar(select(Team).where(Team.id == index))
+
+
+def cached_lookup(session: Session, index: int):
+    return session.scalar(lookup(Team), {"id": index})
+
+
+def rebuilt_get(session: Session, index: int):
+    paths: dict = parse_expand(Match, "home_team,away_team")
+    statement = build_select.__wrapped__(Match, freeze(paths), ())
+    return fetch_one(session, statement.where(Match.id == index))
+
+
+def cached_get(session: Session, index: int):
+    paths: dict = parse_expand(Match, "home_team,away_team")
+    return fetch_one(session, select_by_id(Match, paths), {"id": index})
+
+
+def rebuilt_list(session: Session, index: int):
+    statement = build_select.__wrapped__(Player, (), ())
+    return fetch(session, statement.where(Player.current_team_id == index))
+
+
+def cached_list(session: Session, index: int):
+    return fetch(
+        session,
+        select_records(Player, {}).where(Player.current_team_id == index),
+    )
+
+
+SCENARIOS: dict[str, tuple] = {
+    "team by id": (rebuilt_lookup, cached_lookup),
+    "match by id, expanded": (rebuilt_get, cached_get),
+    "players of a team": (rebuilt_list, cached_list),
+}
+
+
+def measure(engine: Engine, query, bound: int, repeat: int) -> float:
+    # Python CPU time per execution, the in-memory database adds no I/O
+    with Session(engine) as session:
+        for index in range(1, min(bound, 50) + 1):
+            query(session, index)
+        session.expunge_all()
+        started: float = process_time()
+        for index in range(repeat):
+            query(session, index % bound + 1)
+        return (process_time() - started) / repeat * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare rebuilt and cached statements on hot paths"
+    )
+    parser.add_argument("--size", choices=list(SCALES), default="small")
+    parser.add_argument("--repeat", type=int, default=5_000)
+    args = parser.parse_args()
+
+    scale: Scale = SCALES[args.size]
+    engine: Engine = create_engine("sqlite://", poolclass=StaticPool)
+    table_registry.metadata.create_all(engine)
+    with engine.begin() as connection:
+        generate(connection, scale)
+
+    print(
+        f"{'scenario':<24} {'rebuilt (us)':>13} {'cached (us)':>12} "
+        f"{'saved':>7}"
+    )
+    for name, (rebuilt, cached) in SCENARIOS.items():
+        before: float = measure(engine, rebuilt, scale.teams, args.repeat)
+        after: float = measure(engine, cached, scale.teams, args.repeat)
+        print(
+            f"{name:<24} {before:>13.1f} {after:>12.1f} "
+            f"{1 - after / before:>7.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
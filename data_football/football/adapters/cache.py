@@ -0,0 +1,544 @@
+import fcntl
+import hashlib
+import logging
+import mmap
+import os
+import re
+import socket
+import struct
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from time import monotonic, time
+from typing import NamedTuple, Optional
+from urllib.parse import unquote, urlsplit
+
+from football.metrics import CACHE_ERRORS, CACHE_REQUESTS
+from football.settings import Settings
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Cached namespaces depending on each table. Keyed namespaces drop the
+# entries of the changed ids, the others are cleared whole.
+DEPENDENCIES: dict[str, tuple[tuple[str, bool], ...]] = {
+    "teams": (("teams", True), ("standings", False)),
+    "championships": (("championships", True), ("standings", True)),
+    "rounds": (("standings", False),),
+    "matches": (("standings", False),),
+}
+
+
+# When each revalidated namespace last changed, under this namespace
+CHANGED: str = "changed"
+# Revalidated entries start with the time their computation started
+STAMP: struct.Struct = struct.Struct("<d")
+
+
+class CacheError(Exception): ...
+
+
+class Revalidated(NamedTuple):
+    body: bytes
+    # Seconds since it was computed
+    age: float
+    # Computed before the last change, a recompute is due
+    stale: bool
+
+
+class MemoryCache:
+    # Least recently used entries of this process
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self.entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self.lock: threading.Lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self.lock:
+            entry: Optional[tuple[float, bytes]] = self.entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: bytes, ttl: float):
+        with self.lock:
+            self.entries[key] = (monotonic() + ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def delete(self, *keys: str):
+        with self.lock:
+            for key in keys:
+                self.entries.pop(key, None)
+
+    def delete_prefix(self, prefix: str):
+        with self.lock:
+            for key in [key for key in self.entries if key.startswith(prefix)]:
+                del self.entries[key]
+
+
+class SharedMemoryCache:
+    # Fixed size slots in a memory mapped file, normally under /dev/shm,
+    # shared by every worker on the host. A key maps to a set of WAYS
+    # slots; writers hold a file lock, readers retry on a changed sequence.
+    MAGIC: bytes = b"FBC1"
+    HEADER: struct.Struct = struct.Struct("<4sII")
+    # sequence, key hash, expires at, key length, value length
+    SLOT: struct.Struct = struct.Struct("<QQdII")
+    WAYS: int = 4
+    # A slot still odd after this many reads was left by a dead writer
+    READ_ATTEMPTS: int = 100
+
+    def __init__(self, path: str, slots: int = 4096, slot_size: int = 8192):
+        self.slots = slots - slots % self.WAYS
+        self.slot_size = slot_size
+        self.capacity: int = slot_size - self.SLOT.size
+        self.lock: threading.Lock = threading.Lock()
+        self.fd: int = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        size: int = mmap.PAGESIZE + self.slots * slot_size
+        # POSIX record locks belong to the process, forked workers do not
+        # share the lock the way they would with flock
+        fcntl.lockf(self.fd, fcntl.LOCK_EX)
+        try:
+            header: bytes = os.pread(self.fd, self.HEADER.size, 0)
+            expected: bytes = self.HEADER.pack(
+                self.MAGIC, self.slots, slot_size
+            )
+            if header != expected or os.fstat(self.fd).st_size != size:
+                # New file or another layout, start empty
+                os.ftruncate(self.fd, 0)
+                os.ftruncate(self.fd, size)
+                os.pwrite(self.fd, expected, 0)
+        finally:
+            fcntl.lockf(self.fd, fcntl.LOCK_UN)
+        self.memory: mmap.mmap = mmap.mmap(self.fd, size)
+
+    @staticmethod
+    def digest(key: bytes) -> int:
+        return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest())
+
+    def offsets(self, digest: int) -> range:
+        first: int = digest % (self.slots // self.WAYS) * self.WAYS
+        return range(
+            mmap.PAGESIZE + first * self.slot_size,
+            mmap.PAGESIZE + (first + self.WAYS) * self.slot_size,
+            self.slot_size,
+        )
+
+    def read(self, offset: int) -> tuple:
+        # A consistent copy of the slot, retried while a writer is busy. A
+        # worker killed mid-write leaves it odd for good, that slot reads
+        # as empty until the next write takes it over.
+        for _ in range(self.READ_ATTEMPTS):
+            sequence, digest, expires, key_length, value_length = (
+                self.SLOT.unpack_from(self.memory, offset)
+            )
+            start: int = offset + self.SLOT.size
+            payload: bytes = self.memory[
+                start : start + min(key_length + value_length, self.capacity)
+            ]
+            if sequence % 2 == 0 and (
+                self.SLOT.unpack_from(self.memory, offset)[0] == sequence
+            ):
+                return (
+                    digest,
+                    expires,
+                    payload[:key_length],
+                    payload[key_length:],
+                )
+        return 0, 0.0, b"", b""
+
+    def write(  # noqa: PLR0913, PLR0917
+        self,
+        offset: int,
+        digest: int,
+        expires: float,
+        key: bytes,
+        value: bytes,
+    ):
+        # Odd while writing, readers of the slot retry until it is even.
+        # Writers hold the lock, an odd slot here was abandoned.
+        sequence: int = self.SLOT.unpack_from(self.memory, offset)[0] | 1
+        self.SLOT.pack_into(self.memory, offset, sequence, 0, 0, 0, 0)
+        start: int = offset + self.SLOT.size
+        self.memory[start : start + len(key) + len(value)] = key + value
+        self.SLOT.pack_into(
+            self.memory,
+            offset,
+            sequence + 1,
+            digest,
+            expires,
+            len(key),
+            len(value),
+        )
+
+    def locked(self):
+        return FileLock(self.lock, self.fd)
+
+    def get(self, key: str) -> Optional[bytes]:
+        encoded: bytes = key.encode()
+        digest: int = self.digest(encoded)
+        for offset in self.offsets(digest):
+            found, expires, stored, value = self.read(offset)
+            if found == digest and stored == encoded:
+                return value if expires > time() else None
+        return None
+
+    def set(self, key: str, value: bytes, ttl: float):
+        encoded: bytes = key.encode()
+        if len(encoded) + len(value) > self.capacity:
+            return
+        digest: int = self.digest(encoded)
+        now: float = time()
+        with self.locked():
+            # The same key, else a free or expired slot, else the one
+            # closest to expiring
+            victim: Optional[int] = None
+            earliest: float = float("inf")
+            for offset in self.offsets(digest):
+                found, expires, stored, _ = self.read(offset)
+                if found == digest and stored == encoded:
+                    victim = offset
+                    break
+                if expires < earliest:
+                    victim, earliest = offset, expires
+            self.write(victim, digest, now + ttl, encoded, value)
+
+    def delete(self, *keys: str):
+        with self.locked():
+            for key in keys:
+                encoded: bytes = key.encode()
+                digest: int = self.digest(encoded)
+                for offset in self.offsets(digest):
+                    found, _, stored, _ = self.read(offset)
+                    if found == digest and stored == encoded:
+                        self.write(offset, 0, 0.0, b"", b"")
+
+    def delete_prefix(self, prefix: str):
+        encoded: bytes = prefix.encode()
+        with self.locked():
+            for offset in range(
+                mmap.PAGESIZE,
+                mmap.PAGESIZE + self.slots * self.slot_size,
+                self.slot_size,
+            ):
+                found, _, stored, _ = self.read(offset)
+                if found and stored.startswith(encoded):
+                    self.write(offset, 0, 0.0, b"", b"")
+
+
+class FileLock:
+    # The thread lock orders this process' writers, the record lock the
+    # other processes
+    def __init__(self, lock: threading.Lock, fd: int):
+        self.lock = lock
+        self.fd = fd
+
+    def __enter__(self):
+        self.lock.acquire()
+        fcntl.lockf(self.fd, fcntl.LOCK_EX)
+
+    def __exit__(self, *args):
+        fcntl.lockf(self.fd, fcntl.LOCK_UN)
+        self.lock.release()
+
+
+def encode_command(*arguments) -> bytes:
+    parts: list[bytes] = [b"*%d\r\n" % len(arguments)]
+    for argument in arguments:
+        data: bytes = (
+            argument if isinstance(argument, bytes) else str(argument).encode()
+        )
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+class RedisConnection:
+    def __init__(self, host: str, port: int, timeout: float):
+        self.socket: socket.socket = socket.create_connection(
+            (host, port), timeout=timeout
+        )
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.reader = self.socket.makefile("rb")
+
+    def execute(self, *arguments) -> object:
+        self.socket.sendall(encode_command(*arguments))
+        return self.reply()
+
+    def reply(self) -> object:
+        line: bytes = self.reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Connection closed by the cache server")
+        kind, value = line[:1], line[1:-2]
+        if kind == b"+":
+            return value.decode()
+        if kind == b"-":
+            raise CacheError(value.decode())
+        if kind == b":":
+            return int(value)
+        if kind == b"$":
+            if int(value) < 0:
+                return None
+            data: bytes = self.reader.read(int(value) + 2)
+            return data[:-2]
+        if kind == b"*":
+            if int(value) < 0:
+                return None
+            return [self.reply() for _ in range(int(value))]
+        raise CacheError(f"Unexpected reply {line!r}")
+
+    def close(self):
+        self.reader.close()
+        self.socket.close()
+
+
+class RedisCache:
+    # Speaks the Redis protocol (RESP) with a small pool of connections,
+    # any Redis compatible server works
+    def __init__(self, url: str, timeout: float = 0.25, pool_size: int = 8):
+        parts = urlsplit(url)
+        self.host: str = parts.hostname or "localhost"
+        self.port: int = parts.port or 6379
+        self.password: Optional[str] = (
+            unquote(parts.password) if parts.password else None
+        )
+        self.database: int = int(parts.path.strip("/") or 0)
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.idle: list[RedisConnection] = []
+        self.lock: threading.Lock = threading.Lock()
+
+    def connect(self) -> RedisConnection:
+        connection = RedisConnection(self.host, self.port, self.timeout)
+        try:
+            if self.password:
+                connection.execute("AUTH", self.password)
+            if self.database:
+                connection.execute("SELECT", self.database)
+        except Exception:
+            connection.close()
+            raise
+        return connection
+
+    def execute(self, *arguments) -> object:
+        with self.lock:
+            connection: Optional[RedisConnection] = (
+                self.idle.pop() if self.idle else None
+            )
+        if connection is None:
+            connection = self.connect()
+        try:
+            reply: object = connection.execute(*arguments)
+        except (OSError, ConnectionError):
+            connection.close()
+            raise
+        with self.lock:
+            if len(self.idle) < self.pool_size:
+                self.idle.append(connection)
+                return reply
+        connection.close()
+        return reply
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.execute("GET", key)
+
+    def set(self, key: str, value: bytes, ttl: float):
+        self.execute("SET", key, value, "PX", max(int(ttl * 1000), 1))
+
+    def delete(self, *keys: str):
+        if keys:
+            self.execute("DEL", *keys)
+
+    def delete_prefix(self, prefix: str):
+        pattern: str = re.sub(r"([*?\[\]\\])", r"\\\1", prefix) + "*"
+        cursor: bytes = b"0"
+        while True:
+            cursor, keys = self.execute(
+                "SCAN", cursor, "MATCH", pattern, "COUNT", 500
+            )
+            self.delete(*(key.decode() for key in keys))
+            if cursor == b"0":
+                return
+
+
+class Cache:
+    # Namespaced keys and TTLs over a backend, None turns caching off. A
+    # failing backend is skipped for a while and every lookup misses,
+    # requests never fail because of the cache
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        backend,
+        prefix: str = "football",
+        ttl: float = 60.0,
+        ttls: Optional[dict[str, float]] = None,
+        retry_after: float = 5.0,
+        stale: Optional[dict[str, float]] = None,
+    ):
+        self.backend = backend
+        self.prefix = prefix
+        self.ttl = ttl
+        self.ttls: dict[str, float] = ttls or {}
+        self.retry_after = retry_after
+        # Namespaces served stale while they are recomputed, with the
+        # longest a changed entry may still be served
+        self.stale: dict[str, float] = stale or {}
+        self.down_until: float = 0.0
+        # Keys this worker recomputes, until when the claim holds
+        self.refreshing: dict[str, float] = {}
+        self.lock: threading.Lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    def key(self, namespace: str, *parts: object) -> str:
+        return ":".join((self.prefix, namespace, *map(str, parts)))
+
+    def call(self, operation: str, *arguments) -> object:
+        if not self.enabled or self.down_until > monotonic():
+            return None
+        try:
+            return getattr(self.backend, operation)(*arguments)
+        except (OSError, ConnectionError, CacheError):
+            CACHE_ERRORS.inc(operation)
+            logger.warning("Cache %s failed, bypassing it", operation)
+            self.down_until = monotonic() + self.retry_after
+            return None
+
+    def get(self, namespace: str, *parts: object) -> Optional[bytes]:
+        if not self.enabled:
+            return None
+        value: Optional[bytes] = self.call("get", self.key(namespace, *parts))
+        CACHE_REQUESTS.inc(namespace, "hit" if value is not None else "miss")
+        return value
+
+    def get_revalidated(
+        self, namespace: str, *parts: object
+    ) -> Optional[Revalidated]:
+        # Entries are stamped with the moment their computation started,
+        # a change after it makes them stale rather than evicting them
+        if not self.enabled:
+            return None
+        entry: Optional[bytes] = self.call("get", self.key(namespace, *parts))
+        changed: Optional[bytes] = (
+            self.call("get", self.key(CHANGED, namespace))
+            if entry is not None
+            else None
+        )
+        now: float = time()
+        result: Optional[Revalidated] = None
+        if entry is not None:
+            (computed,) = STAMP.unpack_from(entry)
+            changed_at: float = float(changed) if changed else 0.0
+            if computed >= changed_at:
+                result = Revalidated(
+                    entry[STAMP.size :], now - computed, False
+                )
+            elif now - changed_at <= self.stale.get(namespace, 0.0):
+                result = Revalidated(entry[STAMP.size :], now - computed, True)
+        CACHE_REQUESTS.inc(
+            namespace,
+            "miss" if result is None else "stale" if result.stale else "hit",
+        )
+        return result
+
+    def set_revalidated(
+        self, namespace: str, *parts: object, value: bytes, computed: float
+    ):
+        self.set(namespace, *parts, value=STAMP.pack(computed) + value)
+
+    def refresher(
+        self, namespace: str, *parts: object, compute: Callable[[], bytes]
+    ) -> Optional[Callable[[], None]]:
+        # A job recomputing the entry, None when this worker already runs
+        # one for it. The claim lapses after the namespace's staleness
+        # limit, a job that never ran (e.g. the response failed to send)
+        # does not block the entry for good.
+        key: str = self.key(namespace, *parts)
+        now: float = monotonic()
+        with self.lock:
+            if self.refreshing.get(key, 0.0) > now:
+                return None
+            self.refreshing[key] = now + self.stale.get(namespace, 0.0)
+
+        def refresh():
+            try:
+                started: float = time()
+                self.set_revalidated(
+                    namespace, *parts, value=compute(), computed=started
+                )
+            except Exception:
+                logger.exception("Refreshing %s failed", key)
+            finally:
+                with self.lock:
+                    self.refreshing.pop(key, None)
+
+        return refresh
+
+    def set(
+        self,
+        namespace: str,
+        *parts: object,
+        value: bytes,
+        ttl: Optional[float] = None,
+    ):
+        ttl = ttl or self.ttls.get(namespace, self.ttl)
+        self.call("set", self.key(namespace, *parts), value, ttl)
+
+    def delete(self, namespace: str, *parts: object):
+        self.call("delete", self.key(namespace, *parts))
+
+    def clear(self, namespace: str):
+        self.call("delete_prefix", self.key(namespace) + ":")
+
+    def invalidate(self, table: str, ids: Optional[Iterable[object]]):
+        # None when the changed rows are unknown, every entry goes
+        ids = None if ids is None else list(ids)
+        for namespace, keyed in DEPENDENCIES.get(table, ()):
+            if keyed and ids is not None:
+                self.call(
+                    "delete", *(self.key(namespace, value) for value in ids)
+                )
+            elif namespace in self.stale:
+                self.set(
+                    CHANGED,
+                    namespace,
+                    value=repr(time()).encode(),
+                    ttl=self.ttls.get(namespace, self.ttl),
+                )
+            else:
+                self.clear(namespace)
+
+
+def build_cache(settings: Settings) -> Cache:
+    backends: dict = {
+        "": lambda: None,
+        "memory": lambda: MemoryCache(settings.CACHE_MEMORY_ENTRIES),
+        "shared": lambda: SharedMemoryCache(
+            settings.CACHE_SHARED_PATH,
+            settings.CACHE_SHARED_SLOTS,
+            settings.CACHE_SHARED_SLOT_SIZE,
+        ),
+        "redis": lambda: RedisCache(settings.CACHE_URL),
+    }
+    return Cache(
+        backends[settings.CACHE_BACKEND](),
+        prefix=settings.CACHE_PREFIX,
+        ttl=settings.CACHE_TTL,
+        ttls=settings.CACHE_NAMESPACE_TTLS,
+        stale=settings.CACHE_STALE_WHILE_REVALIDATE,
+    )
+
+
+# Off until the lifespan configures it, modules import this object
+cache: Cache = Cache(None)
+
+
+def configure_cache(settings: Settings):
+    configured: Cache = build_cache(settings)
+    for name in ("backend", "prefix", "ttl", "ttls", "stale"):
+        setattr(cache, name, getattr(configured, name))
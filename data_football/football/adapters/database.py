@@ -1,11 +1,425 @@
-from sqlalchemy import create_engine
+import inspect
+import logging
+import os
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache, wraps
+from itertools import count
+from time import monotonic, perf_counter
+from typing import Optional
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy import Engine, create_engine, event, make_url, text
+from sqlalchemy.engine import URL
+from sqlalchemy.exc import DBAPIError, OperationalError
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import Pool, QueuePool
+from starlette.concurrency import run_in_threadpool
+
+from football.metrics import (
+    POOL_CHECKED_IN,
+    POOL_CHECKED_OUT,
+    POOL_CHECKOUTS,
+    POOL_CONNECTIONS,
+    POOL_INVALIDATIONS,
+    POOL_OVERFLOW,
+    POOL_SIZE,
+    POOL_WAIT,
+    REPLICAS_HEALTHY,
+    registry,
+)
+from football.settings import Settings, get_settings
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+READ_PRIMARY_COOKIE: str = "read_primary"
+READ_PRIMARY_HEADER: str = "X-Read-Primary"
+SAFE_METHODS: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class QueryStats:
+    def __init__(
+        self, scope: Optional[dict] = None, track_statements: bool = False
+    ):
+        self.scope: dict = scope or {}
+        self.count: int = 0
+        self.duration: float = 0.0
+        # Distinct parameters per statement for N+1 detection, repr() on
+        # every statement is not free, only kept when asked for
+        self.statements: Optional[dict[str, set[str]]] = (
+            {} if track_statements else None
+        )
+        # Every statement with its duration, only kept when asked for
+        self.timings: Optional[list[tuple[str, float]]] = None
+
+    def record(self, statement: str, parameters: object, duration: float):
+        self.count += 1
+        self.duration += duration
+        if self.statements is not None:
+            self.statements.setdefault(statement, set()).add(repr(parameters))
+        if self.timings is not None:
+            self.timings.append((statement, duration))
+
+    @property
+    def route(self) -> str:
+        path: str = getattr(self.scope.get("route"), "path", "unmatched")
+        return f"{self.scope.get('method', '')} {path}".strip()
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        # The same statement run again and again with new parameters is
+        # the signature of a lazy load inside a loop (N+1)
+        return {
+            statement: len(parameters)
+            for statement, parameters in (self.statements or {}).items()
+            if len(parameters) >= threshold
+        }
+
+
+# Set per request by the metrics middleware, None outside of a request
+query_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "query_stats", default=None
+)
+
+
+def metered(pool_class: type[Pool]) -> type[Pool]:
+    class MeteredPool(pool_class):
+        def connect(self):
+            started: float = perf_counter()
+            try:
+                return super().connect()
+            finally:
+                POOL_WAIT.observe(value=perf_counter() - started)
+
+    MeteredPool.__name__ = f"Metered{pool_class.__name__}"
+    return MeteredPool
+
+
+def engine_options(settings: Settings) -> dict:
+    return {
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+        "prepare_threshold": settings.DATABASE_PREPARE_THRESHOLD,
+    }
+
+
+def build_engine(
+    database_url: str, prepare_threshold: int = None, **options
+) -> Engine:
+    url: URL = make_url(database_url)
+    if url.get_driver_name() == "psycopg" and prepare_threshold is not None:
+        # Hot statements share their SQL text across requests, so they are
+        # parsed and planned once per connection instead of every time
+        options["connect_args"] = {
+            "prepare_threshold": (
+                None if prepare_threshold < 0 else prepare_threshold
+            )
+        }
+    pool_class: type[Pool] = url.get_dialect().get_pool_class(url)
+    if not issubclass(pool_class, QueuePool):
+        # Single connection pools reject the queue sizing arguments
+        for name in ("pool_size", "max_overflow", "pool_timeout"):
+            options.pop(name, None)
+    return create_engine(url, poolclass=metered(pool_class), **options)
+
+
+def warm_pool(engine: Engine) -> int:
+    # Open the whole pool up front instead of on the first requests,
+    # every connection is held at once so none is reused
+    pool: Pool = engine.pool
+    missing: int = (
+        pool.size() - pool.checkedin() if isinstance(pool, QueuePool) else 1
+    )
+    connections: list = []
+    try:
+        for _ in range(missing):
+            connections.append(engine.connect())
+    finally:
+        for connection in connections:
+            connection.close()
+    return len(connections)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def before_cursor_execute(  # noqa: PLR0913, PLR0917
+    connection, cursor, statement, parameters, context, executemany
+):
+    if query_stats.get() is not None:
+        connection.info.setdefault("query_started", []).append(perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def after_cursor_execute(  # noqa: PLR0913, PLR0917
+    connection, cursor, statement, parameters, context, executemany
+):
+    stats: Optional[QueryStats] = query_stats.get()
+    started: list[float] = connection.info.get("query_started")
+    if stats is not None and started:
+        stats.record(statement, parameters, perf_counter() - started.pop())
+
+
+@contextmanager
+def count_queries(engine: Engine) -> Iterator[QueryStats]:
+    stats: QueryStats = QueryStats(track_statements=True)
+
+    def before(connection, cursor, statement, *args):
+        connection.info.setdefault("count_started", []).append(perf_counter())
+
+    def after(connection, cursor, statement, parameters, *args):
+        started: float = connection.info["count_started"].pop()
+        stats.record(statement, parameters, perf_counter() - started)
+
+    event.listen(engine, "before_cursor_execute", before)
+    event.listen(engine, "after_cursor_execute", after)
+    try:
+        yield stats
+    finally:
+        event.remove(engine, "before_cursor_execute", before)
+        event.remove(engine, "after_cursor_execute", after)
+
+
+@event.listens_for(Pool, "checkout")
+def checkout(dbapi_connection, connection_record, connection_proxy):
+    POOL_CHECKOUTS.inc()
+
+
+@event.listens_for(Pool, "connect")
+def connect(dbapi_connection, connection_record):
+    POOL_CONNECTIONS.inc()
+
+
+@event.listens_for(Pool, "invalidate")
+def invalidate(dbapi_connection, connection_record, exception):
+    POOL_INVALIDATIONS.inc()
+
+
+class ReplicaRouter:
+    def __init__(
+        self,
+        primary: Engine,
+        replicas: list[Engine],
+        retry_after: float = 5.0,
+    ):
+        self.primary = primary
+        self.replicas = replicas
+        self.retry_after = retry_after
+        self.turn = count()
+        # Replica index to the moment it may be probed again
+        self.down: dict[int, float] = {}
+        for replica in replicas:
+            event.listen(replica, "handle_error", self.failed)
+
+    def engine(self, primary: bool = False) -> Engine:
+        if primary or not self.replicas:
+            return self.primary
+        for _ in range(len(self.replicas)):
+            index: int = next(self.turn) % len(self.replicas)
+            if self.available(index):
+                return self.replicas[index]
+        return self.primary
+
+    def available(self, index: int) -> bool:
+        retry_at: Optional[float] = self.down.get(index)
+        if retry_at is None:
+            return True
+        if monotonic() < retry_at:
+            return False
+        # Probe in the background, sessions are opened on the event loop
+        # and must not wait on a replica that may still be unreachable
+        self.down[index] = monotonic() + self.retry_after
+        threading.Thread(
+            target=self.recover,
+            args=(index,),
+            name="football-replica-probe",
+            daemon=True,
+        ).start()
+        return False
+
+    def recover(self, index: int):
+        if self.probe(self.replicas[index]):
+            logger.info("Replica %s is back", index)
+            self.down.pop(index, None)
+
+    @staticmethod
+    def probe(replica: Engine) -> bool:
+        try:
+            with replica.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        except DBAPIError:
+            return False
+        return True
+
+    def mark_down(self, replica: Engine):
+        index: int = self.replicas.index(replica)
+        if index not in self.down:
+            logger.warning("Replica %s is down, reading elsewhere", index)
+        self.down[index] = monotonic() + self.retry_after
+
+    def failed(self, context):
+        # Only connection failures, a bad statement says nothing about
+        # the health of the replica
+        if context.is_disconnect or isinstance(
+            context.sqlalchemy_exception, OperationalError
+        ):
+            self.mark_down(context.engine)
+
+    def named(self) -> dict[str, Engine]:
+        # Metric labels, replicas by their index like in the logs
+        return {
+            "primary": self.primary,
+            **{
+                f"replica{index}": replica
+                for index, replica in enumerate(self.replicas)
+            },
+        }
+
+    def warm(self):
+        for replica in self.replicas:
+            try:
+                warm_pool(replica)
+            except DBAPIError:
+                self.mark_down(replica)
+
+
+@lru_cache(maxsize=1)
+def databases() -> ReplicaRouter:
+    # Built on first use, importing the app loads no database driver. The
+    # primary engine is databases().primary.
+    settings: Settings = get_settings()
+    if not settings.DATABASE_URL:
+        raise ValueError("DATABASE_URL is not set")
+    return ReplicaRouter(
+        build_engine(settings.DATABASE_URL, **engine_options(settings)),
+        [
+            build_engine(url, **engine_options(settings))
+            for url in settings.DATABASE_REPLICA_URLS
+        ],
+        retry_after=settings.DATABASE_REPLICA_RETRY,
+    )
+
+
+def reset_after_fork():
+    # Pooled connections belong to the process that opened them, a forked
+    # worker starts with empty pools instead of sharing the sockets
+    if databases.cache_info().currsize:
+        router: ReplicaRouter = databases()
+        for pooled in (router.primary, *router.replicas):
+            pooled.dispose(close=False)
+
+
+os.register_at_fork(after_in_child=reset_after_fork)
+
+
+@registry.collector
+def collect_pool():
+    if not databases.cache_info().currsize:
+        return
+    router: ReplicaRouter = databases()
+    for name, engine in router.named().items():
+        pool: Pool = engine.pool
+        if isinstance(pool, QueuePool):
+            POOL_SIZE.set(name, value=pool.size())
+            POOL_CHECKED_OUT.set(name, value=pool.checkedout())
+            POOL_CHECKED_IN.set(name, value=pool.checkedin())
+            POOL_OVERFLOW.set(name, value=max(pool.overflow(), 0))
+    REPLICAS_HEALTHY.set(value=len(router.replicas) - len(router.down))
+
+
+def release(session: Session):
+    # Ends the transaction of a clean session so its connection goes back
+    # to the pool, nothing is expired and loaded objects stay usable
+    if session.in_transaction() and not (
+        session.new or session.dirty or session.deleted
+    ):
+        session.commit()
+
+
+async def close(session: Session):
+    # Closing only does I/O when a transaction is still open
+    if session.in_transaction():
+        await run_in_threadpool(session.close)
+    else:
+        session.close()
+
+
+def released(arguments: dict) -> list[Session]:
+    return [
+        value
+        for value in arguments.values()
+        if isinstance(value, Session) and value.info.get("release")
+    ]
+
+
+def releasing(endpoint: Callable) -> Callable:
+    if inspect.iscoroutinefunction(endpoint):
+        # Runs on the event loop, the commit goes to the threadpool
+        @wraps(endpoint)
+        async def coroutine_wrapper(*args, **kwargs):
+            response = await endpoint(*args, **kwargs)
+            for session in released(kwargs):
+                await run_in_threadpool(release, session)
+            return response
+
+        return coroutine_wrapper
+
+    @wraps(endpoint)
+    def wrapper(*args, **kwargs):
+        response = endpoint(*args, **kwargs)
+        for session in released(kwargs):
+            release(session)
+        return response
+
+    return wrapper
+
+
+class SessionRoute(APIRoute):
+    # Hands the connection back when the handler returns, before the
+    # response is validated, serialized and sent
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        super().__init__(path, releasing(endpoint), **kwargs)
+
+
+# Async so no threadpool round trip is spent before the handler, a Session
+# only checks a connection out on its first statement
+async def get_session(request: Request, response: Response):
+    if request.method not in SAFE_METHODS:
+        # Replicas lag behind, keep this client's reads on the primary
+        response.set_cookie(
+            READ_PRIMARY_COOKIE,
+            "1",
+            max_age=get_settings().READ_YOUR_WRITES_SECONDS,
+            httponly=True,
+            samesite="lax",
+        )
+    session: Session = Session(
+        databases().primary, expire_on_commit=False, info={"release": True}
+    )
+    try:
+        yield session
+    finally:
+        await close(session)
 
-from football.settings import Settings
 
-engine = create_engine(Settings().DATABASE_URL)
+def reads_primary(request: Request) -> bool:
+    # Clients that just wrote, or asked for it
+    return (
+        READ_PRIMARY_COOKIE in request.cookies
+        or READ_PRIMARY_HEADER in request.headers
+    )
 
 
-def get_session():
-    with Session(engine) as session:
+async def get_read_session(request: Request):
+    session: Session = Session(
+        databases().engine(reads_primary(request)),
+        expire_on_commit=False,
+        info={"release": True},
+    )
+    try:
         yield session
+    finally:
+        await close(session)
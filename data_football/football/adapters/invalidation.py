@@ -0,0 +1,259 @@
+import json
+import logging
+import threading
+from collections.abc import Callable
+from functools import lru_cache
+from time import time
+from typing import Optional
+from uuid import uuid4
+
+from sqlalchemy import Engine, event, func, inspect, make_url, select
+from sqlalchemy.engine import URL
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from football.adapters.cache import DEPENDENCIES, cache
+from football.adapters.database import databases
+from football.metrics import (
+    CACHE_ERRORS,
+    CACHE_INVALIDATION_LAG,
+    CACHE_INVALIDATIONS,
+)
+from football.settings import Settings, get_settings
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Changed ids per table, None when the rows are unknown
+Changes = dict[str, Optional[set]]
+
+PENDING: str = "cache_changes"
+# Postgres rejects payloads from 8000 bytes on, larger change sets only
+# name their tables
+MAX_PAYLOAD: int = 7900
+
+
+class MemoryBus:
+    # Delivers to the subscribers of this process only, enough for SQLite,
+    # a single worker and the tests
+    def __init__(self):
+        self.subscribers: list[Callable[[Changes], None]] = []
+
+    def subscribe(self, callback: Callable[[Changes], None]):
+        self.subscribers.append(callback)
+
+    def deliver(self, changes: Changes):
+        for callback in self.subscribers:
+            try:
+                callback(changes)
+            except Exception:
+                logger.exception("Cache invalidation failed")
+
+    def announce(self, session: Session, changes: Changes): ...
+
+    def publish(self, changes: Changes):
+        CACHE_INVALIDATIONS.inc("local")
+        self.deliver(changes)
+
+    def start(self): ...
+
+    def stop(self): ...
+
+
+class PostgresBus(MemoryBus):
+    # NOTIFYs the other workers with the commit, then evicts locally once
+    # it went through. Each one LISTENs on a connection of its own, outside
+    # the pool.
+    def __init__(
+        self,
+        engine: Callable[[], Engine],
+        channel: str,
+        reconnect_after: float = 1.0,
+    ):
+        super().__init__()
+        self.engine = engine
+        self.channel = channel
+        self.reconnect_after = reconnect_after
+        # Set per worker on start, a worker skips its own notifications
+        self.origin: Optional[str] = None
+        self.stopping: threading.Event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    def encode(self, changes: Changes) -> str:
+        message: dict = {
+            "origin": self.origin,
+            "sent": time(),
+            "tables": {
+                table: None if ids is None else sorted(ids)
+                for table, ids in changes.items()
+            },
+        }
+        payload: str = json.dumps(message, separators=(",", ":"))
+        if len(payload.encode()) > MAX_PAYLOAD:
+            message["tables"] = dict.fromkeys(changes)
+            payload = json.dumps(message, separators=(",", ":"))
+        return payload
+
+    def announce(self, session: Session, changes: Changes):
+        # On the committing connection, no second one is checked out, and
+        # Postgres only delivers it if the transaction commits
+        try:
+            session.execute(
+                select(func.pg_notify(self.channel, self.encode(changes)))
+            )
+        except SQLAlchemyError:
+            CACHE_ERRORS.inc("publish")
+            # Raised, a commit the other workers never hear of would leave
+            # them serving the old rows
+            logger.warning("Cache invalidation not published")
+            raise
+
+    def receive(self, payload: str):
+        try:
+            message: dict = json.loads(payload)
+            origin: Optional[str] = message["origin"]
+            sent: float = float(message["sent"])
+            changes: Changes = {
+                table: None if ids is None else set(ids)
+                for table, ids in message["tables"].items()
+            }
+        except (ValueError, TypeError, KeyError, AttributeError):
+            # Not ours or garbled, whatever it said is lost, the listener
+            # must keep running
+            CACHE_ERRORS.inc("receive")
+            logger.warning("Malformed cache invalidation, evicting everything")
+            self.deliver(dict.fromkeys(DEPENDENCIES))
+            return
+        if origin == self.origin:
+            return
+        CACHE_INVALIDATIONS.inc("remote")
+        CACHE_INVALIDATION_LAG.observe(value=max(time() - sent, 0))
+        self.deliver(changes)
+
+    def connect(self):
+        engine: Engine = self.engine()
+        arguments, options = engine.dialect.create_connect_args(engine.url)
+        connection = engine.dialect.connect(*arguments, **options)
+        connection.autocommit = True
+        quoted: str = engine.dialect.identifier_preparer.quote(self.channel)
+        connection.execute(f"LISTEN {quoted}")
+        return connection
+
+    def listen(self):
+        errors: tuple = (OSError, self.engine().dialect.loaded_dbapi.Error)
+        reconnected: bool = False
+        while not self.stopping.is_set():
+            try:
+                with self.connect() as connection:
+                    if reconnected:
+                        # Whatever was sent while away is lost
+                        self.deliver(dict.fromkeys(DEPENDENCIES))
+                    while not self.stopping.is_set():
+                        for notify in connection.notifies(timeout=1.0):
+                            self.receive(notify.payload)
+            except errors:
+                CACHE_ERRORS.inc("listen")
+                logger.warning("Cache invalidation channel lost, reconnecting")
+                reconnected = True
+                self.stopping.wait(self.reconnect_after)
+
+    def start(self):
+        # Per worker, threads do not survive the fork
+        self.origin = uuid4().hex
+        self.stopping.clear()
+        self.thread = threading.Thread(
+            target=self.listen, name="football-cache-bus", daemon=True
+        )
+        self.thread.start()
+
+    def stop(self):
+        self.stopping.set()
+        if self.thread is not None:
+            self.thread.join(timeout=5)
+            self.thread = None
+
+
+def build_bus(settings: Settings) -> MemoryBus:
+    url: URL = make_url(settings.DATABASE_URL)
+    # Without a cache there is nothing to tell the other workers
+    if url.get_backend_name() != "postgresql" or not settings.CACHE_BACKEND:
+        return MemoryBus()
+    # A local bus would leave the other workers serving stale entries
+    if url.get_driver_name() != "psycopg":
+        raise ValueError(
+            "The cache needs the psycopg driver to LISTEN for "
+            f"invalidations, got {url.drivername}"
+        )
+    return PostgresBus(
+        lambda: databases().primary,
+        settings.CACHE_BUS_CHANNEL,
+        reconnect_after=settings.CACHE_BUS_RECONNECT,
+    )
+
+
+def evict(changes: Changes):
+    for table, ids in changes.items():
+        cache.invalidate(table, ids)
+
+
+@lru_cache(maxsize=1)
+def invalidation_bus() -> MemoryBus:
+    # Built on first use, like the engines
+    bus: MemoryBus = build_bus(get_settings())
+    bus.subscribe(evict)
+    return bus
+
+
+def pending(session: Session) -> Changes:
+    return session.info.setdefault(PENDING, {})
+
+
+@event.listens_for(Session, "after_flush")
+def collect(session: Session, flush_context):
+    # The lists still hold what was just written, with primary keys
+    if not cache.enabled:
+        return
+    changes: Changes = pending(session)
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        mapper = inspect(instance).mapper
+        table: str = mapper.local_table.name
+        if table in DEPENDENCIES and changes.get(table, set()) is not None:
+            changes.setdefault(table, set()).add(
+                mapper.primary_key_from_instance(instance)[0]
+            )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def collect_bulk(state: ORMExecuteState):
+    # Bulk statements do not say which rows they hit
+    if cache.enabled and (
+        state.is_insert or state.is_update or state.is_delete
+    ):
+        table: str = state.bind_mapper.local_table.name
+        if table in DEPENDENCIES:
+            pending(state.session)[table] = None
+
+
+@event.listens_for(Session, "before_commit")
+def announce(session: Session):
+    if session.get_nested_transaction() is None and cache.enabled:
+        # The commit flushes after this hook, collect its changes first
+        session.flush()
+        changes: Optional[Changes] = session.info.get(PENDING)
+        if changes:
+            invalidation_bus().announce(session, changes)
+
+
+@event.listens_for(Session, "after_commit")
+def publish(session: Session):
+    # Savepoints commit too, only the outermost commit is visible
+    if session.get_nested_transaction() is None:
+        changes: Optional[Changes] = session.info.pop(PENDING, None)
+        if changes:
+            invalidation_bus().publish(changes)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def discard(session: Session, transaction):
+    # Rolled back, nothing was changed
+    if transaction.parent is None:
+        session.info.pop(PENDING, None)
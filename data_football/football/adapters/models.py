@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import ForeignKey, func
+from sqlalchemy import ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, registry, relationship
 
 table_registry: registry = registry()
@@ -34,7 +34,7 @@ class Stadium:
     )
 
     # Reverses
-    matches: Mapped["Match"] = relationship(
+    matches: Mapped[list["Match"]] = relationship(
         init=False,
         back_populates="stadium",
         cascade="all, delete-orphan",
@@ -46,7 +46,7 @@ class Championship:
     __tablename__ = "championships"
 
     id: Mapped[int] = mapped_column(init=False, primary_key=True)
-    name: Mapped[str]
+    name: Mapped[str] = mapped_column(index=True)
     format: Mapped[str]
     context: Mapped[str]
     country: Mapped[str]
@@ -117,7 +117,7 @@ class Round:
 
     # Foreign Keys
     championship_id: Mapped[int] = mapped_column(
-        ForeignKey("championships.id")
+        ForeignKey("championships.id"), index=True
     )
 
     # Associations
@@ -127,7 +127,7 @@ class Round:
     )
 
     # Reverses
-    matches: Mapped["Match"] = relationship(
+    matches: Mapped[list["Match"]] = relationship(
         init=False,
         back_populates="round",
         cascade="all, delete-orphan",
@@ -154,16 +154,16 @@ class Match:
 
     # Foreign Keys
     stadium_id: Mapped[int] = mapped_column(
-        ForeignKey("stadiums.id"), nullable=False
+        ForeignKey("stadiums.id"), nullable=False, index=True
     )
     round_id: Mapped[int] = mapped_column(
-        ForeignKey("rounds.id"), nullable=False
+        ForeignKey("rounds.id"), nullable=False, index=True
     )
     home_team_id: Mapped[int] = mapped_column(
-        ForeignKey("teams.id"), nullable=False
+        ForeignKey("teams.id"), nullable=False, index=True
     )
     away_team_id: Mapped[int] = mapped_column(
-        ForeignKey("teams.id"), nullable=False
+        ForeignKey("teams.id"), nullable=False, index=True
     )
 
     # Associations
@@ -202,9 +202,13 @@ class Match:
 @table_registry.mapped_as_dataclass
 class Player:
     __tablename__ = "players"
+    __table_args__ = (
+        # Serves the team filter and its ordering by name without a sort
+        Index("ix_players_current_team_id_name", "current_team_id", "name"),
+    )
 
     id: Mapped[int] = mapped_column(init=False, primary_key=True)
-    name: Mapped[str]
+    name: Mapped[str] = mapped_column(index=True)
     full_name: Mapped[str]
     country: Mapped[str]
     birth_date: Mapped[Optional[str]]
@@ -241,14 +245,17 @@ class Goal:
     match_id: Mapped[int] = mapped_column(
         ForeignKey("matches.id"),
         nullable=False,
+        index=True,
     )
     team_id: Mapped[int] = mapped_column(
         ForeignKey("teams.id"),
         nullable=False,
+        index=True,
     )
     player_id: Mapped[int] = mapped_column(
         ForeignKey("players.id"),
         nullable=False,
+        index=True,
     )
 
     # Associations
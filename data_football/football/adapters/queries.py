@@ -0,0 +1,259 @@
+from functools import lru_cache
+from http import HTTPStatus
+
+from fastapi import HTTPException
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import RowMapping, Select, bindparam, inspect, select
+from sqlalchemy.orm import (
+    Session,
+    joinedload,
+    lazyload,
+    load_only,
+    selectinload,
+)
+
+from football.adapters.models import (
+    Championship,
+    Goal,
+    Match,
+    Player,
+    Round,
+    Stadium,
+    Team,
+)
+from football.domain.entities import (
+    ChampionshipModel,
+    GoalExpanded,
+    GoalModel,
+    MatchExpanded,
+    MatchModel,
+    PlayerExpanded,
+    PlayerModel,
+    RoundExpanded,
+    RoundModel,
+    StadiumModel,
+    TeamModel,
+    partial_schema,
+)
+
+MAX_EXPAND_DEPTH: int = 2
+MAX_IDS: int = 500
+
+SCHEMAS: dict[type, type[BaseModel]] = {
+    Championship: ChampionshipModel,
+    Goal: GoalModel,
+    Match: MatchModel,
+    Player: PlayerModel,
+    Round: RoundModel,
+    Stadium: StadiumModel,
+    Team: TeamModel,
+}
+
+# Relationships a model may expand are the ones its expanded schema exposes
+EXPANDED_SCHEMAS: dict[type, type[BaseModel]] = {
+    Goal: GoalExpanded,
+    Match: MatchExpanded,
+    Player: PlayerExpanded,
+    Round: RoundExpanded,
+}
+
+
+def parse_expand(
+    model: type, expand: str, max_depth: int = MAX_EXPAND_DEPTH
+) -> dict:
+    tree: dict = {}
+    for path in filter(None, (path.strip() for path in expand.split(","))):
+        keys: list[str] = path.split(".")
+        if len(keys) > max_depth:
+            raise HTTPException(
+                status_code=HTTPStatus.BAD_REQUEST,
+                detail=f"Expand path '{path}' exceeds depth {max_depth}",
+            )
+
+        node, current = tree, model
+        for key in keys:
+            fields: dict = getattr(
+                EXPANDED_SCHEMAS.get(current), "model_fields", {}
+            )
+            relationship = inspect(current).relationships.get(key)
+            if key not in fields or not relationship:
+                raise HTTPException(
+                    status_code=HTTPStatus.BAD_REQUEST,
+                    detail=f"Invalid expand path '{path}'",
+                )
+            node = node.setdefault(key, {})
+            current = relationship.mapper.class_
+    return tree
+
+
+def expand_options(model: type, tree: dict) -> list:
+    options: list = []
+    for relationship in inspect(model).relationships:
+        attribute = getattr(model, relationship.key)
+        if relationship.key not in tree:
+            # Eager "immediate" loads would cost one query per row
+            if relationship.lazy == "immediate":
+                options.append(lazyload(attribute))
+            continue
+
+        loader = selectinload if relationship.uselist else joinedload
+        option = loader(attribute)
+        nested: list = expand_options(
+            relationship.mapper.class_, tree[relationship.key]
+        )
+        if nested:
+            option = option.options(*nested)
+        options.append(option)
+    return options
+
+
+def dump(record: object, tree: dict, schema: type[BaseModel] = None) -> dict:
+    schema = schema or SCHEMAS[type(record)]
+    data: dict = schema.model_validate(record).model_dump()
+    for key, children in tree.items():
+        value = getattr(record, key)
+        if isinstance(value, list):
+            data[key] = [dump(item, children) for item in value]
+        elif value is not None:
+            data[key] = dump(value, children)
+        else:
+            data[key] = None
+    return data
+
+
+@lru_cache
+def list_adapter(schema: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[schema])
+
+
+def dump_all(records: list, tree: dict, schema: type[BaseModel]) -> list:
+    if not tree:
+        # Plain rows are validated in a single pass instead of row by row
+        return list_adapter(schema).validate_python(records)
+    return [dump(record, tree, schema) for record in records]
+
+
+def parse_ids(value: str, name: str = "ids") -> list[int]:
+    try:
+        ids: list[int] = list(
+            dict.fromkeys(int(item) for item in value.split(",") if item)
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail=f"Invalid value for '{name}'",
+        )
+    if len(ids) > MAX_IDS:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail=f"Too many values for '{name}' (max {MAX_IDS})",
+        )
+    return ids
+
+
+def ids_filter(column: object, value: str, name: str) -> list:
+    ids: list[int] = parse_ids(value, name)
+    return [column.in_(ids)] if ids else []
+
+
+def order_by_ids(records: list, ids: list[int]) -> tuple[list, list[int]]:
+    by_id: dict = {
+        record["id"] if isinstance(record, RowMapping) else record.id: record
+        for record in records
+    }
+    found: list = [by_id[key] for key in ids if key in by_id]
+    missing: list[int] = [key for key in ids if key not in by_id]
+    return found, missing
+
+
+def parse_fields(model: type, fields: str) -> tuple[str, ...]:
+    selected: list[str] = []
+    for field in filter(None, (field.strip() for field in fields.split(","))):
+        if field not in SCHEMAS[model].model_fields:
+            raise HTTPException(
+                status_code=HTTPStatus.BAD_REQUEST,
+                detail=f"Invalid field '{field}'",
+            )
+        selected.append(field)
+    return tuple(dict.fromkeys(["id", *selected])) if selected else ()
+
+
+def record_schema(model: type, selected: tuple[str, ...]) -> type[BaseModel]:
+    schema: type[BaseModel] = SCHEMAS[model]
+    return partial_schema(schema, selected) if selected else schema
+
+
+def freeze(tree: dict) -> tuple:
+    return tuple(sorted((key, freeze(value)) for key, value in tree.items()))
+
+
+def thaw(frozen: tuple) -> dict:
+    return {key: thaw(value) for key, value in frozen}
+
+
+def select_records(
+    model: type, tree: dict, selected: tuple[str, ...] = ()
+) -> Select:
+    # Statements are immutable, so one built per shape serves every request
+    # and SQLAlchemy memoizes its cache key instead of recomputing it
+    return build_select(model, freeze(tree), selected)
+
+
+@lru_cache(maxsize=1024)
+def build_select(
+    model: type, tree: tuple, selected: tuple[str, ...]
+) -> Select:
+    if not tree:
+        fields: tuple[str, ...] = selected or tuple(
+            SCHEMAS[model].model_fields
+        )
+        return select(*(getattr(model, field) for field in fields))
+
+    statement: Select = select(model).options(
+        *expand_options(model, thaw(tree))
+    )
+    if selected:
+        statement = statement.options(
+            load_only(*(getattr(model, field) for field in selected))
+        )
+    return statement
+
+
+def select_by_id(
+    model: type, tree: dict, selected: tuple[str, ...] = ()
+) -> Select:
+    return build_select_by_id(model, freeze(tree), selected)
+
+
+@lru_cache(maxsize=1024)
+def build_select_by_id(
+    model: type, tree: tuple, selected: tuple[str, ...]
+) -> Select:
+    # The id is bound at execution, pass it as {"id": value}
+    return build_select(model, tree, selected).where(
+        model.id == bindparam("id")
+    )
+
+
+@lru_cache
+def lookup(model: type, field: str = "id") -> Select:
+    # Single entity by one column, the value is passed as {field: value}
+    return select(model).where(getattr(model, field) == bindparam(field))
+
+
+def fetch(
+    session: Session, statement: Select, parameters: dict = None
+) -> list:
+    result = session.execute(statement, parameters)
+    # Column projections return plain mappings, entity selects ORM objects
+    description: dict = statement.column_descriptions[0]
+    if description["type"] is description["entity"]:
+        return result.scalars().all()
+    return result.mappings().all()
+
+
+def fetch_one(
+    session: Session, statement: Select, parameters: dict = None
+) -> object:
+    records: list = fetch(session, statement, parameters)
+    return records[0] if records else None
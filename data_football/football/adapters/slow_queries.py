@@ -0,0 +1,157 @@
+import logging
+from collections.abc import Callable
+from logging.handlers import QueueHandler, QueueListener
+from queue import Full, Queue
+from threading import Lock
+from time import monotonic, perf_counter
+from typing import Optional
+
+from sqlalchemy import Engine, event
+
+from football.adapters.database import QueryStats, query_stats
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+MAX_PARAMETERS_LENGTH: int = 1000
+
+
+class DroppingQueueHandler(QueueHandler):
+    def enqueue(self, record: logging.LogRecord):
+        # A full queue drops the record instead of blocking the request
+        try:
+            self.queue.put_nowait(record)
+        except Full:
+            pass
+
+
+class ExplainingListener(QueueListener):
+    # Runs the EXPLAIN of a slow statement on the listener thread, the
+    # request does not wait for it
+    def __init__(
+        self,
+        queue: Queue,
+        handler: logging.Handler,
+        explain: Callable[[Engine, str, object], Optional[str]],
+    ):
+        super().__init__(queue, handler)
+        self.explain = explain
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        statement: Optional[tuple] = getattr(record, "explain", None)
+        if statement is not None:
+            plan: Optional[str] = self.explain(*statement)
+            if plan:
+                record.msg += f"\nPlan:\n{plan}"
+        return record
+
+
+class SlowQueryLog:
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        threshold_ms: float,
+        explain: bool = True,
+        analyze: bool = False,
+        explain_interval: float = 60.0,
+        handler: Optional[logging.Handler] = None,
+        queue_size: int = 10_000,
+    ):
+        self.threshold = threshold_ms / 1000
+        self.explain = explain
+        self.analyze = analyze
+        self.explain_interval = explain_interval
+        self.explained: dict[str, float] = {}
+        self.lock = Lock()
+
+        queue: Queue = Queue(maxsize=queue_size)
+        self.listener = ExplainingListener(
+            queue, handler or logging.StreamHandler(), self.explain_plan
+        )
+        self.handler = DroppingQueueHandler(queue)
+
+    def install(self, engine: Engine):
+        event.listen(engine, "before_cursor_execute", self.before)
+        event.listen(engine, "after_cursor_execute", self.after)
+
+    def uninstall(self, engine: Engine):
+        event.remove(engine, "before_cursor_execute", self.before)
+        event.remove(engine, "after_cursor_execute", self.after)
+
+    def start(self):
+        logger.addHandler(self.handler)
+        logger.setLevel(logging.WARNING)
+        logger.propagate = False
+        self.listener.start()
+
+    def stop(self):
+        self.listener.stop()
+        logger.removeHandler(self.handler)
+
+    @staticmethod
+    def before(connection, cursor, statement, *args):
+        connection.info.setdefault("slow_started", []).append(perf_counter())
+
+    def after(  # noqa: PLR0913, PLR0917
+        self, connection, cursor, statement, parameters, context, executemany
+    ):
+        duration: float = (
+            perf_counter() - connection.info["slow_started"].pop()
+        )
+        if duration < self.threshold:
+            return
+
+        explain: Optional[tuple] = None
+        if not executemany and self.should_explain(statement):
+            explain = (connection.engine, statement, parameters)
+
+        stats: Optional[QueryStats] = query_stats.get()
+        logger.warning(
+            "Slow query (%.1f ms) on %s: %s\nParameters: %s",
+            duration * 1000,
+            stats.route if stats else "no route",
+            statement,
+            repr(parameters)[:MAX_PARAMETERS_LENGTH],
+            extra={"explain": explain},
+        )
+
+    def should_explain(self, statement: str) -> bool:
+        # Only reads are explained since ANALYZE runs the statement again
+        if not self.explain or not statement.lstrip().upper().startswith(
+            ("SELECT", "WITH")
+        ):
+            return False
+        now: float = monotonic()
+        with self.lock:
+            if now - self.explained.get(statement, -self.explain_interval) < (
+                self.explain_interval
+            ):
+                return False
+            self.explained[statement] = now
+        return True
+
+    def explain_plan(
+        self, engine: Engine, statement: str, parameters: object
+    ) -> Optional[str]:
+        if engine.dialect.name == "sqlite":
+            prefix: str = "EXPLAIN QUERY PLAN "
+        elif engine.dialect.name == "postgresql":
+            prefix = (
+                "EXPLAIN (ANALYZE, BUFFERS) " if self.analyze else "EXPLAIN "
+            )
+        else:
+            return None
+
+        # On a connection of its own, rolled back when returned to the pool.
+        # The raw cursor keeps the EXPLAIN out of the query hooks.
+        try:
+            with engine.connect() as connection:
+                cursor = connection.connection.cursor()
+                try:
+                    cursor.execute(prefix + statement, parameters)
+                    return "\n".join(
+                        " ".join(str(column) for column in row)
+                        for row in cursor.fetchall()
+                    )
+                finally:
+                    cursor.close()
+        except Exception as error:  # noqa: BLE001
+            return f"EXPLAIN failed: {error}"
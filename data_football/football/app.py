@@ -1,5 +1,13 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from starlette.concurrency import run_in_threadpool
 
+from football.adapters.cache import cache, configure_cache
+from football.adapters.database import ReplicaRouter, databases, warm_pool
+from football.adapters.invalidation import invalidation_bus
+from football.adapters.slow_queries import SlowQueryLog
 from football.domain.entities import (
     Message,
 )
@@ -13,8 +21,87 @@ from football.features import (
     teams,
     users,
 )
+from football.metrics import registry
+from football.middlewares.coalescing import CoalescingMiddleware
+from football.middlewares.compression import CompressionMiddleware
+from football.middlewares.metrics import MetricsMiddleware
+from football.middlewares.profiler import ProfilerMiddleware
+from football.openapi import use_prebuilt_schema
+from football.profiling import Sampler
+from football.settings import Settings, get_settings
+
+settings: Settings = get_settings()
+
+slow_queries: SlowQueryLog = SlowQueryLog(
+    threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+    explain=settings.SLOW_QUERY_EXPLAIN,
+    analyze=settings.SLOW_QUERY_EXPLAIN_ANALYZE,
+    explain_interval=settings.SLOW_QUERY_EXPLAIN_INTERVAL,
+)
+sampler: Sampler = Sampler(
+    hz=settings.SAMPLING_PROFILER_HZ,
+    directory=settings.SAMPLING_PROFILER_DIRECTORY,
+    interval=settings.SAMPLING_PROFILER_INTERVAL,
+)
+
 
-app: FastAPI = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Engines and the driver load here, not when the app is imported
+    router: ReplicaRouter = await run_in_threadpool(databases)
+    configure_cache(settings)
+    if settings.SLOW_QUERY_THRESHOLD_MS > 0:
+        for engine in (router.primary, *router.replicas):
+            slow_queries.install(engine)
+    slow_queries.start()
+    if settings.DATABASE_POOL_PREWARM:
+        await run_in_threadpool(warm_pool, router.primary)
+        await run_in_threadpool(router.warm)
+    # Started per worker, threads do not survive the fork
+    if settings.SAMPLING_PROFILER_HZ > 0:
+        sampler.start(app.routes)
+    if cache.enabled:
+        invalidation_bus().start()
+    yield
+    if cache.enabled:
+        invalidation_bus().stop()
+    sampler.stop()
+    slow_queries.stop()
+    if settings.SLOW_QUERY_THRESHOLD_MS > 0:
+        for engine in (router.primary, *router.replicas):
+            slow_queries.uninstall(engine)
+
+
+app: FastAPI = FastAPI(lifespan=lifespan)
+if settings.OPENAPI_FILE:
+    use_prebuilt_schema(app, settings.OPENAPI_FILE)
+# Innermost, followers still get their own encoding and metrics
+if settings.COALESCE_REQUESTS:
+    app.add_middleware(
+        CoalescingMiddleware, max_body_size=settings.COALESCE_MAX_BODY_SIZE
+    )
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    levels={
+        "gzip": settings.COMPRESSION_GZIP_LEVEL,
+        "br": settings.COMPRESSION_BROTLI_LEVEL,
+        "zstd": settings.COMPRESSION_ZSTD_LEVEL,
+    },
+    cache_size=settings.COMPRESSION_CACHE_SIZE,
+)
+if settings.PROFILE_TOKEN:
+    app.add_middleware(
+        ProfilerMiddleware,
+        token=settings.PROFILE_TOKEN,
+        allowed_clients=tuple(settings.PROFILE_ALLOWED_CLIENTS),
+        directory=settings.PROFILE_DIRECTORY or None,
+    )
+app.add_middleware(
+    MetricsMiddleware,
+    debug=settings.DEBUG,
+    repeat_threshold=settings.QUERY_REPEAT_THRESHOLD,
+)
 
 app.include_router(championships.router)
 app.include_router(goals.router)
@@ -29,3 +116,10 @@ app.include_router(users.router)
 @app.get("/", response_model=Message)
 def home():
     return {"message": "Data Football Service!"}
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    return PlainTextResponse(
+        registry.render(), media_type="text/plain; version=0.0.4"
+    )
@@ -0,0 +1,385 @@
+import argparse
+import math
+import random
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass, fields
+from datetime import date, datetime, timedelta
+from itertools import islice
+from time import perf_counter
+
+from sqlalchemy import Connection, Table, create_engine, text
+
+from football.adapters.models import (
+    Championship,
+    Goal,
+    Match,
+    Player,
+    Round,
+    Stadium,
+    Team,
+    User,
+    table_registry,
+)
+
+COUNTRIES: tuple[str, ...] = (
+    "Argentina",
+    "Brazil",
+    "England",
+    "France",
+    "Germany",
+    "Italy",
+    "Netherlands",
+    "Portugal",
+    "Spain",
+    "Uruguay",
+)
+FIRST_SEASON: int = 2000
+
+
+@dataclass(frozen=True)
+class Scale:
+    championships: int = 10
+    seasons: int = 5
+    rounds: int = 38
+    teams: int = 2_000
+    players_per_team: int = 25
+    stadiums: int = 500
+    matches_per_round: int = 10
+    goals_per_match: float = 2.7
+    users: int = 1_000
+
+    def __post_init__(self):
+        # Every match of a round needs two teams of its own
+        if self.teams < self.matches_per_round * 2:
+            raise ValueError(
+                f"{self.teams} teams cannot play {self.matches_per_round} "
+                f"matches per round, at least {self.matches_per_round * 2} "
+                "are needed"
+            )
+
+    @property
+    def players(self) -> int:
+        return self.teams * self.players_per_team
+
+    @property
+    def matches(self) -> int:
+        return (
+            self.championships
+            * self.seasons
+            * self.rounds
+            * self.matches_per_round
+        )
+
+
+SCALES: dict[str, Scale] = {
+    "small": Scale(
+        championships=2, seasons=1, teams=100, stadiums=20, users=100
+    ),
+    "medium": Scale(),
+    "large": Scale(championships=20, seasons=10),
+    # 2.28M matches and 8.7M rows in all, measured loading into SQLite
+    # in 64s. Each championship still plays within 50 teams of its own.
+    "xlarge": Scale(
+        championships=100,
+        seasons=30,
+        teams=5_000,
+        stadiums=1_000,
+        matches_per_round=20,
+    ),
+}
+
+
+def code(index: int) -> str:
+    digits: str = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    value: str = ""
+    while True:
+        index, remainder = divmod(index, len(digits))
+        value = digits[remainder] + value
+        if not index:
+            return value.rjust(3, "0")
+
+
+def users(scale: Scale, seed: int) -> Iterator[tuple]:
+    for index in range(1, scale.users + 1):
+        yield index, f"User {index}", f"user{index}@mail.com", "secret"
+
+
+def stadiums(scale: Scale, seed: int) -> Iterator[tuple]:
+    generator: random.Random = random.Random(f"{seed}:stadiums")
+    for index in range(1, scale.stadiums + 1):
+        country: str = COUNTRIES[index % len(COUNTRIES)]
+        yield (
+            index,
+            f"Stadium {index}",
+            generator.randrange(5_000, 100_000, 500),
+            f"{country} City {index % 50}",
+            country,
+        )
+
+
+def teams(scale: Scale, seed: int) -> Iterator[tuple]:
+    for index in range(1, scale.teams + 1):
+        country: str = COUNTRIES[index % len(COUNTRIES)]
+        yield (
+            index,
+            f"Team {index}",
+            f"Team {index} Football Club",
+            code(index),
+            country,
+        )
+
+
+def championships(scale: Scale, seed: int) -> Iterator[tuple]:
+    for season in range(scale.seasons):
+        for number in range(1, scale.championships + 1):
+            year: int = FIRST_SEASON + season
+            yield (
+                season * scale.championships + number,
+                f"Championship {number} {year}/{year + 1}",
+                "league",
+                "national",
+                COUNTRIES[number % len(COUNTRIES)],
+                year,
+                year + 1,
+            )
+
+
+def rounds(scale: Scale, seed: int) -> Iterator[tuple]:
+    total: int = scale.championships * scale.seasons
+    for championship_id in range(1, total + 1):
+        for number in range(1, scale.rounds + 1):
+            yield (
+                (championship_id - 1) * scale.rounds + number,
+                f"Round {number}",
+                f"Matchday {number}",
+                championship_id,
+            )
+
+
+def players(scale: Scale, seed: int) -> Iterator[tuple]:
+    generator: random.Random = random.Random(f"{seed}:players")
+    for index in range(1, scale.players + 1):
+        team_id: int = (index - 1) // scale.players_per_team + 1
+        birth: date = date(1980, 1, 1) + timedelta(
+            days=generator.randrange(25 * 365)
+        )
+        yield (
+            index,
+            f"Player {index}",
+            f"Player {index} Surname",
+            COUNTRIES[generator.randrange(len(COUNTRIES))],
+            birth.isoformat(),
+            team_id,
+        )
+
+
+def pool(scale: Scale, championship: int) -> range:
+    # Each championship plays among its own slice of the teams
+    size: int = max(scale.teams // scale.championships, 1)
+    if size < scale.matches_per_round * 2:
+        return range(1, scale.teams + 1)
+    start: int = (championship - 1) % scale.championships * size
+    return range(start + 1, start + size + 1)
+
+
+def fixtures(scale: Scale, seed: int) -> Iterator[tuple]:
+    # Matches and goals share one random stream so both stay consistent
+    generator: random.Random = random.Random(f"{seed}:matches")
+    match_id: int = 0
+    goal_id: int = 0
+    for round_index in range(
+        scale.championships * scale.seasons * scale.rounds
+    ):
+        championship: int = round_index // scale.rounds + 1
+        kickoff: datetime = datetime(
+            FIRST_SEASON + (championship - 1) // scale.championships, 8, 1
+        ) + timedelta(weeks=round_index % scale.rounds)
+        sides: list[int] = generator.sample(
+            pool(scale, championship), scale.matches_per_round * 2
+        )
+        for home, away in zip(sides[::2], sides[1::2]):
+            match_id += 1
+            scorers: list[int] = [
+                generator.choice((home, away))
+                for _ in range(poisson(generator, scale.goals_per_match))
+            ]
+            yield (
+                "matches",
+                (
+                    match_id,
+                    (
+                        kickoff + timedelta(hours=generator.randrange(12))
+                    ).isoformat(),
+                    scorers.count(home),
+                    scorers.count(away),
+                    False,
+                    0,
+                    0,
+                    False,
+                    0,
+                    0,
+                    generator.randint(1, scale.stadiums),
+                    round_index + 1,
+                    home,
+                    away,
+                ),
+            )
+            for team_id in scorers:
+                goal_id += 1
+                yield (
+                    "goals",
+                    (
+                        goal_id,
+                        generator.randint(1, 90),
+                        False,
+                        match_id,
+                        team_id,
+                        (team_id - 1) * scale.players_per_team
+                        + generator.randint(1, scale.players_per_team),
+                    ),
+                )
+
+
+def poisson(generator: random.Random, mean: float) -> int:
+    count, threshold, product = 0, math.exp(-mean), 1.0
+    while True:
+        product *= generator.random()
+        if product <= threshold:
+            return count
+        count += 1
+
+
+def columns(table: Table) -> tuple[str, ...]:
+    return tuple(
+        column.name
+        for column in table.columns
+        if column.server_default is None
+    )
+
+
+def load(
+    connection: Connection,
+    table: Table,
+    rows: Iterator[tuple],
+    batch_size: int,
+) -> int:
+    names: tuple[str, ...] = columns(table)
+    count: int = 0
+    if connection.dialect.name == "postgresql":
+        cursor = connection.connection.cursor()
+        with cursor.copy(
+            f"COPY {table.name} ({', '.join(names)}) FROM STDIN"
+        ) as copy:
+            for row in rows:
+                copy.write_row(row)
+                count += 1
+        return count
+
+    # Positional executemany skips building a dict for every row
+    placeholder: str = {"qmark": "?", "format": "%s"}[
+        connection.dialect.paramstyle
+    ]
+    statement: str = (
+        f"INSERT INTO {table.name} ({', '.join(names)}) "
+        f"VALUES ({', '.join([placeholder] * len(names))})"
+    )
+    while batch := list(islice(rows, batch_size)):
+        connection.exec_driver_sql(statement, batch)
+        count += len(batch)
+    return count
+
+
+def reset_sequences(connection: Connection):
+    if connection.dialect.name != "postgresql":
+        return
+    for table in table_registry.metadata.sorted_tables:
+        connection.execute(
+            text(
+                f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                f"COALESCE((SELECT MAX(id) FROM {table.name}), 0) + 1, false)"
+            )
+        )
+
+
+def generate(
+    connection: Connection,
+    scale: Scale = Scale(),
+    seed: int = 0,
+    batch_size: int = 50_000,
+) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for model, rows in (
+        (User, users),
+        (Stadium, stadiums),
+        (Team, teams),
+        (Championship, championships),
+        (Round, rounds),
+        (Player, players),
+    ):
+        table: Table = model.__table__
+        counts[table.name] = load(
+            connection, table, rows(scale, seed), batch_size
+        )
+
+    # Goals come from a second, identical pass over the fixtures so they
+    # load after their matches without holding either in memory
+    for model in (Match, Goal):
+        table = model.__table__
+        counts[table.name] = load(
+            connection,
+            table,
+            (row for name, row in fixtures(scale, seed) if name == table.name),
+            batch_size,
+        )
+    reset_sequences(connection)
+    return counts
+
+
+def main(arguments: list[str] = None):
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic football dataset"
+    )
+    parser.add_argument("url", help="Database URL to load the data into")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    parser.add_argument(
+        "--create",
+        action="store_true",
+        help="Create the tables before loading",
+    )
+    for field in fields(Scale):
+        parser.add_argument(
+            f"--{field.name.replace('_', '-')}",
+            type=type(field.default),
+            default=field.default,
+        )
+    options = parser.parse_args(arguments)
+
+    try:
+        scale: Scale = Scale(
+            **{
+                field.name: getattr(options, field.name)
+                for field in fields(Scale)
+            }
+        )
+    except ValueError as error:
+        parser.error(str(error))
+    engine = create_engine(options.url)
+    if options.create:
+        table_registry.metadata.create_all(engine)
+
+    started: float = perf_counter()
+    with engine.begin() as connection:
+        counts: dict[str, int] = generate(
+            connection, scale, options.seed, options.batch_size
+        )
+    elapsed: float = perf_counter() - started
+
+    print(f"Scale: {asdict(scale)}")
+    for table, count in counts.items():
+        print(f"{table:>14}: {count:>12,}")
+    print(f"Loaded {sum(counts.values()):,} rows in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
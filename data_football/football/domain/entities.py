@@ -1,7 +1,11 @@
+from functools import lru_cache
+from typing import Optional
+
 from pydantic import (
     BaseModel,
     ConfigDict,
     EmailStr,
+    create_model,
 )
 
 
@@ -44,6 +48,7 @@ class StadiumModel(Model, StadiumBase): ...
 
 class StadiumList(BaseModel):
     stadiums: list[StadiumModel]
+    missing: Optional[list[int]] = None
 
 
 class ChampionshipBase(BaseModel):
@@ -60,6 +65,26 @@ class ChampionshipModel(Model, ChampionshipBase): ...
 
 class ChampionshipList(BaseModel):
     championships: list[ChampionshipModel]
+    missing: Optional[list[int]] = None
+
+
+class StandingModel(BaseModel):
+    position: int
+    team_id: int
+    team: str
+    played: int
+    won: int
+    drawn: int
+    lost: int
+    goals_for: int
+    goals_against: int
+    goal_difference: int
+    points: int
+
+
+class StandingList(BaseModel):
+    championship_id: int
+    standings: list[StandingModel]
 
 
 class TeamBase(BaseModel):
@@ -74,6 +99,7 @@ class TeamModel(Model, TeamBase): ...
 
 class TeamList(BaseModel):
     teams: list[TeamModel]
+    missing: Optional[list[int]] = None
 
 
 class RoundBase(BaseModel):
@@ -85,8 +111,13 @@ class RoundBase(BaseModel):
 class RoundModel(Model, RoundBase): ...
 
 
+class RoundExpanded(RoundModel):
+    championship: Optional[ChampionshipModel] = None
+
+
 class RoundList(BaseModel):
     rounds: list[RoundModel]
+    missing: Optional[list[int]] = None
 
 
 class MatchBase(BaseModel):
@@ -108,8 +139,17 @@ class MatchBase(BaseModel):
 class MatchModel(Model, MatchBase): ...
 
 
+class MatchExpanded(MatchModel):
+    stadium: Optional[StadiumModel] = None
+    round: Optional[RoundExpanded] = None
+    home_team: Optional[TeamModel] = None
+    away_team: Optional[TeamModel] = None
+    goals: Optional[list["GoalExpanded"]] = None
+
+
 class MatchList(BaseModel):
-    matches: list[MatchModel]
+    matches: list[MatchExpanded]
+    missing: Optional[list[int]] = None
 
 
 class PlayerBase(BaseModel):
@@ -123,8 +163,13 @@ class PlayerBase(BaseModel):
 class PlayerModel(Model, PlayerBase): ...
 
 
+class PlayerExpanded(PlayerModel):
+    current_team: Optional[TeamModel] = None
+
+
 class PlayerList(BaseModel):
-    players: list[PlayerModel]
+    players: list[PlayerExpanded]
+    missing: Optional[list[int]] = None
 
 
 class GoalBase(BaseModel):
@@ -138,5 +183,30 @@ class GoalBase(BaseModel):
 class GoalModel(Model, GoalBase): ...
 
 
+class GoalExpanded(GoalModel):
+    match: Optional[MatchExpanded] = None
+    team: Optional[TeamModel] = None
+    player: Optional[PlayerExpanded] = None
+
+
 class GoalList(BaseModel):
-    goals: list[GoalModel]
+    goals: list[GoalExpanded]
+    missing: Optional[list[int]] = None
+
+
+MatchExpanded.model_rebuild()
+
+
+@lru_cache
+def partial_schema(
+    schema: type[BaseModel], fields: tuple[str, ...]
+) -> type[BaseModel]:
+    return create_model(
+        schema.__name__,
+        __config__=ConfigDict(from_attributes=True),
+        **{
+            field: (info.annotation, info)
+            for field, info in schema.model_fields.items()
+            if field in fields
+        },
+    )
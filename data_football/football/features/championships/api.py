@@ -1,22 +1,55 @@
 import logging
+from functools import partial
 from http import HTTPStatus
+from time import time
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
+from pydantic import BaseModel
+from pydantic_core import to_json
+from sqlalchemy import Select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from football.adapters.database import get_session
+from football.adapters.cache import cache
+from football.adapters.database import (
+    SessionRoute,
+    get_read_session,
+    get_session,
+    reads_primary,
+    release,
+)
 from football.adapters.models import Championship
+from football.adapters.queries import (
+    dump,
+    fetch,
+    fetch_one,
+    lookup,
+    order_by_ids,
+    parse_fields,
+    parse_ids,
+    record_schema,
+    select_by_id,
+    select_records,
+)
 from football.domain.entities import (
     ChampionshipBase,
     ChampionshipList,
     ChampionshipModel,
     Message,
+    StandingList,
+)
+from football.responses import (
+    json_body_response,
+    json_response,
+    list_response,
+    negotiate_media_type,
+    revalidated_response,
 )
 from football.utils import update_object
 
-router: APIRouter = APIRouter()
+from .standings import standings
+
+router: APIRouter = APIRouter(route_class=SessionRoute)
 logger: logging.Logger = logging.getLogger(__name__)
 
 
@@ -48,41 +81,138 @@ def create_championship(
     return new_championship
 
 
-@router.get("/", response_model=ChampionshipList)
-def get_championships(
+@router.get(
+    "/", response_model=ChampionshipList, response_model_exclude_unset=True
+)
+def get_championships(  # noqa: PLR0913, PLR0917
     skip: int = 0,
     limit: int = 100,
     name: str = "",
     country: str = "",
-    session: Session = Depends(get_session),
+    ids: str = "",
+    fields: str = "",
+    media_type: str = Depends(negotiate_media_type),
+    session: Session = Depends(get_read_session),
 ):
-    championships: list[Championship] = session.scalars(
-        select(Championship)
-        .offset(skip)
-        .limit(limit)
-        .where(
-            Championship.name.contains(name)
-            & Championship.country.contains(country)
+    selected: tuple[str, ...] = parse_fields(Championship, fields)
+    schema: type[BaseModel] = record_schema(Championship, selected)
+    statement: Select = select_records(Championship, {}, selected)
+    if requested := parse_ids(ids):
+        records: list = fetch(
+            session, statement.where(Championship.id.in_(requested))
+        )
+        found, missing = order_by_ids(records, requested)
+        return list_response(
+            "championships", found, {}, schema, media_type, missing
+        )
+    else:
+        championships: list = fetch(
+            session,
+            statement.offset(skip)
+            .limit(limit)
+            .where(
+                Championship.name.contains(name)
+                & Championship.country.contains(country)
+            )
+            .order_by(Championship.name),
+        )
+        return list_response(
+            "championships", championships, {}, schema, media_type
         )
-        .order_by(Championship.name)
-    ).all()
-    return {"championships": championships}
 
 
 @router.get("/{championship_id}", response_model=ChampionshipModel)
 def get_championship(
     championship_id: int,
-    session: Session = Depends(get_session),
+    request: Request,
+    fields: str = "",
+    session: Session = Depends(get_read_session),
+    primary: Session = Depends(get_session),
 ):
-    record = session.scalar(
-        select(Championship).where(Championship.id == championship_id)
+    selected: tuple[str, ...] = parse_fields(Championship, fields)
+    # Filled from the primary only, see get_team
+    cached: bool = (
+        cache.enabled and not selected and not reads_primary(request)
+    )
+    if cached and (
+        (body := cache.get("championships", championship_id)) is not None
+    ):
+        return json_body_response(body)
+
+    record = fetch_one(
+        primary if cached else session,
+        select_by_id(Championship, {}, selected),
+        {"id": championship_id},
     )
     if not record:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND, detail="Championship not found"
         )
 
-    return record
+    if selected:
+        schema: type[BaseModel] = record_schema(Championship, selected)
+        return json_response(dump(record, {}, schema))
+    body = to_json(dump(record, {}, ChampionshipModel))
+    if cached:
+        cache.set("championships", championship_id, value=body)
+    return json_body_response(body)
+
+
+def standings_body(session: Session, championship_id: int) -> bytes:
+    return to_json(
+        {
+            "championship_id": championship_id,
+            "standings": standings(session, championship_id),
+        }
+    )
+
+
+def refreshed_standings(session: Session, championship_id: int) -> bytes:
+    # Runs after the response, the connection goes back once computed
+    try:
+        return standings_body(session, championship_id)
+    finally:
+        release(session)
+
+
+@router.get("/{championship_id}/standings", response_model=StandingList)
+def get_standings(
+    championship_id: int,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    session: Session = Depends(get_read_session),
+    primary: Session = Depends(get_session),
+):
+    stale: float = cache.stale.get("standings", 0.0)
+    # Cached tables are computed on the primary, a lagging replica would
+    # store the old table as fresh
+    cached: bool = cache.enabled and not reads_primary(request)
+    entry = (
+        cache.get_revalidated("standings", championship_id) if cached else None
+    )
+    if entry is not None:
+        if entry.stale and (
+            refresh := cache.refresher(
+                "standings",
+                championship_id,
+                compute=partial(refreshed_standings, primary, championship_id),
+            )
+        ):
+            background_tasks.add_task(refresh)
+        return revalidated_response(entry.body, entry.age, stale)
+
+    started: float = time()
+    computing: Session = primary if cached else session
+    if not computing.scalar(lookup(Championship), {"id": championship_id}):
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND, detail="Championship not found"
+        )
+    body = standings_body(computing, championship_id)
+    if cached:
+        cache.set_revalidated(
+            "standings", championship_id, value=body, computed=started
+        )
+    return revalidated_response(body, 0, stale)
 
 
 @router.put("/{championship_id}", response_model=ChampionshipModel)
@@ -92,9 +222,7 @@ def update_championship(
     session: Session = Depends(get_session),
 ):
     try:
-        record = session.scalar(
-            select(Championship).where(Championship.id == championship_id)
-        )
+        record = session.scalar(lookup(Championship), {"id": championship_id})
         if not record:
             raise HTTPException(
                 status_code=HTTPStatus.NOT_FOUND,
@@ -120,9 +248,7 @@ def delete_championship(
     championship_id: int, session: Session = Depends(get_session)
 ):
     try:
-        record = session.scalar(
-            select(Championship).where(Championship.id == championship_id)
-        )
+        record = session.scalar(lookup(Championship), {"id": championship_id})
 
         if not record:
             raise HTTPException(
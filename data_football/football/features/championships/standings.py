@@ -0,0 +1,77 @@
+from sqlalchemy import (
+    Select,
+    bindparam,
+    case,
+    func,
+    literal,
+    select,
+    union_all,
+)
+from sqlalchemy.orm import Session
+
+from football.adapters.models import Match, Round, Team
+
+WIN_POINTS: int = 3
+DRAW_POINTS: int = 1
+
+
+def sides() -> Select:
+    # One row per team and match, from that team's point of view
+    perspectives: list[Select] = [
+        select(
+            team.label("team_id"),
+            scored.label("scored"),
+            conceded.label("conceded"),
+        )
+        .join(Round, Round.id == Match.round_id)
+        .where(Round.championship_id == bindparam("championship_id"))
+        for team, scored, conceded in (
+            (Match.home_team_id, Match.goals_home, Match.goals_away),
+            (Match.away_team_id, Match.goals_away, Match.goals_home),
+        )
+    ]
+    return union_all(*perspectives).subquery("sides")
+
+
+def build_standings() -> Select:
+    played = sides()
+    won = func.sum(case((played.c.scored > played.c.conceded, 1), else_=0))
+    drawn = func.sum(case((played.c.scored == played.c.conceded, 1), else_=0))
+    lost = func.sum(case((played.c.scored < played.c.conceded, 1), else_=0))
+    goals_for = func.sum(played.c.scored)
+    goals_against = func.sum(played.c.conceded)
+    points = won * literal(WIN_POINTS) + drawn * literal(DRAW_POINTS)
+    return (
+        select(
+            played.c.team_id,
+            Team.name.label("team"),
+            func.count().label("played"),
+            won.label("won"),
+            drawn.label("drawn"),
+            lost.label("lost"),
+            goals_for.label("goals_for"),
+            goals_against.label("goals_against"),
+            (goals_for - goals_against).label("goal_difference"),
+            points.label("points"),
+        )
+        .join(Team, Team.id == played.c.team_id)
+        .group_by(played.c.team_id, Team.name)
+        .order_by(
+            points.desc(),
+            (goals_for - goals_against).desc(),
+            goals_for.desc(),
+            Team.name,
+        )
+    )
+
+
+# Built once, the championship is bound on every execution
+STANDINGS: Select = build_standings()
+
+
+def standings(session: Session, championship_id: int) -> list[dict]:
+    rows = session.execute(STANDINGS, {"championship_id": championship_id})
+    return [
+        {"position": position, **row}
+        for position, row in enumerate(rows.mappings(), start=1)
+    ]
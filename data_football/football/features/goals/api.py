@@ -2,25 +2,50 @@ import logging
 from http import HTTPStatus
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from pydantic import BaseModel
+from sqlalchemy import Select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from football.adapters.database import get_session
+from football.adapters.database import (
+    SessionRoute,
+    get_read_session,
+    get_session,
+)
 from football.adapters.models import (
     Goal,
     Match,
     Player,
 )
+from football.adapters.queries import (
+    dump,
+    fetch,
+    fetch_one,
+    ids_filter,
+    lookup,
+    order_by_ids,
+    parse_expand,
+    parse_fields,
+    parse_ids,
+    record_schema,
+    select_by_id,
+    select_records,
+)
 from football.domain.entities import (
     GoalBase,
+    GoalExpanded,
     GoalList,
     GoalModel,
     Message,
 )
+from football.responses import (
+    json_response,
+    list_response,
+    negotiate_media_type,
+)
 from football.utils import update_object
 
-router: APIRouter = APIRouter()
+router: APIRouter = APIRouter(route_class=SessionRoute)
 logger: logging.Logger = logging.getLogger(__name__)
 
 
@@ -30,9 +55,7 @@ def create_goal(
     session: Session = Depends(get_session),
 ):
     try:
-        match = session.scalars(
-            select(Match).where(Match.id == goal.match_id)
-        ).first()
+        match = session.scalars(lookup(Match), {"id": goal.match_id}).first()
         if not match:
             raise HTTPException(
                 status_code=HTTPStatus.BAD_REQUEST,
@@ -40,7 +63,7 @@ def create_goal(
             )
 
         player = session.scalars(
-            select(Player).where(Player.id == goal.player_id)
+            lookup(Player), {"id": goal.player_id}
         ).first()
         if not player:
             raise HTTPException(
@@ -66,35 +89,72 @@ def create_goal(
     return new_goal
 
 
-@router.get("/", response_model=GoalList)
-def get_goals(
-    match_id: int,
+@router.get("/", response_model=GoalList, response_model_exclude_unset=True)
+def get_goals(  # noqa: PLR0913, PLR0917
+    match_id: int = None,
     skip: int = 0,
     limit: int = 100,
-    session: Session = Depends(get_session),
+    expand: str = "",
+    ids: str = "",
+    match_ids: str = "",
+    player_ids: str = "",
+    team_ids: str = "",
+    fields: str = "",
+    media_type: str = Depends(negotiate_media_type),
+    session: Session = Depends(get_read_session),
 ):
-    goals: list[Goal] = session.scalars(
-        select(Goal)
-        .offset(skip)
-        .limit(limit)
-        .where((Goal.match_id == match_id))
-    ).all()
-    return {"goals": goals}
+    paths: dict = parse_expand(Goal, expand)
+    selected: tuple[str, ...] = parse_fields(Goal, fields)
+    schema: type[BaseModel] = record_schema(Goal, selected)
+    statement: Select = select_records(Goal, paths, selected)
+    if requested := parse_ids(ids):
+        records: list = fetch(session, statement.where(Goal.id.in_(requested)))
+        found, missing = order_by_ids(records, requested)
+        return list_response(
+            "goals", found, paths, schema, media_type, missing
+        )
 
+    filters: list = [
+        *ids_filter(Goal.match_id, match_ids, "match_ids"),
+        *ids_filter(Goal.player_id, player_ids, "player_ids"),
+        *ids_filter(Goal.team_id, team_ids, "team_ids"),
+    ]
+    if match_id is not None:
+        filters.append(Goal.match_id == match_id)
 
-@router.get("/{goal_id}", response_model=GoalModel)
+    goals: list = fetch(
+        session, statement.offset(skip).limit(limit).where(*filters)
+    )
+    return list_response("goals", goals, paths, schema, media_type)
+
+
+@router.get(
+    "/{goal_id}",
+    response_model=GoalExpanded,
+    response_model_exclude_unset=True,
+)
 def get_goal(
     goal_id: int,
-    session: Session = Depends(get_session),
+    expand: str = "",
+    fields: str = "",
+    session: Session = Depends(get_read_session),
 ):
-    record = session.scalar(select(Goal).where(Goal.id == goal_id))
+    paths: dict = parse_expand(Goal, expand)
+    selected: tuple[str, ...] = parse_fields(Goal, fields)
+    record = fetch_one(
+        session,
+        select_by_id(Goal, paths, selected),
+        {"id": goal_id},
+    )
     if not record:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND,
             detail="Goal not found",
         )
 
-    return record
+    schema: type[BaseModel] = record_schema(Goal, selected)
+    content: dict = dump(record, paths, schema)
+    return json_response(content) if selected else content
 
 
 @router.put("/{goal_id}", response_model=GoalModel)
@@ -104,16 +164,14 @@ def update_goal(
     session: Session = Depends(get_session),
 ):
     try:
-        record = session.scalar(select(Goal).where(Goal.id == goal_id))
+        record = session.scalar(lookup(Goal), {"id": goal_id})
         if not record:
             raise HTTPException(
                 status_code=HTTPStatus.NOT_FOUND,
                 detail="Goal not found",
             )
 
-        match = session.scalars(
-            select(Match).where(Match.id == goal.match_id)
-        ).first()
+        match = session.scalars(lookup(Match), {"id": goal.match_id}).first()
         if not match:
             raise HTTPException(
                 status_code=HTTPStatus.BAD_REQUEST,
@@ -121,7 +179,7 @@ def update_goal(
             )
 
         player = session.scalars(
-            select(Player).where(Player.id == goal.player_id)
+            lookup(Player), {"id": goal.player_id}
         ).first()
         if not player:
             raise HTTPException(
@@ -153,7 +211,7 @@ def delete_goal(
     session: Session = Depends(get_session),
 ):
     try:
-        record = session.scalar(select(Goal).where(Goal.id == goal_id))
+        record = session.scalar(lookup(Goal), {"id": goal_id})
 
         if not record:
             raise HTTPException(
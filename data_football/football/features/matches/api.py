@@ -2,26 +2,51 @@ import logging
 from http import HTTPStatus
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from pydantic import BaseModel
+from sqlalchemy import Select, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from football.adapters.database import get_session
+from football.adapters.database import (
+    SessionRoute,
+    get_read_session,
+    get_session,
+)
 from football.adapters.models import (
     Match,
     Round,
     Stadium,
     Team,
 )
+from football.adapters.queries import (
+    dump,
+    fetch,
+    fetch_one,
+    ids_filter,
+    lookup,
+    order_by_ids,
+    parse_expand,
+    parse_fields,
+    parse_ids,
+    record_schema,
+    select_by_id,
+    select_records,
+)
 from football.domain.entities import (
     MatchBase,
+    MatchExpanded,
     MatchList,
     MatchModel,
     Message,
 )
+from football.responses import (
+    json_response,
+    list_response,
+    negotiate_media_type,
+)
 from football.utils import update_object
 
-router: APIRouter = APIRouter()
+router: APIRouter = APIRouter(route_class=SessionRoute)
 logger: logging.Logger = logging.getLogger(__name__)
 
 
@@ -32,7 +57,7 @@ def create_match(
 ):
     try:
         stadium = session.scalars(
-            select(Stadium).where(Stadium.id == match.stadium_id)
+            lookup(Stadium), {"id": match.stadium_id}
         ).first()
         if not stadium:
             raise HTTPException(
@@ -40,9 +65,7 @@ def create_match(
                 detail="Stadium not found",
             )
 
-        round = session.scalars(
-            select(Round).where(Round.id == match.round_id)
-        ).first()
+        round = session.scalars(lookup(Round), {"id": match.round_id}).first()
         if not round:
             raise HTTPException(
                 status_code=HTTPStatus.BAD_REQUEST,
@@ -50,7 +73,7 @@ def create_match(
             )
 
         home = session.scalars(
-            select(Team).where(Team.id == match.home_team_id)
+            lookup(Team), {"id": match.home_team_id}
         ).first()
         if not home:
             raise HTTPException(
@@ -59,7 +82,7 @@ def create_match(
             )
 
         away = session.scalars(
-            select(Team).where(Team.id == match.away_team_id)
+            lookup(Team), {"id": match.away_team_id}
         ).first()
         if not away:
             raise HTTPException(
@@ -107,42 +130,82 @@ def create_match(
     return new_match
 
 
-@router.get("/", response_model=MatchList)
-def get_matches(
-    round_id: int,
-    team_id: int,
+@router.get("/", response_model=MatchList, response_model_exclude_unset=True)
+def get_matches(  # noqa: PLR0913, PLR0917
+    round_id: int = None,
+    team_id: int = None,
     skip: int = 0,
     limit: int = 100,
-    session: Session = Depends(get_session),
+    expand: str = "",
+    ids: str = "",
+    round_ids: str = "",
+    stadium_ids: str = "",
+    team_ids: str = "",
+    fields: str = "",
+    media_type: str = Depends(negotiate_media_type),
+    session: Session = Depends(get_read_session),
 ):
-    matches: list[Match] = session.scalars(
-        select(Match)
-        .offset(skip)
-        .limit(limit)
-        .where(
-            (Match.round_id == round_id)
-            & (
-                (Match.home_team_id == team_id)
-                | (Match.away_team_id == team_id)
-            )
+    paths: dict = parse_expand(Match, expand)
+    selected: tuple[str, ...] = parse_fields(Match, fields)
+    schema: type[BaseModel] = record_schema(Match, selected)
+    statement: Select = select_records(Match, paths, selected)
+    if requested := parse_ids(ids):
+        records: list = fetch(
+            session, statement.where(Match.id.in_(requested))
+        )
+        found, missing = order_by_ids(records, requested)
+        return list_response(
+            "matches", found, paths, schema, media_type, missing
         )
-    ).all()
-    return {"matches": matches}
 
+    filters: list = [
+        *ids_filter(Match.round_id, round_ids, "round_ids"),
+        *ids_filter(Match.stadium_id, stadium_ids, "stadium_ids"),
+    ]
+    if teams := parse_ids(team_ids, "team_ids"):
+        filters.append(
+            Match.home_team_id.in_(teams) | Match.away_team_id.in_(teams)
+        )
+    if round_id is not None:
+        filters.append(Match.round_id == round_id)
+    if team_id is not None:
+        filters.append(
+            (Match.home_team_id == team_id) | (Match.away_team_id == team_id)
+        )
+
+    matches: list = fetch(
+        session, statement.offset(skip).limit(limit).where(*filters)
+    )
+    return list_response("matches", matches, paths, schema, media_type)
 
-@router.get("/{match_id}", response_model=MatchModel)
+
+@router.get(
+    "/{match_id}",
+    response_model=MatchExpanded,
+    response_model_exclude_unset=True,
+)
 def get_match(
     match_id: int,
-    session: Session = Depends(get_session),
+    expand: str = "",
+    fields: str = "",
+    session: Session = Depends(get_read_session),
 ):
-    record = session.scalar(select(Match).where(Match.id == match_id))
+    paths: dict = parse_expand(Match, expand)
+    selected: tuple[str, ...] = parse_fields(Match, fields)
+    record = fetch_one(
+        session,
+        select_by_id(Match, paths, selected),
+        {"id": match_id},
+    )
     if not record:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND,
             detail="Match not found",
         )
 
-    return record
+    schema: type[BaseModel] = record_schema(Match, selected)
+    content: dict = dump(record, paths, schema)
+    return json_response(content) if selected else content
 
 
 @router.put("/{match_id}", response_model=MatchModel)
@@ -152,7 +215,7 @@ def update_match(
     session: Session = Depends(get_session),
 ):
     try:
-        record = session.scalar(select(Match).where(Match.id == match_id))
+        record = session.scalar(lookup(Match), {"id": match_id})
         if not record:
             raise HTTPException(
                 status_code=HTTPStatus.NOT_FOUND,
@@ -160,7 +223,7 @@ def update_match(
             )
 
         stadium = session.scalars(
-            select(Stadium).where(Stadium.id == match.stadium_id)
+            lookup(Stadium), {"id": match.stadium_id}
         ).first()
         if not stadium:
             raise HTTPException(
@@ -168,9 +231,7 @@ def update_match(
                 detail="Stadium not found",
             )
 
-        round = session.scalars(
-            select(Round).where(Round.id == match.round_id)
-        ).first()
+        round = session.scalars(lookup(Round), {"id": match.round_id}).first()
         if not round:
             raise HTTPException(
                 status_code=HTTPStatus.BAD_REQUEST,
@@ -178,7 +239,7 @@ def update_match(
             )
 
         home = session.scalars(
-            select(Team).where(Team.id == match.home_team_id)
+            lookup(Team), {"id": match.home_team_id}
         ).first()
         if not home:
             raise HTTPException(
@@ -187,7 +248,7 @@ def update_match(
             )
 
         away = session.scalars(
-            select(Team).where(Team.id == match.away_team_id)
+            lookup(Team), {"id": match.away_team_id}
         ).first()
         if not away:
             raise HTTPException(
@@ -226,7 +287,7 @@ def delete_match(
     session: Session = Depends(get_session),
 ):
     try:
-        record = session.scalar(select(Match).where(Match.id == match_id))
+        record = session.scalar(lookup(Match), {"id": match_id})
 
         if not record:
             raise HTTPException(
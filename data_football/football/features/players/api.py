@@ -2,21 +2,46 @@ import logging
 from http import HTTPStatus
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import and_, select
+from pydantic import BaseModel
+from sqlalchemy import Select, and_
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from football.adapters.database import get_session
+from football.adapters.database import (
+    SessionRoute,
+    get_read_session,
+    get_session,
+)
 from football.adapters.models import Player, Team
+from football.adapters.queries import (
+    dump,
+    fetch,
+    fetch_one,
+    ids_filter,
+    lookup,
+    order_by_ids,
+    parse_expand,
+    parse_fields,
+    parse_ids,
+    record_schema,
+    select_by_id,
+    select_records,
+)
 from football.domain.entities import (
     Message,
     PlayerBase,
+    PlayerExpanded,
     PlayerList,
     PlayerModel,
 )
+from football.responses import (
+    json_response,
+    list_response,
+    negotiate_media_type,
+)
 from football.utils import update_object
 
-router: APIRouter = APIRouter()
+router: APIRouter = APIRouter(route_class=SessionRoute)
 logger: logging.Logger = logging.getLogger(__name__)
 
 
@@ -26,9 +51,7 @@ def create_player(
     session: Session = Depends(get_session),
 ):
     try:
-        team = session.scalar(
-            select(Team).where(Team.id == player.current_team_id)
-        )
+        team = session.scalar(lookup(Team), {"id": player.current_team_id})
 
         if not team:
             raise HTTPException(
@@ -52,63 +75,109 @@ def create_player(
     return new_player
 
 
-@router.get("/", response_model=PlayerList)
-def get_players(
+@router.get("/", response_model=PlayerList, response_model_exclude_unset=True)
+def get_players(  # noqa: PLR0913, PLR0917
     skip: int = 0,
     limit: int = 100,
     name: str = "",
-    session: Session = Depends(get_session),
+    expand: str = "",
+    ids: str = "",
+    team_ids: str = "",
+    fields: str = "",
+    media_type: str = Depends(negotiate_media_type),
+    session: Session = Depends(get_read_session),
 ):
-    players: list[Player] = session.scalars(
-        select(Player)
-        .offset(skip)
-        .limit(limit)
-        .where(Player.name.contains(name))
-        .order_by(Player.name)
-    ).all()
-    return {"players": players}
+    paths: dict = parse_expand(Player, expand)
+    selected: tuple[str, ...] = parse_fields(Player, fields)
+    schema: type[BaseModel] = record_schema(Player, selected)
+    statement: Select = select_records(Player, paths, selected)
+    if requested := parse_ids(ids):
+        records: list = fetch(
+            session, statement.where(Player.id.in_(requested))
+        )
+        found, missing = order_by_ids(records, requested)
+        return list_response(
+            "players", found, paths, schema, media_type, missing
+        )
+    else:
+        players: list = fetch(
+            session,
+            statement.offset(skip)
+            .limit(limit)
+            .where(
+                Player.name.contains(name),
+                *ids_filter(Player.current_team_id, team_ids, "team_ids"),
+            )
+            .order_by(Player.name),
+        )
+        return list_response("players", players, paths, schema, media_type)
 
 
-@router.get("/team/{team_id}", response_model=PlayerList)
-def get_players_by_team(
+@router.get(
+    "/team/{team_id}",
+    response_model=PlayerList,
+    response_model_exclude_unset=True,
+)
+def get_players_by_team(  # noqa: PLR0913, PLR0917
     team_id: int,
     skip: int = 0,
     limit: int = 100,
     name: str = "",
-    session: Session = Depends(get_session),
+    expand: str = "",
+    fields: str = "",
+    media_type: str = Depends(negotiate_media_type),
+    session: Session = Depends(get_read_session),
 ):
-    team = session.scalar(select(Team).where(Team.id == team_id))
+    paths: dict = parse_expand(Player, expand)
+    selected: tuple[str, ...] = parse_fields(Player, fields)
+    team = session.scalar(lookup(Team), {"id": team_id})
     if not team:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND,
             detail="Team not found",
         )
 
-    players: list[Player] = session.scalars(
-        select(Player)
+    players: list = fetch(
+        session,
+        select_records(Player, paths, selected)
         .offset(skip)
         .limit(limit)
         .where(
             and_(Player.current_team_id == team_id, Player.name.contains(name))
         )
-        .order_by(Player.name)
-    ).all()
-    return {"players": players}
+        .order_by(Player.name),
+    )
+    schema: type[BaseModel] = record_schema(Player, selected)
+    return list_response("players", players, paths, schema, media_type)
 
 
-@router.get("/{player_id}", response_model=PlayerModel)
+@router.get(
+    "/{player_id}",
+    response_model=PlayerExpanded,
+    response_model_exclude_unset=True,
+)
 def get_player(
     player_id: int,
-    session: Session = Depends(get_session),
+    expand: str = "",
+    fields: str = "",
+    session: Session = Depends(get_read_session),
 ):
-    record = session.scalar(select(Player).where(Player.id == player_id))
+    paths: dict = parse_expand(Player, expand)
+    selected: tuple[str, ...] = parse_fields(Player, fields)
+    record = fetch_one(
+        session,
+        select_by_id(Player, paths, selected),
+        {"id": player_id},
+    )
     if not record:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND,
             detail="Player not found",
         )
 
-    return record
+    schema: type[BaseModel] = record_schema(Player, selected)
+    content: dict = dump(record, paths, schema)
+    return json_response(content) if selected else content
 
 
 @router.put("/{player_id}", response_model=PlayerModel)
@@ -118,16 +187,14 @@ def update_player(
     session: Session = Depends(get_session),
 ):
     try:
-        record = session.scalar(select(Player).where(Player.id == player_id))
+        record = session.scalar(lookup(Player), {"id": player_id})
         if not record:
             raise HTTPException(
                 status_code=HTTPStatus.NOT_FOUND,
                 detail="Player not found",
             )
 
-        team = session.scalar(
-            select(Team).where(Team.id == player.current_team_id)
-        )
+        team = session.scalar(lookup(Team), {"id": player.current_team_id})
         if not team:
             raise HTTPException(
                 status_code=HTTPStatus.NOT_FOUND,
@@ -156,7 +223,7 @@ def delete_player(
     session: Session = Depends(get_session),
 ):
     try:
-        record = session.scalar(select(Player).where(Player.id == player_id))
+        record = session.scalar(lookup(Player), {"id": player_id})
 
         if not record:
             raise HTTPException(
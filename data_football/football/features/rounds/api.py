@@ -2,21 +2,44 @@ import logging
 from http import HTTPStatus
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from pydantic import BaseModel
+from sqlalchemy import Select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from football.adapters.database import get_session
+from football.adapters.database import (
+    SessionRoute,
+    get_read_session,
+    get_session,
+)
 from football.adapters.models import Championship, Round
+from football.adapters.queries import (
+    dump,
+    fetch,
+    fetch_one,
+    ids_filter,
+    lookup,
+    order_by_ids,
+    parse_fields,
+    parse_ids,
+    record_schema,
+    select_by_id,
+    select_records,
+)
 from football.domain.entities import (
     Message,
     RoundBase,
     RoundList,
     RoundModel,
 )
+from football.responses import (
+    json_response,
+    list_response,
+    negotiate_media_type,
+)
 from football.utils import update_object
 
-router: APIRouter = APIRouter()
+router: APIRouter = APIRouter(route_class=SessionRoute)
 logger: logging.Logger = logging.getLogger(__name__)
 
 
@@ -28,9 +51,7 @@ def create_round(
     try:
         new_round: Round = Round(**round.model_dump())
         championship = session.scalars(
-            select(Championship).where(
-                Championship.id == round.championship_id
-            )
+            lookup(Championship), {"id": round.championship_id}
         ).first()
         new_round.championship = championship
 
@@ -47,29 +68,59 @@ def create_round(
     return new_round
 
 
-@router.get("/", response_model=RoundList)
-def get_rounds(
+@router.get("/", response_model=RoundList, response_model_exclude_unset=True)
+def get_rounds(  # noqa: PLR0913, PLR0917
     skip: int = 0,
     limit: int = 100,
-    session: Session = Depends(get_session),
+    ids: str = "",
+    championship_ids: str = "",
+    fields: str = "",
+    media_type: str = Depends(negotiate_media_type),
+    session: Session = Depends(get_read_session),
 ):
-    rounds: list[Round] = session.scalars(
-        select(Round).offset(skip).limit(limit)
-    ).all()
-    return {"rounds": rounds}
+    selected: tuple[str, ...] = parse_fields(Round, fields)
+    schema: type[BaseModel] = record_schema(Round, selected)
+    statement: Select = select_records(Round, {}, selected)
+    if requested := parse_ids(ids):
+        records: list = fetch(
+            session, statement.where(Round.id.in_(requested))
+        )
+        found, missing = order_by_ids(records, requested)
+        return list_response("rounds", found, {}, schema, media_type, missing)
+    else:
+        rounds: list = fetch(
+            session,
+            statement.offset(skip)
+            .limit(limit)
+            .where(
+                *ids_filter(
+                    Round.championship_id, championship_ids, "championship_ids"
+                )
+            ),
+        )
+        return list_response("rounds", rounds, {}, schema, media_type)
 
 
 @router.get("/{round_id}", response_model=RoundModel)
 def get_round(
     round_id: int,
-    session: Session = Depends(get_session),
+    fields: str = "",
+    session: Session = Depends(get_read_session),
 ):
-    record = session.scalar(select(Round).where(Round.id == round_id))
+    selected: tuple[str, ...] = parse_fields(Round, fields)
+    record = fetch_one(
+        session,
+        select_by_id(Round, {}, selected),
+        {"id": round_id},
+    )
     if not record:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND, detail="Round not found"
         )
 
+    if selected:
+        schema: type[BaseModel] = record_schema(Round, selected)
+        return json_response(dump(record, {}, schema))
     return record
 
 
@@ -80,16 +131,14 @@ def update_round(
     session: Session = Depends(get_session),
 ):
     try:
-        record = session.scalar(select(Round).where(Round.id == round_id))
+        record = session.scalar(lookup(Round), {"id": round_id})
         if not record:
             raise HTTPException(
                 status_code=HTTPStatus.NOT_FOUND, detail="Round not found"
             )
 
         championship = session.scalar(
-            select(Championship).where(
-                Championship.id == record.championship_id
-            )
+            lookup(Championship), {"id": record.championship_id}
         )
         if not championship:
             raise HTTPException(
@@ -119,7 +168,7 @@ def delete_round(
     session: Session = Depends(get_session),
 ):
     try:
-        record = session.scalar(select(Round).where(Round.id == round_id))
+        record = session.scalar(lookup(Round), {"id": round_id})
 
         if not record:
             raise HTTPException(
@@ -2,21 +2,43 @@ import logging
 from http import HTTPStatus
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from pydantic import BaseModel
+from sqlalchemy import Select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from football.adapters.database import get_session
+from football.adapters.database import (
+    SessionRoute,
+    get_read_session,
+    get_session,
+)
 from football.adapters.models import Stadium
+from football.adapters.queries import (
+    dump,
+    fetch,
+    fetch_one,
+    lookup,
+    order_by_ids,
+    parse_fields,
+    parse_ids,
+    record_schema,
+    select_by_id,
+    select_records,
+)
 from football.domain.entities import (
     Message,
     StadiumBase,
     StadiumList,
     StadiumModel,
 )
+from football.responses import (
+    json_response,
+    list_response,
+    negotiate_media_type,
+)
 from football.utils import update_object
 
-router: APIRouter = APIRouter()
+router: APIRouter = APIRouter(route_class=SessionRoute)
 logger: logging.Logger = logging.getLogger(__name__)
 
 
@@ -27,7 +49,7 @@ def create_stadium(
 ):
     try:
         record = session.scalar(
-            select(Stadium).where(Stadium.name == stadium.name)
+            lookup(Stadium, "name"), {"name": stadium.name}
         )
         if record:
             raise HTTPException(
@@ -50,36 +72,62 @@ def create_stadium(
     return new_stadium
 
 
-@router.get("/", response_model=StadiumList)
-def get_stadiums(
+@router.get("/", response_model=StadiumList, response_model_exclude_unset=True)
+def get_stadiums(  # noqa: PLR0913, PLR0917
     skip: int = 0,
     limit: int = 100,
     name: str = "",
     country: str = "",
-    session: Session = Depends(get_session),
+    ids: str = "",
+    fields: str = "",
+    media_type: str = Depends(negotiate_media_type),
+    session: Session = Depends(get_read_session),
 ):
-    stadiums: list[Stadium] = session.scalars(
-        select(Stadium)
-        .offset(skip)
-        .limit(limit)
-        .where(Stadium.name.contains(name) & Stadium.country.contains(country))
-        .order_by(Stadium.name)
-    ).all()
-    return {"stadiums": stadiums}
+    selected: tuple[str, ...] = parse_fields(Stadium, fields)
+    schema: type[BaseModel] = record_schema(Stadium, selected)
+    statement: Select = select_records(Stadium, {}, selected)
+    if requested := parse_ids(ids):
+        records: list = fetch(
+            session, statement.where(Stadium.id.in_(requested))
+        )
+        found, missing = order_by_ids(records, requested)
+        return list_response(
+            "stadiums", found, {}, schema, media_type, missing
+        )
+    else:
+        stadiums: list = fetch(
+            session,
+            statement.offset(skip)
+            .limit(limit)
+            .where(
+                Stadium.name.contains(name) & Stadium.country.contains(country)
+            )
+            .order_by(Stadium.name),
+        )
+        return list_response("stadiums", stadiums, {}, schema, media_type)
 
 
 @router.get("/{stadium_id}", response_model=StadiumModel)
 def get_stadium(
     stadium_id: int,
-    session: Session = Depends(get_session),
+    fields: str = "",
+    session: Session = Depends(get_read_session),
 ):
-    record = session.scalar(select(Stadium).where(Stadium.id == stadium_id))
+    selected: tuple[str, ...] = parse_fields(Stadium, fields)
+    record = fetch_one(
+        session,
+        select_by_id(Stadium, {}, selected),
+        {"id": stadium_id},
+    )
     if not record:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND,
             detail="Stadium not found",
         )
 
+    if selected:
+        schema: type[BaseModel] = record_schema(Stadium, selected)
+        return json_response(dump(record, {}, schema))
     return record
 
 
@@ -90,9 +138,7 @@ def update_stadium(
     session: Session = Depends(get_session),
 ):
     try:
-        record = session.scalar(
-            select(Stadium).where(Stadium.id == stadium_id)
-        )
+        record = session.scalar(lookup(Stadium), {"id": stadium_id})
         if not record:
             raise HTTPException(
                 status_code=HTTPStatus.NOT_FOUND,
@@ -119,9 +165,7 @@ def delete_stadium(
     session: Session = Depends(get_session),
 ):
     try:
-        record = session.scalar(
-            select(Stadium).where(Stadium.id == stadium_id)
-        )
+        record = session.scalar(lookup(Stadium), {"id": stadium_id})
 
         if not record:
             raise HTTPException(
@@ -1,36 +1,62 @@
 import logging
 from http import HTTPStatus
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import BaseModel
+from pydantic_core import to_json
+from sqlalchemy import Select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from football.adapters.database import get_session
+from football.adapters.cache import cache
+from football.adapters.database import (
+    SessionRoute,
+    get_read_session,
+    get_session,
+    reads_primary,
+)
 from football.adapters.models import Team
+from football.adapters.queries import (
+    dump,
+    fetch,
+    fetch_one,
+    lookup,
+    order_by_ids,
+    parse_fields,
+    parse_ids,
+    record_schema,
+    select_by_id,
+    select_records,
+)
 from football.domain.entities import (
     Message,
     TeamBase,
     TeamList,
     TeamModel,
 )
+from football.responses import (
+    json_body_response,
+    json_response,
+    list_response,
+    negotiate_media_type,
+)
 from football.utils import update_object
 
-router: APIRouter = APIRouter()
+router: APIRouter = APIRouter(route_class=SessionRoute)
 logger: logging.Logger = logging.getLogger(__name__)
 
 
 @router.post("/", status_code=HTTPStatus.CREATED, response_model=TeamModel)
 def create_team(team: TeamBase, session: Session = Depends(get_session)):
     try:
-        record = session.scalar(select(Team).where((Team.name == team.name)))
+        record = session.scalar(lookup(Team, "name"), {"name": team.name})
         if record:
             raise HTTPException(
                 status_code=HTTPStatus.BAD_REQUEST,
                 detail=f"Team with name '{team.name}' already exists",
             )
 
-        record = session.scalar(select(Team).where((Team.code == team.code)))
+        record = session.scalar(lookup(Team, "code"), {"code": team.code})
         if record:
             raise HTTPException(
                 status_code=HTTPStatus.BAD_REQUEST,
@@ -52,36 +78,70 @@ def create_team(team: TeamBase, session: Session = Depends(get_session)):
     return new_team
 
 
-@router.get("/", response_model=TeamList)
-def get_teams(
+@router.get("/", response_model=TeamList, response_model_exclude_unset=True)
+def get_teams(  # noqa: PLR0913, PLR0917
     skip: int = 0,
     limit: int = 100,
     name: str = "",
     code: str = "",
-    session: Session = Depends(get_session),
+    ids: str = "",
+    fields: str = "",
+    media_type: str = Depends(negotiate_media_type),
+    session: Session = Depends(get_read_session),
 ):
-    teams: list[Team] = session.scalars(
-        select(Team)
-        .offset(skip)
-        .limit(limit)
-        .where(Team.name.contains(name) & Team.code.contains(code))
-        .order_by(Team.name)
-    ).all()
-    return {"teams": teams}
+    selected: tuple[str, ...] = parse_fields(Team, fields)
+    schema: type[BaseModel] = record_schema(Team, selected)
+    statement: Select = select_records(Team, {}, selected)
+    if requested := parse_ids(ids):
+        records: list = fetch(session, statement.where(Team.id.in_(requested)))
+        found, missing = order_by_ids(records, requested)
+        return list_response("teams", found, {}, schema, media_type, missing)
+    else:
+        teams: list = fetch(
+            session,
+            statement.offset(skip)
+            .limit(limit)
+            .where(Team.name.contains(name) & Team.code.contains(code))
+            .order_by(Team.name),
+        )
+        return list_response("teams", teams, {}, schema, media_type)
 
 
 @router.get("/{team_id}", response_model=TeamModel)
 def get_team(
     team_id: int,
-    session: Session = Depends(get_session),
+    request: Request,
+    fields: str = "",
+    session: Session = Depends(get_read_session),
+    primary: Session = Depends(get_session),
 ):
-    record = session.scalar(select(Team).where(Team.id == team_id))
+    selected: tuple[str, ...] = parse_fields(Team, fields)
+    # Filled from the primary only, a lagging replica would put back what
+    # a commit just evicted. Clients reading their writes bypass it, and
+    # without a cache the replica serves the read.
+    cached: bool = (
+        cache.enabled and not selected and not reads_primary(request)
+    )
+    if cached and (body := cache.get("teams", team_id)) is not None:
+        return json_body_response(body)
+
+    record = fetch_one(
+        primary if cached else session,
+        select_by_id(Team, {}, selected),
+        {"id": team_id},
+    )
     if not record:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND, detail="Team not found"
         )
 
-    return record
+    if selected:
+        schema: type[BaseModel] = record_schema(Team, selected)
+        return json_response(dump(record, {}, schema))
+    body = to_json(dump(record, {}, TeamModel))
+    if cached:
+        cache.set("teams", team_id, value=body)
+    return json_body_response(body)
 
 
 @router.put("/{team_id}", response_model=TeamModel)
@@ -91,7 +151,7 @@ def update_team(
     session: Session = Depends(get_session),
 ):
     try:
-        record = session.scalar(select(Team).where(Team.id == team_id))
+        record = session.scalar(lookup(Team), {"id": team_id})
         if not record:
             raise HTTPException(
                 status_code=HTTPStatus.NOT_FOUND, detail="Team not found"
@@ -114,7 +174,7 @@ def update_team(
 @router.delete("/{team_id}", response_model=Message)
 def delete_team(team_id: int, session: Session = Depends(get_session)):
     try:
-        record = session.scalar(select(Team).where(Team.id == team_id))
+        record = session.scalar(lookup(Team), {"id": team_id})
 
         if not record:
             raise HTTPException(
@@ -6,8 +6,13 @@ from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from football.adapters.database import get_session
+from football.adapters.database import (
+    SessionRoute,
+    get_read_session,
+    get_session,
+)
 from football.adapters.models import User
+from football.adapters.queries import lookup
 from football.domain.entities import (
     Message,
     UserBase,
@@ -16,7 +21,7 @@ from football.domain.entities import (
 )
 from football.utils import update_object
 
-router: APIRouter = APIRouter()
+router: APIRouter = APIRouter(route_class=SessionRoute)
 logger: logging.Logger = logging.getLogger(__name__)
 
 
@@ -26,7 +31,7 @@ def create_user(
     session: Session = Depends(get_session),
 ):
     try:
-        record = session.scalar(select(User).where(User.email == user.email))
+        record = session.scalar(lookup(User, "email"), {"email": user.email})
         if record:
             raise HTTPException(
                 status_code=HTTPStatus.BAD_REQUEST,
@@ -52,7 +57,7 @@ def create_user(
 def get_users(
     skip: int = 0,
     limit: int = 100,
-    session: Session = Depends(get_session),
+    session: Session = Depends(get_read_session),
 ):
     users: list[User] = session.scalars(
         select(User).offset(skip).limit(limit)
@@ -63,9 +68,9 @@ def get_users(
 @router.get("/{user_id}", response_model=UserPublic)
 def get_user(
     user_id: int,
-    session: Session = Depends(get_session),
+    session: Session = Depends(get_read_session),
 ):
-    record = session.scalar(select(User).where(User.id == user_id))
+    record = session.scalar(lookup(User), {"id": user_id})
     if not record:
         raise HTTPException(
             status_code=HTTPStatus.NOT_FOUND, detail="User not found"
@@ -81,7 +86,7 @@ def update_user(
     session: Session = Depends(get_session),
 ):
     try:
-        record = session.scalar(select(User).where(User.id == user_id))
+        record = session.scalar(lookup(User), {"id": user_id})
         if not record:
             raise HTTPException(
                 status_code=HTTPStatus.NOT_FOUND, detail="User not found"
@@ -104,7 +109,7 @@ def update_user(
 @router.delete("/{user_id}", response_model=Message)
 def delete_user(user_id: int, session: Session = Depends(get_session)):
     try:
-        record = session.scalar(select(User).where(User.id == user_id))
+        record = session.scalar(lookup(User), {"id": user_id})
 
         if not record:
             raise HTTPException(
@@ -0,0 +1,288 @@
+from bisect import bisect_left
+from threading import Lock
+
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+QUERY_BUCKETS: tuple[float, ...] = (0, 1, 2, 5, 10, 20, 50, 100)
+
+
+def escape(value: object) -> str:
+    text: str = str(value).replace("\\", "\\\\").replace("\n", "\\n")
+    return text.replace('"', '\\"')
+
+
+def format_labels(names: tuple[str, ...], values: tuple) -> str:
+    if not names:
+        return ""
+    pairs: str = ",".join(
+        f'{name}="{escape(value)}"' for name, value in zip(names, values)
+    )
+    return f"{{{pairs}}}"
+
+
+def format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+class Metric:
+    kind: str = "untyped"
+
+    def __init__(self, name: str, description: str, labels: tuple = ()):
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self.values: dict[tuple, float] = {}
+        self.lock = Lock()
+
+    def header(self) -> list[str]:
+        return [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+
+    def render(self) -> list[str]:
+        with self.lock:
+            values: list = sorted(self.values.items())
+        return [
+            *self.header(),
+            *(
+                f"{self.name}{format_labels(self.labels, key)} "
+                f"{format_value(value)}"
+                for key, value in values
+            ),
+        ]
+
+
+class Counter(Metric):
+    kind: str = "counter"
+
+    def inc(self, *labels, amount: float = 1) -> None:
+        with self.lock:
+            self.values[labels] = self.values.get(labels, 0) + amount
+
+
+class Gauge(Metric):
+    kind: str = "gauge"
+
+    def inc(self, *labels, amount: float = 1) -> None:
+        with self.lock:
+            self.values[labels] = self.values.get(labels, 0) + amount
+
+    def dec(self, *labels, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def set(self, *labels, value: float) -> None:
+        with self.lock:
+            self.values[labels] = value
+
+
+class Histogram(Metric):
+    kind: str = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: tuple = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, description, labels)
+        self.buckets = buckets
+        # Per label set: bucket counts (last one is +Inf), sum and count
+        self.values: dict[tuple, list] = {}
+
+    def observe(self, *labels, value: float) -> None:
+        index: int = bisect_left(self.buckets, value)
+        with self.lock:
+            series: list = self.values.get(labels)
+            if series is None:
+                series = self.values[labels] = [
+                    [0] * (len(self.buckets) + 1),
+                    0.0,
+                    0,
+                ]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> list[str]:
+        with self.lock:
+            values: list = sorted(
+                (key, ([*counts], total, count))
+                for key, (counts, total, count) in self.values.items()
+            )
+
+        lines: list[str] = self.header()
+        names: tuple[str, ...] = (*self.labels, "le")
+        for key, (counts, total, count) in values:
+            cumulative: int = 0
+            for bound, bucket in zip((*self.buckets, "+Inf"), counts):
+                cumulative += bucket
+                le: str = bound if bound == "+Inf" else format_value(bound)
+                lines.append(
+                    f"{self.name}_bucket{format_labels(names, (*key, le))}"
+                    f" {cumulative}"
+                )
+            labels: str = format_labels(self.labels, key)
+            lines.append(f"{self.name}_sum{labels} {format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self.metrics: list[Metric] = []
+        self.collectors: list = []
+
+    def register(self, metric: Metric) -> Metric:
+        self.metrics.append(metric)
+        return metric
+
+    def collector(self, function):
+        # Collectors refresh gauges that are only worth reading on scrape
+        self.collectors.append(function)
+        return function
+
+    def render(self) -> str:
+        for function in self.collectors:
+            function()
+        lines: list[str] = [
+            line for metric in self.metrics for line in metric.render()
+        ]
+        return "\n".join(lines) + "\n"
+
+
+registry: Registry = Registry()
+
+REQUESTS: Counter = registry.register(
+    Counter(
+        "http_requests_total",
+        "Total HTTP requests by method, route and status.",
+        ("method", "route", "status"),
+    )
+)
+REQUEST_DURATION: Histogram = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request latency by method and route.",
+        ("method", "route"),
+    )
+)
+REQUESTS_IN_FLIGHT: Gauge = registry.register(
+    Gauge(
+        "http_requests_in_flight",
+        "HTTP requests currently being served.",
+    )
+)
+COALESCED_REQUESTS: Counter = registry.register(
+    Counter(
+        "http_requests_coalesced_total",
+        "GET requests answered with the response of an identical one.",
+    )
+)
+REQUEST_QUERIES: Histogram = registry.register(
+    Histogram(
+        "http_request_db_queries",
+        "SQL statements executed per request by method and route.",
+        ("method", "route"),
+        buckets=QUERY_BUCKETS,
+    )
+)
+POOL_CHECKOUTS: Counter = registry.register(
+    Counter(
+        "db_pool_checkouts_total",
+        "Connections checked out of the pool.",
+    )
+)
+POOL_CONNECTIONS: Counter = registry.register(
+    Counter(
+        "db_pool_connections_total",
+        "New database connections opened by the pool.",
+    )
+)
+POOL_INVALIDATIONS: Counter = registry.register(
+    Counter(
+        "db_pool_invalidations_total",
+        "Pooled connections invalidated, by failed pings among others.",
+    )
+)
+POOL_WAIT: Histogram = registry.register(
+    Histogram(
+        "db_pool_wait_seconds",
+        "Time spent waiting for a pooled connection.",
+        buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
+    )
+)
+POOL_CHECKED_OUT: Gauge = registry.register(
+    Gauge(
+        "db_pool_checked_out",
+        "Connections currently checked out of the pool by engine.",
+        ("engine",),
+    )
+)
+POOL_CHECKED_IN: Gauge = registry.register(
+    Gauge(
+        "db_pool_checked_in",
+        "Idle connections ready in the pool by engine.",
+        ("engine",),
+    )
+)
+POOL_OVERFLOW: Gauge = registry.register(
+    Gauge(
+        "db_pool_overflow",
+        "Connections opened beyond the pool size by engine.",
+        ("engine",),
+    )
+)
+POOL_SIZE: Gauge = registry.register(
+    Gauge(
+        "db_pool_size",
+        "Configured size of the connection pool by engine.",
+        ("engine",),
+    )
+)
+REPLICAS_HEALTHY: Gauge = registry.register(
+    Gauge(
+        "db_replicas_healthy",
+        "Read replicas currently receiving reads.",
+    )
+)
+CACHE_REQUESTS: Counter = registry.register(
+    Counter(
+        "cache_requests_total",
+        "Cache lookups by namespace and result (hit or miss).",
+        ("namespace", "result"),
+    )
+)
+CACHE_ERRORS: Counter = registry.register(
+    Counter(
+        "cache_errors_total",
+        "Cache backend operations that failed and were bypassed.",
+        ("operation",),
+    )
+)
+CACHE_INVALIDATIONS: Counter = registry.register(
+    Counter(
+        "cache_invalidations_total",
+        "Committed change sets evicted from the cache, by origin.",
+        ("origin",),
+    )
+)
+CACHE_INVALIDATION_LAG: Histogram = registry.register(
+    Histogram(
+        "cache_invalidation_lag_seconds",
+        "Time from a commit on another worker to the local eviction.",
+        buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
+    )
+)
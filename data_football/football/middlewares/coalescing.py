@@ -0,0 +1,127 @@
+import asyncio
+from typing import Optional
+from urllib.parse import parse_qsl
+
+from starlette.datastructures import Headers
+from starlette.requests import cookie_parser
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from football.adapters.database import READ_PRIMARY_COOKIE, READ_PRIMARY_HEADER
+from football.metrics import COALESCED_REQUESTS
+
+# Request headers that change the response besides the URL
+VARY: tuple[str, ...] = ("accept",)
+
+
+class Flight:
+    # One execution of a GET, replayed to identical requests that arrive
+    # while it runs
+    def __init__(self, max_body_size: int):
+        self.max_body_size = max_body_size
+        self.start: Optional[Message] = None
+        self.chunks: list[bytes] = []
+        self.size: int = 0
+        self.complete: bool = False
+        self.shareable: bool = True
+        self.done: asyncio.Event = asyncio.Event()
+
+    def record(self, message: Message):
+        if not self.shareable:
+            return
+        if message["type"] == "http.response.start":
+            # Outer middlewares edit the headers in place, keep a copy
+            self.start = {**message, "headers": list(message["headers"])}
+            self.shareable = b"set-cookie" not in dict(message["headers"])
+            return
+        if message["type"] != "http.response.body":
+            return
+        body: bytes = message.get("body", b"")
+        self.size += len(body)
+        if self.size > self.max_body_size:
+            self.shareable = False
+            self.chunks.clear()
+            return
+        self.chunks.append(body)
+        self.complete = not message.get("more_body", False)
+
+    async def replay(self, send: Send):
+        await send({**self.start, "headers": list(self.start["headers"])})
+        await send(
+            {"type": "http.response.body", "body": b"".join(self.chunks)}
+        )
+
+
+class CoalescingMiddleware:
+    # Identical GETs in flight at once (same path, query parameters and
+    # VARY headers) run the handler once and share its response. Per
+    # worker, the cache spreads results across workers.
+    def __init__(self, app: ASGIApp, max_body_size: int = 4 * 1024 * 1024):
+        self.app = app
+        self.max_body_size = max_body_size
+        self.flights: dict[tuple, Flight] = {}
+
+    @staticmethod
+    def key(scope: Scope) -> Optional[tuple]:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            return None
+        headers: Headers = Headers(scope=scope)
+        # Clients reading their own writes must not get an older answer
+        if READ_PRIMARY_HEADER in headers or READ_PRIMARY_COOKIE in (
+            cookie_parser(headers.get("cookie", ""))
+        ):
+            return None
+        # Parameter order is irrelevant, the order of repeated ones is not
+        query: list[tuple[str, str]] = sorted(
+            parse_qsl(
+                scope["query_string"].decode("latin-1"),
+                keep_blank_values=True,
+            ),
+            key=lambda pair: pair[0],
+        )
+        return (
+            scope["path"],
+            tuple(query),
+            *(headers.get(name, "") for name in VARY),
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        key: Optional[tuple] = self.key(scope)
+        if key is None:
+            await self.app(scope, receive, send)
+            return
+
+        flight: Optional[Flight] = self.flights.get(key)
+        if flight is not None:
+            await flight.done.wait()
+            if flight.shareable and flight.complete:
+                COALESCED_REQUESTS.inc()
+                await flight.replay(send)
+                return
+            # Failed, streamed or too large, this request runs on its own
+            await self.app(scope, receive, send)
+            return
+
+        flight = self.flights[key] = Flight(self.max_body_size)
+
+        def land():
+            # A later request may already fly under the same key
+            if self.flights.get(key) is flight:
+                del self.flights[key]
+            flight.done.set()
+
+        async def recorder(message: Message):
+            # Recorded first, the followers get the response even if this
+            # client went away
+            flight.record(message)
+            # Followers leave with the last body chunk, not after the
+            # background tasks that run once it is sent
+            if message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                land()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, recorder)
+        finally:
+            land()
@@ -0,0 +1,230 @@
+import gzip
+import hashlib
+import zlib
+from collections import OrderedDict
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+COMPRESSIBLE_TYPES: tuple[str, ...] = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "application/msgpack",
+    "application/vnd.apache.arrow.stream",
+)
+
+
+class GzipStream:
+    def __init__(self, level: int):
+        self.compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self.compressor.compress(data) + self.compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self) -> bytes:
+        return self.compressor.flush()
+
+
+class BrotliStream:
+    def __init__(self, level: int):
+        self.compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self.compressor.process(data) + self.compressor.flush()
+
+    def finish(self) -> bytes:
+        return self.compressor.finish()
+
+
+class ZstdStream:
+    def __init__(self, level: int):
+        self.compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self.compressor.compress(data) + self.compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+
+    def finish(self) -> bytes:
+        return self.compressor.flush()
+
+
+def compress(encoding: str, body: bytes, level: int) -> bytes:
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=level).compress(body)
+    if encoding == "br":
+        return brotli.compress(body, quality=level)
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+STREAMS: dict[str, type] = {"gzip": GzipStream}
+if brotli:
+    STREAMS["br"] = BrotliStream
+if zstandard:
+    STREAMS["zstd"] = ZstdStream
+
+# Preferred encoding first when the client weights them equally
+PREFERENCE: tuple[str, ...] = ("zstd", "br", "gzip")
+
+
+def negotiate(accept_encoding: str, available: tuple[str, ...]) -> str:
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality: float = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        weights[name.strip().lower()] = quality
+
+    best, best_quality = "", 0.0
+    for encoding in available:
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class CompressionMiddleware:
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        levels: dict[str, int] = None,
+        cache_size: int = 8 * 1024 * 1024,
+        encodings: tuple[str, ...] = PREFERENCE,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels: dict[str, int] = {"gzip": 6, "br": 4, "zstd": 3}
+        self.levels.update(levels or {})
+        self.encodings: tuple[str, ...] = tuple(
+            encoding for encoding in encodings if encoding in STREAMS
+        )
+        self.cache_size = cache_size
+        self.cache: OrderedDict[tuple[str, bytes], bytes] = OrderedDict()
+        self.cache_bytes: int = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers: Headers = Headers(scope=scope)
+        encoding: str = negotiate(
+            headers.get("accept-encoding", ""), self.encodings
+        )
+        if not encoding:
+            await self.app(scope, receive, send)
+            return
+
+        responder = CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder)
+
+    def compress(self, encoding: str, body: bytes) -> bytes:
+        # Identical payloads (e.g. cached responses) are compressed once
+        key: tuple[str, bytes] = (
+            encoding,
+            hashlib.blake2b(body, digest_size=16).digest(),
+        )
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+
+        compressed: bytes = compress(encoding, body, self.levels[encoding])
+        if len(compressed) <= self.cache_size:
+            self.cache[key] = compressed
+            self.cache_bytes += len(compressed)
+            while self.cache_bytes > self.cache_size:
+                _, evicted = self.cache.popitem(last=False)
+                self.cache_bytes -= len(evicted)
+        return compressed
+
+
+class CompressionResponder:
+    def __init__(
+        self, middleware: CompressionMiddleware, encoding: str, send: Send
+    ):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.send = send
+        self.start: Message = None
+        self.stream = None
+        self.passthrough: bool = False
+
+    async def __call__(self, message: Message):
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        if self.passthrough:
+            await self.send(message)
+            return
+        if self.stream:
+            await self.send_chunk(message)
+            return
+
+        headers: MutableHeaders = MutableHeaders(raw=self.start["headers"])
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+        if not self.compressible(headers) or (
+            not more_body and len(body) < self.middleware.minimum_size
+        ):
+            self.passthrough = True
+            await self.send(self.start)
+            await self.send(message)
+            return
+
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if not more_body:
+            compressed: bytes = self.middleware.compress(self.encoding, body)
+            headers["Content-Length"] = str(len(compressed))
+            await self.send(self.start)
+            await self.send({"type": "http.response.body", "body": compressed})
+            return
+
+        del headers["Content-Length"]
+        self.stream = STREAMS[self.encoding](
+            self.middleware.levels[self.encoding]
+        )
+        await self.send(self.start)
+        await self.send_chunk(message)
+
+    async def send_chunk(self, message: Message):
+        chunk: bytes = self.stream.compress(message.get("body", b""))
+        more_body: bool = message.get("more_body", False)
+        if not more_body:
+            chunk += self.stream.finish()
+        await self.send(
+            {
+                "type": "http.response.body",
+                "body": chunk,
+                "more_body": more_body,
+            }
+        )
+
+    def compressible(self, headers: MutableHeaders) -> bool:
+        if "content-encoding" in headers or self.start["status"] in {204, 304}:
+            return False
+        content_type: str = headers.get("content-type", "")
+        return content_type.startswith(COMPRESSIBLE_TYPES)
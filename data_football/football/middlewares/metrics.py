@@ -0,0 +1,78 @@
+import logging
+from time import perf_counter
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from football.adapters.database import QueryStats, query_stats
+from football.metrics import (
+    REQUEST_DURATION,
+    REQUEST_QUERIES,
+    REQUESTS,
+    REQUESTS_IN_FLIGHT,
+)
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class MetricsMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        exclude: tuple[str, ...] = ("/metrics",),
+        debug: bool = False,
+        repeat_threshold: int = 3,
+    ):
+        self.app = app
+        self.exclude = exclude
+        self.debug = debug
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"] in self.exclude:
+            await self.app(scope, receive, send)
+            return
+
+        status: int = 500
+        # Parameters are only collected for the N+1 warnings
+        stats: QueryStats = QueryStats(scope, track_statements=self.debug)
+
+        async def send_with_status(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.debug:
+                    headers = MutableHeaders(scope=message)
+                    headers["X-DB-Queries"] = str(stats.count)
+                    headers["X-DB-Time"] = f"{stats.duration * 1000:.3f}"
+            await send(message)
+
+        token = query_stats.set(stats)
+        REQUESTS_IN_FLIGHT.inc()
+        started: float = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration: float = perf_counter() - started
+            REQUESTS_IN_FLIGHT.dec()
+            query_stats.reset(token)
+
+            # Route templates keep the label set bounded, unlike raw paths
+            route: str = getattr(scope.get("route"), "path", "unmatched")
+            method: str = scope["method"]
+            REQUESTS.inc(method, route, status)
+            REQUEST_DURATION.observe(method, route, value=duration)
+            REQUEST_QUERIES.observe(method, route, value=stats.count)
+
+            if self.debug:
+                for statement, times in stats.repeated(
+                    self.repeat_threshold
+                ).items():
+                    logger.warning(
+                        "Possible N+1 on %s %s: statement ran %d times "
+                        "with different parameters: %s",
+                        method,
+                        route,
+                        times,
+                        statement,
+                    )
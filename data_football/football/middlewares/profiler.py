@@ -0,0 +1,133 @@
+import hmac
+import json
+import re
+from datetime import datetime
+from http import HTTPStatus
+from pathlib import Path
+from typing import Optional
+from uuid import uuid4
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders, QueryParams
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from football.adapters.database import QueryStats, query_stats
+from football.profiling import Profile, render_collapsed, speedscope
+
+FORMATS: dict[str, tuple[str, str]] = {
+    "speedscope": ("application/json", "speedscope.json"),
+    "collapsed": ("text/plain", "collapsed"),
+}
+
+
+def sql_frame(statement: str) -> str:
+    # Collapsed stacks split frames on ";" and lines on newlines
+    return "SQL " + re.sub(r"\s+", " ", statement).replace(";", ",").strip()
+
+
+class ProfilerMiddleware:
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        app: ASGIApp,
+        token: str,
+        header: str = "X-Profile",
+        parameter: str = "profile",
+        allowed_clients: tuple[str, ...] = (),
+        directory: Optional[str] = None,
+    ):
+        self.app = app
+        self.token = token
+        self.header = header
+        self.parameter = parameter
+        self.allowed_clients = allowed_clients
+        self.directory = Path(directory) if directory else None
+
+    def requested(self, scope: Scope) -> Optional[str]:
+        # The requested format, None unless an allowed caller asked for it
+        headers: Headers = Headers(scope=scope)
+        query: QueryParams = QueryParams(scope["query_string"])
+        token: str = headers.get(self.header) or query.get(self.parameter)
+        if not token or not hmac.compare_digest(token, self.token):
+            return None
+        client: str = (scope.get("client") or ("",))[0]
+        if self.allowed_clients and client not in self.allowed_clients:
+            return None
+        return (
+            headers.get(f"{self.header}-Format")
+            or query.get(f"{self.parameter}_format")
+            or "speedscope"
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not (
+            profile_format := self.requested(scope)
+        ):
+            await self.app(scope, receive, send)
+            return
+        if profile_format not in FORMATS:
+            await Response(
+                f"Unknown profile format, use one of {', '.join(FORMATS)}",
+                status_code=HTTPStatus.BAD_REQUEST,
+            )(scope, receive, send)
+            return
+
+        stats: Optional[QueryStats] = query_stats.get()
+        token = None
+        if stats is None:
+            stats = QueryStats(scope)
+            token = query_stats.set(stats)
+        stats.timings = []
+
+        status: int = 500
+        profile_id: str = f"{datetime.now():%Y%m%dT%H%M%S}-{uuid4().hex[:8]}"
+
+        async def send_or_capture(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.directory:
+                    MutableHeaders(scope=message)["X-Profile-Id"] = profile_id
+            if self.directory:
+                await send(message)
+
+        try:
+            with Profile(f"{scope['method']} {scope['path']}") as profile:
+                await self.app(scope, receive, send_or_capture)
+        finally:
+            if token is not None:
+                query_stats.reset(token)
+
+        body: str = self.render(profile, stats, status, profile_format)
+        media_type, suffix = FORMATS[profile_format]
+        if self.directory:
+            path: Path = self.directory / f"{profile_id}.{suffix}"
+            await run_in_threadpool(self.write, path, body)
+            return
+        await Response(body, media_type=media_type)(scope, receive, send)
+
+    @staticmethod
+    def render(
+        profile: Profile, stats: QueryStats, status: int, profile_format: str
+    ) -> str:
+        stacks: dict[tuple[str, ...], float] = profile.stacks()
+        if profile_format == "collapsed":
+            # SQL timings as their own tower next to the Python stacks
+            for statement, duration in stats.timings:
+                frame: tuple[str, str] = ("SQL", sql_frame(statement))
+                stacks[frame] = stacks.get(frame, 0) + duration * 1_000_000
+            return render_collapsed(stacks)
+
+        document: dict = speedscope(profile.name, stacks, "microseconds")
+        document["status"] = status
+        document["duration_ms"] = round(profile.duration * 1000, 3)
+        document["queries"] = [
+            {"statement": statement, "duration_ms": round(duration * 1000, 3)}
+            for statement, duration in stats.timings
+        ]
+        return json.dumps(document)
+
+    @staticmethod
+    def write(path: Path, body: str):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(body)
@@ -0,0 +1,44 @@
+import argparse
+import json
+import logging
+from pathlib import Path
+
+from fastapi import FastAPI
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def use_prebuilt_schema(app: FastAPI, path: str) -> bool:
+    # Serves the schema written at build time, workers never generate it
+    schema_file: Path = Path(path)
+    if not schema_file.is_file():
+        logger.warning("OpenAPI schema %s not found, generating it", path)
+        return False
+
+    def openapi() -> dict:
+        if app.openapi_schema is None:
+            app.openapi_schema = json.loads(schema_file.read_bytes())
+        return app.openapi_schema
+
+    app.openapi = openapi
+    return True
+
+
+def main(arguments: list[str] = None):
+    parser = argparse.ArgumentParser(
+        description="Write the OpenAPI schema of the app to a file"
+    )
+    parser.add_argument("output", type=Path)
+    options = parser.parse_args(arguments)
+
+    # The app module uses this one, importing it at the top would cycle
+    from football.app import app  # noqa: PLC0415
+
+    # Always generated, even when the settings point at a prebuilt file
+    app.openapi_schema = None
+    options.output.write_text(json.dumps(FastAPI.openapi(app)))
+    print(f"Schema saved to {options.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+import inspect
+import logging
+import os
+import sys
+import threading
+from collections.abc import Iterable
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from time import monotonic, perf_counter
+from types import CodeType, FrameType
+from typing import Optional
+
+from starlette.routing import BaseRoute, Route
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+SPEEDSCOPE_SCHEMA: str = "https://www.speedscope.app/file-format-schema.json"
+# Innermost frames of threads blocked waiting for work, not using CPU
+IDLE_FRAMES: frozenset[tuple[str, str]] = frozenset(
+    {
+        ("threading.py", "wait"),
+        ("queue.py", "get"),
+        ("selectors.py", "select"),
+        ("thread.py", "_worker"),
+    }
+)
+
+
+def location(filename: str) -> str:
+    # Library paths are only readable from the package onwards
+    for marker in ("site-packages/", "lib/python"):
+        if marker in filename:
+            return filename.split(marker, 1)[1]
+    try:
+        return str(Path(filename).relative_to(Path.cwd()))
+    except ValueError:
+        return filename
+
+
+def label(code: CodeType) -> str:
+    return (
+        f"{code.co_qualname} "
+        f"({location(code.co_filename)}:{code.co_firstlineno})"
+    )
+
+
+def builtin_label(function) -> str:
+    module: str = getattr(function, "__module__", None) or "builtins"
+    return f"{module}.{getattr(function, '__qualname__', repr(function))}"
+
+
+def render_collapsed(stacks: dict[tuple[str, ...], float]) -> str:
+    # One "frame;frame;frame weight" line per stack, as flamegraph.pl reads
+    return "".join(
+        f"{';'.join(stack)} {round(weight)}\n"
+        for stack, weight in sorted(stacks.items())
+        if round(weight)
+    )
+
+
+def speedscope(
+    name: str, stacks: dict[tuple[str, ...], float], unit: str = "none"
+) -> dict:
+    frames: dict[str, int] = {}
+    samples: list[list[int]] = []
+    weights: list[float] = []
+    for stack, weight in sorted(stacks.items()):
+        samples.append(
+            [frames.setdefault(frame, len(frames)) for frame in stack]
+        )
+        weights.append(weight)
+    return {
+        "$schema": SPEEDSCOPE_SCHEMA,
+        "name": name,
+        "exporter": "football",
+        "shared": {"frames": [{"name": frame} for frame in frames]},
+        "profiles": [
+            {
+                "type": "sampled",
+                "name": name,
+                "unit": unit,
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }
+        ],
+    }
+
+
+class Node:
+    __slots__ = ("children", "time")
+
+    def __init__(self):
+        self.children: dict[str, Node] = {}
+        self.time: float = 0.0
+
+
+class Profile:
+    def __init__(self, name: str):
+        self.name = name
+        self.root: Node = Node()
+        self.labels: dict[CodeType, str] = {}
+        # Per thread stack of (node, started, time spent in children)
+        self.threads: dict[int, list[list]] = {}
+        self.duration: float = 0.0
+
+    def event(self, frame: FrameType, event: str, function):
+        now: float = perf_counter()
+        stack: list[list] = self.threads.setdefault(threading.get_ident(), [])
+        if event in {"call", "c_call"}:
+            if event == "call":
+                name: str = self.labels.get(frame.f_code)
+                if name is None:
+                    name = self.labels[frame.f_code] = label(frame.f_code)
+            else:
+                name = builtin_label(function)
+            parent: Node = stack[-1][0] if stack else self.root
+            node: Node = parent.children.get(name)
+            if node is None:
+                node = parent.children[name] = Node()
+            stack.append([node, now, 0.0])
+        elif stack:
+            # Returns from frames entered before profiling have no entry
+            node, started, children = stack.pop()
+            elapsed: float = now - started
+            node.time += elapsed - children
+            if stack:
+                stack[-1][2] += elapsed
+
+    def stacks(self) -> dict[tuple[str, ...], float]:
+        # Self time in microseconds of every distinct call path
+        result: dict[tuple[str, ...], float] = {}
+        pending: list[tuple[tuple[str, ...], Node]] = [((), self.root)]
+        while pending:
+            path, node = pending.pop()
+            if path and node.time:
+                result[path] = node.time * 1_000_000
+            pending.extend(
+                ((*path, name), child) for name, child in node.children.items()
+            )
+        return result
+
+    def __enter__(self):
+        self.token = profiling.set(self)
+        self.started: float = perf_counter()
+        hook.install()
+        return self
+
+    def __exit__(self, *args):
+        hook.uninstall()
+        self.duration = perf_counter() - self.started
+        profiling.reset(self.token)
+
+
+# The profile of the current request, copied into threadpool handlers
+profiling: ContextVar[Optional[Profile]] = ContextVar(
+    "profiling", default=None
+)
+
+
+def dispatch(frame: FrameType, event: str, function):
+    # Every thread calls this while any profile is running, only frames
+    # of a profiled request's context are recorded
+    profile: Optional[Profile] = profiling.get()
+    if profile is not None:
+        profile.event(frame, event, function)
+
+
+class Hook:
+    # Concurrent profiles share one hook, installed while any is running
+    def __init__(self):
+        self.lock: threading.Lock = threading.Lock()
+        self.active: int = 0
+
+    def install(self):
+        with self.lock:
+            self.active += 1
+            if self.active == 1:
+                threading.setprofile_all_threads(dispatch)
+
+    def uninstall(self):
+        with self.lock:
+            self.active -= 1
+            if not self.active:
+                threading.setprofile_all_threads(None)
+
+
+hook: Hook = Hook()
+
+
+def route_label(route: BaseRoute, method: str = "") -> str:
+    methods: set[str] = getattr(route, "methods", None) or set()
+    method = method or min(methods - {"HEAD"} or methods or {""})
+    return f"{method} {getattr(route, 'path', '')}".strip()
+
+
+class Sampler:
+    # Samples the stacks of every busy thread from a background thread and
+    # aggregates them per route into collapsed stack files
+    def __init__(
+        self, hz: float = 50.0, directory: str = "profiles", interval=60.0
+    ):
+        self.hz: float = hz
+        self.directory: Path = Path(directory)
+        self.interval: float = interval
+        self.labels: dict[CodeType, str] = {}
+        # Handler code runs in a worker thread, matched by its code object
+        self.endpoints: dict[CodeType, str] = {}
+        self.stacks: dict[tuple[str, ...], int] = {}
+        self.busy: float = 0.0
+        self.stopped: threading.Event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    def start(self, routes: Iterable[BaseRoute] = ()):
+        for route in routes:
+            endpoint = getattr(route, "endpoint", None)
+            if endpoint is not None:
+                code: CodeType = inspect.unwrap(endpoint).__code__
+                self.endpoints[code] = route_label(route)
+        self.stopped.clear()
+        self.thread = threading.Thread(
+            target=self.run, name="football-sampler", daemon=True
+        )
+        self.thread.start()
+
+    def stop(self):
+        if self.thread is None:
+            return
+        self.stopped.set()
+        self.thread.join()
+        self.thread = None
+
+    def run(self):
+        flush_at: float = monotonic() + self.interval
+        period: float = 1 / self.hz
+        while not self.stopped.wait(period):
+            started: float = perf_counter()
+            self.sample()
+            self.busy += perf_counter() - started
+            if monotonic() >= flush_at:
+                self.flush()
+                flush_at += self.interval
+        self.flush()
+
+    def label(self, code: CodeType) -> str:
+        name: str = self.labels.get(code)
+        if name is None:
+            name = self.labels[code] = label(code)
+        return name
+
+    def sample(self):
+        current: int = threading.get_ident()
+        for ident, frame in sys._current_frames().items():
+            code: CodeType = frame.f_code
+            if ident == current or (
+                (Path(code.co_filename).name, code.co_name) in IDLE_FRAMES
+            ):
+                continue
+            key: tuple[str, ...] = self.stack(frame)
+            self.stacks[key] = self.stacks.get(key, 0) + 1
+
+    def stack(self, frame: Optional[FrameType]) -> tuple[str, ...]:
+        # Outermost frame first, under the route the thread is serving
+        labels: list[str] = []
+        route: Optional[str] = None
+        while frame is not None:
+            code: CodeType = frame.f_code
+            if route is None:
+                route = self.endpoints.get(code)
+                if route is None and code is Route.handle.__code__:
+                    # Async work on the event loop, inside Route.handle
+                    route = route_label(
+                        frame.f_locals["self"],
+                        frame.f_locals["scope"]["method"],
+                    )
+            labels.append(self.label(code))
+            frame = frame.f_back
+        labels.append(route or "unattributed")
+        return tuple(reversed(labels))
+
+    def flush(self):
+        stacks, self.stacks = self.stacks, {}
+        busy, self.busy = self.busy, 0.0
+        if not stacks:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # One file per worker process and interval
+        path: Path = self.directory / (
+            f"{datetime.now():%Y%m%dT%H%M%S}-{os.getpid()}.collapsed"
+        )
+        path.write_text(render_collapsed(stacks))
+        logger.info(
+            "Wrote %d samples to %s, sampling took %.3fs",
+            sum(stacks.values()),
+            path,
+            busy,
+        )
@@ -0,0 +1,174 @@
+import logging
+from http import HTTPStatus
+from importlib.util import find_spec
+from typing import Optional, get_args
+
+from fastapi import Header, Response
+from pydantic import BaseModel
+from pydantic_core import to_json, to_jsonable_python
+
+from football.adapters.queries import dump_all
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+JSON: str = "application/json"
+MSGPACK: str = "application/msgpack"
+ARROW: str = "application/vnd.apache.arrow.stream"
+
+MEDIA_TYPES: tuple[str, ...] = tuple(
+    media_type
+    for media_type, available in (
+        (JSON, True),
+        (MSGPACK, msgpack is not None),
+        # pyarrow takes long to import, it loads on the first Arrow response
+        (ARROW, find_spec("pyarrow") is not None),
+    )
+    if available
+)
+# Both are dependencies, a broken install falls back to JSON
+for media_type in (MSGPACK, ARROW):
+    if media_type not in MEDIA_TYPES:
+        logger.warning("%s responses disabled, library missing", media_type)
+
+
+def json_response(
+    content: object, status_code: int = HTTPStatus.OK
+) -> Response:
+    return Response(
+        content=to_json(content),
+        status_code=status_code,
+        media_type=JSON,
+    )
+
+
+def json_body_response(
+    body: bytes, status_code: int = HTTPStatus.OK
+) -> Response:
+    # Already serialized JSON, e.g. read from the cache
+    return Response(content=body, status_code=status_code, media_type=JSON)
+
+
+def revalidated_response(
+    body: bytes, age: float, stale_while_revalidate: float
+) -> Response:
+    # Proxies may keep serving it that long while they fetch a new one
+    response: Response = json_body_response(body)
+    response.headers["Age"] = str(int(age))
+    response.headers["Cache-Control"] = (
+        f"max-age=0, stale-while-revalidate={int(stale_while_revalidate)}"
+    )
+    return response
+
+
+def negotiate_media_type(accept: str = Header("*/*")) -> str:
+    best, best_rank = JSON, (0.0, 0)
+    for item in accept.split(","):
+        media_type, *params = item.split(";")
+        media_type = media_type.strip().lower()
+        quality: float = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        # q=0 means not acceptable
+        if quality <= 0:
+            continue
+
+        # Wildcards fall back to JSON but lose to an explicit media type
+        specific: int = int(media_type in MEDIA_TYPES)
+        if media_type in {"*/*", "application/*"}:
+            media_type = JSON
+        if media_type in MEDIA_TYPES and (quality, specific) > best_rank:
+            best, best_rank = media_type, (quality, specific)
+    return best
+
+
+def arrow_type(annotation: object) -> object:
+    import pyarrow  # noqa: PLC0415
+
+    arguments: tuple = get_args(annotation)
+    if arguments:
+        annotation = next(arg for arg in arguments if arg is not type(None))
+    return {
+        bool: pyarrow.bool_(),
+        int: pyarrow.int64(),
+        float: pyarrow.float64(),
+    }.get(annotation, pyarrow.string())
+
+
+def arrow_response(
+    records: list,
+    tree: dict,
+    schema: type[BaseModel],
+    missing: Optional[list[int]] = None,
+) -> Response:
+    import pyarrow  # noqa: PLC0415
+    import pyarrow.ipc  # noqa: PLC0415
+
+    metadata: dict = (
+        {"missing": to_json(missing)} if missing is not None else {}
+    )
+    if tree and records:
+        # Expanded relationships become struct columns
+        batch = pyarrow.RecordBatch.from_pylist(
+            to_jsonable_python(dump_all(records, tree, schema))
+        )
+        batch = batch.replace_schema_metadata(metadata)
+    else:
+        # Columns are built straight from the rows, no model per row
+        arrow_schema = pyarrow.schema(
+            [
+                (field, arrow_type(info.annotation))
+                for field, info in schema.model_fields.items()
+            ],
+            metadata=metadata,
+        )
+        batch = pyarrow.RecordBatch.from_arrays(
+            [
+                pyarrow.array(
+                    [record[field.name] for record in records],
+                    type=field.type,
+                )
+                for field in arrow_schema
+            ],
+            schema=arrow_schema,
+        )
+
+    sink = pyarrow.BufferOutputStream()
+    with pyarrow.ipc.new_stream(sink, batch.schema) as writer:
+        writer.write_batch(batch)
+    return Response(content=sink.getvalue().to_pybytes(), media_type=ARROW)
+
+
+def list_response(  # noqa: PLR0913, PLR0917
+    key: str,
+    records: list,
+    tree: dict,
+    schema: type[BaseModel],
+    media_type: str = JSON,
+    missing: Optional[list[int]] = None,
+) -> Response:
+    if media_type == ARROW:
+        response: Response = arrow_response(records, tree, schema, missing)
+    else:
+        content: dict = {key: dump_all(records, tree, schema)}
+        if missing is not None:
+            content["missing"] = missing
+        if media_type == MSGPACK:
+            response = Response(
+                content=msgpack.packb(to_jsonable_python(content)),
+                media_type=MSGPACK,
+            )
+        else:
+            response = json_response(content)
+    # Shared caches must not hand one format to clients of another
+    response.headers["Vary"] = "Accept"
+    return response
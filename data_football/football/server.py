@@ -0,0 +1,328 @@
+import argparse
+import asyncio
+import gc
+import importlib
+import logging
+import math
+import os
+import select
+import signal
+import socket
+import sys
+import time
+from contextlib import suppress
+from pathlib import Path
+from typing import Optional
+
+import uvicorn
+
+from football.adapters.database import ReplicaRouter, databases
+from football.settings import Settings, get_settings
+
+logger: logging.Logger = logging.getLogger("football.server")
+
+# A reloaded master finds its socket and the workers to retire here
+LISTENER_FD: str = "FOOTBALL_SERVER_FD"
+RETIRING: str = "FOOTBALL_SERVER_RETIRING"
+CPU_MAX: Path = Path("/sys/fs/cgroup/cpu.max")
+DRAIN_SECONDS: float = 0.5
+# Respawns after a crash wait twice as long each time, up to this
+MAX_BACKOFF_SECONDS: float = 30.0
+SIGNALS: frozenset[int] = frozenset(
+    {
+        signal.SIGHUP,
+        signal.SIGTERM,
+        signal.SIGINT,
+    }
+)
+
+
+def available_cpus(cpu_max: Path = CPU_MAX) -> int:
+    # Affinity covers cpusets, the cgroup quota covers docker --cpus
+    cpus: int = len(os.sched_getaffinity(0))
+    try:
+        quota, period = cpu_max.read_text().split()
+    except (OSError, ValueError):
+        return cpus
+    if quota == "max":
+        return cpus
+    return max(min(cpus, math.ceil(int(quota) / int(period))), 1)
+
+
+def worker_count(settings: Settings) -> int:
+    # Handlers are async or run in the worker's threadpool, one process
+    # per core keeps every core busy without oversubscribing them
+    return settings.SERVER_WORKERS or available_cpus()
+
+
+def pool_sizing(settings: Settings, workers: int) -> dict[str, str]:
+    # Environment overrides so every worker's pools fit the budget
+    if not settings.DATABASE_MAX_CONNECTIONS:
+        return {}
+    share: int = max(settings.DATABASE_MAX_CONNECTIONS // workers, 1)
+    return {"DATABASE_POOL_SIZE": str(share), "DATABASE_MAX_OVERFLOW": "0"}
+
+
+def preload_databases(settings: Settings, workers: int) -> ReplicaRouter:
+    # Engines and the database driver load in the master, no connection
+    # is opened yet. The pools get their share of the connection budget,
+    # so the settings are read again with it.
+    os.environ.update(pool_sizing(settings, workers))
+    get_settings.cache_clear()
+    return databases()
+
+
+def listener(host: str, port: int) -> socket.socket:
+    inherited: Optional[str] = os.environ.pop(LISTENER_FD, None)
+    if inherited:
+        sock: socket.socket = socket.socket(fileno=int(inherited))
+    else:
+        family = socket.AF_INET6 if ":" in host else socket.AF_INET
+        sock = socket.socket(family)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((host, port))
+    # Connections queue in the kernel while workers start or restart
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def worker_config(app, settings: Settings) -> uvicorn.Config:
+    return uvicorn.Config(
+        app,
+        proxy_headers=True,
+        forwarded_allow_ips=settings.SERVER_FORWARDED_ALLOW_IPS,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_TIMEOUT,
+        access_log=False,
+    )
+
+
+class Worker(uvicorn.Server):
+    def __init__(self, config: uvicorn.Config, parent: int, ready: int):
+        super().__init__(config)
+        self.parent = parent
+        self.ready = ready
+
+    async def startup(self, sockets: Optional[list[socket.socket]] = None):
+        await super().startup(sockets)
+        if self.started:
+            # Only a reload reads these, a full pipe is no reason to block
+            with suppress(BlockingIOError):
+                os.write(self.ready, b".")
+
+    async def shutdown(self, sockets: Optional[list[socket.socket]] = None):
+        # A connection accepted just before the signal may not have sent
+        # its request yet, uvicorn would close it as idle. Stop accepting
+        # and give those a moment to arrive.
+        for server in self.servers:
+            server.close()
+        await asyncio.sleep(DRAIN_SECONDS)
+        await super().shutdown(sockets)
+
+    async def on_tick(self, counter: int) -> bool:
+        # A worker whose master died stops instead of serving unsupervised
+        if os.getppid() != self.parent:
+            self.should_exit = True
+        return await super().on_tick(counter)
+
+
+class Master:
+    def __init__(
+        self, app, sock: socket.socket, workers: int, settings: Settings
+    ):
+        self.app = app
+        self.sock = sock
+        self.workers = workers
+        self.settings = settings
+        self.children: set[int] = set()
+        self.signals: list[int] = []
+        self.failures: int = 0
+        self.ready_reader, self.ready_writer = os.pipe()
+        os.set_blocking(self.ready_writer, False)
+
+    def spawn(self) -> int:
+        parent: int = os.getpid()
+        pid: int = os.fork()
+        if pid:
+            self.children.add(pid)
+            return pid
+        # Child: uvicorn handles SIGTERM and SIGINT, reloads are the
+        # master's job
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+        os.close(self.ready_reader)
+        try:
+            worker: Worker = Worker(
+                worker_config(self.app, self.settings),
+                parent,
+                self.ready_writer,
+            )
+            worker.run(sockets=[self.sock])
+        except BaseException:
+            # Never unwind into the master's code in this process
+            logger.exception("Worker %d failed", os.getpid())
+            os._exit(1)
+        # uvicorn returns quietly when the lifespan startup fails
+        os._exit(0 if worker.started else 1)
+
+    def wait_ready(self, count: int, timeout: float) -> int:
+        started: int = 0
+        deadline: float = time.monotonic() + timeout
+        while started < count:
+            remaining: float = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            readable, _, _ = select.select(
+                [self.ready_reader], [], [], remaining
+            )
+            if readable:
+                started += len(os.read(self.ready_reader, count - started))
+        return started
+
+    def reap(self) -> dict[int, int]:
+        exited: dict[int, int] = {}
+        while self.children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if not pid:
+                break
+            if pid in self.children:
+                self.children.discard(pid)
+                exited[pid] = os.waitstatus_to_exitcode(status)
+                logger.warning(
+                    "Worker %d exited with status %d", pid, exited[pid]
+                )
+        return exited
+
+    def terminate(self, pids: set[int]):
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        deadline: float = (
+            time.monotonic() + self.settings.SERVER_GRACEFUL_TIMEOUT + 5
+        )
+        remaining: set[int] = set(pids)
+        while remaining and time.monotonic() < deadline:
+            for pid in list(remaining):
+                try:
+                    done, _ = os.waitpid(pid, os.WNOHANG)
+                except ChildProcessError:
+                    done = pid
+                if done:
+                    remaining.discard(pid)
+                    self.children.discard(pid)
+            time.sleep(0.1)
+        for pid in remaining:
+            logger.warning("Worker %d did not stop in time, killing it", pid)
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            self.children.discard(pid)
+
+    def retire(self, pids: set[int]):
+        # Workers of the previous code stop once the new ones accept,
+        # the shared socket never stops listening in between
+        started: int = self.wait_ready(
+            self.workers, self.settings.SERVER_GRACEFUL_TIMEOUT
+        )
+        if started < self.workers:
+            logger.warning("Only %d workers ready after reload", started)
+        self.children |= pids
+        self.terminate(pids)
+
+    def reload(self):
+        # Re-executes the master so code and settings are loaded again, the
+        # pid stays the same and the running workers remain its children
+        logger.info("Reloading")
+        os.environ[LISTENER_FD] = str(self.sock.fileno())
+        os.environ[RETIRING] = ",".join(map(str, sorted(self.children)))
+        # The mask survives the exec, a signal arriving before the new
+        # master installs its handlers waits instead of killing it
+        signal.pthread_sigmask(signal.SIG_BLOCK, SIGNALS)
+        os.execv(sys.executable, [sys.executable, *sys.orig_argv[1:]])
+
+    def run(self, retiring: set[int] = frozenset()) -> int:
+        for signum in SIGNALS:
+            signal.signal(
+                signum, lambda signum, frame: self.signals.append(signum)
+            )
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, SIGNALS)
+        # Objects loaded so far never change, keeping the collector off
+        # their pages keeps them shared copy-on-write with the workers
+        gc.freeze()
+        for _ in range(self.workers):
+            self.spawn()
+        if retiring:
+            self.retire(set(retiring))
+        logger.info(
+            "Serving with %d workers on %s",
+            self.workers,
+            self.sock.getsockname(),
+        )
+
+        missing: int = 0
+        respawn_at: float = 0.0
+        while True:
+            readable, _, _ = select.select([self.ready_reader], [], [], 0.2)
+            if readable:
+                # A worker came up, whatever made the others crash is gone
+                os.read(self.ready_reader, 1024)
+                self.failures = 0
+            while self.signals:
+                signum: int = self.signals.pop(0)
+                if signum == signal.SIGHUP:
+                    self.reload()
+                self.terminate(set(self.children))
+                return 0
+            for code in self.reap().values():
+                missing += 1
+                if not code:
+                    continue
+                self.failures += 1
+                if self.failures >= self.settings.SERVER_WORKER_FAILURES:
+                    logger.error(
+                        "Workers failed %d times in a row, giving up",
+                        self.failures,
+                    )
+                    self.terminate(set(self.children))
+                    return 1
+                respawn_at = time.monotonic() + min(
+                    0.1 * 2**self.failures, MAX_BACKOFF_SECONDS
+                )
+            if missing and time.monotonic() >= respawn_at:
+                for _ in range(missing):
+                    self.spawn()
+                missing = 0
+
+
+def main(arguments: list[str] = None) -> int:
+    settings: Settings = get_settings()
+    parser = argparse.ArgumentParser(
+        description="Run the API with one preloaded worker process per CPU"
+    )
+    parser.add_argument("--host", default=settings.SERVER_HOST)
+    parser.add_argument("--port", type=int, default=settings.SERVER_PORT)
+    parser.add_argument("--workers", type=int, default=worker_count(settings))
+    parser.add_argument("--app", default="football.app:app")
+    options = parser.parse_args(arguments)
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(levelname)s: %(message)s"
+    )
+    retiring: set[int] = {
+        int(pid) for pid in os.environ.pop(RETIRING, "").split(",") if pid
+    }
+    sock: socket.socket = listener(options.host, options.port)
+
+    # Preloaded once, the workers fork with the app already imported. The
+    # engines come first, the app then imports the final settings.
+    preload_databases(settings, options.workers)
+    module, _, attribute = options.app.partition(":")
+    app = getattr(importlib.import_module(module), attribute)
+    return Master(app, sock, options.workers, get_settings()).run(retiring)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,6 @@
+from functools import lru_cache
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -6,4 +9,101 @@ class Settings(BaseSettings):
         env_file=".env", env_file_encoding="utf-8"
     )
 
-    DATABASE_URL: str
+    # Required, checked when the engines are built
+    DATABASE_URL: str = ""
+    DEBUG: bool = False
+
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    # 0 runs one worker per CPU available to the container
+    SERVER_WORKERS: int = 0
+    # In-flight requests get this long to finish on shutdown and reload
+    SERVER_GRACEFUL_TIMEOUT: float = 30.0
+    # Proxies whose X-Forwarded-For and X-Forwarded-Proto are believed,
+    # anyone else could claim any client address
+    SERVER_FORWARDED_ALLOW_IPS: list[str] = ["127.0.0.1"]
+    # Worker crashes in a row, none starting in between, before the master
+    # gives up and exits with an error
+    SERVER_WORKER_FAILURES: int = 10
+    # Schema written by python -m football.openapi at build time
+    OPENAPI_FILE: str = ""
+
+    # Size and overflow only apply to queue pools, not in-memory SQLite
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30.0
+    DATABASE_POOL_RECYCLE: int = 1800
+    DATABASE_POOL_PRE_PING: bool = True
+    DATABASE_POOL_PREWARM: bool = True
+    # psycopg prepares a statement server side once it ran this many times
+    # on a connection, -1 turns it off (needed behind pgbouncer in
+    # transaction mode)
+    DATABASE_PREPARE_THRESHOLD: int = 2
+    # Connections the database accepts from the whole server, split across
+    # the workers' pools, 0 keeps the pool size of every worker as is
+    DATABASE_MAX_CONNECTIONS: int = 0
+
+    # GET handlers read from these round-robin, a replica that fails is
+    # skipped and probed again after the retry interval
+    DATABASE_REPLICA_URLS: list[str] = []
+    DATABASE_REPLICA_RETRY: float = 5.0
+    # Reads of a client that just wrote go to the primary for this long
+    READ_YOUR_WRITES_SECONDS: int = 5
+
+    QUERY_REPEAT_THRESHOLD: int = 3
+
+    # "" turns caching off, "memory" keeps an LRU per worker, "shared" one
+    # memory mapped table for all workers of the host, "redis" any server
+    # speaking the Redis protocol at CACHE_URL
+    CACHE_BACKEND: Literal["", "memory", "shared", "redis"] = ""
+    CACHE_URL: str = "redis://localhost:6379/0"
+    CACHE_PREFIX: str = "football"
+    CACHE_TTL: float = 60.0
+    # Per namespace TTLs, e.g. {"standings": 300}
+    CACHE_NAMESPACE_TTLS: dict[str, float] = {"standings": 300.0}
+    CACHE_MEMORY_ENTRIES: int = 10_000
+    CACHE_SHARED_PATH: str = "/dev/shm/football-cache"
+    CACHE_SHARED_SLOTS: int = 4096
+    CACHE_SHARED_SLOT_SIZE: int = 8192
+    # Namespaces whose entries are served stale after a change while one
+    # request per worker recomputes them, with the most seconds a changed
+    # entry may still be served. Also sent to proxies in Cache-Control.
+    CACHE_STALE_WHILE_REVALIDATE: dict[str, float] = {"standings": 30.0}
+    # Committed changes are announced on this Postgres NOTIFY channel so
+    # every worker evicts its entries, other databases stay in process
+    CACHE_BUS_CHANNEL: str = "football_cache"
+    CACHE_BUS_RECONNECT: float = 1.0
+
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+    SLOW_QUERY_EXPLAIN: bool = True
+    SLOW_QUERY_EXPLAIN_ANALYZE: bool = False
+    SLOW_QUERY_EXPLAIN_INTERVAL: float = 60.0
+
+    # Profiling is off unless a token is set, callers send it in the
+    # X-Profile header or the profile query parameter
+    PROFILE_TOKEN: str = ""
+    PROFILE_ALLOWED_CLIENTS: list[str] = []
+    PROFILE_DIRECTORY: str = ""
+
+    # Background stack sampling, off at 0 Hz
+    SAMPLING_PROFILER_HZ: float = 0.0
+    SAMPLING_PROFILER_DIRECTORY: str = "profiles"
+    SAMPLING_PROFILER_INTERVAL: float = 60.0
+
+    COMPRESSION_MINIMUM_SIZE: int = 500
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_LEVEL: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
+    COMPRESSION_CACHE_SIZE: int = 8 * 1024 * 1024
+
+    # Identical GETs in flight at once share one execution; larger
+    # responses are not kept for the others
+    COALESCE_REQUESTS: bool = True
+    COALESCE_MAX_BODY_SIZE: int = 4 * 1024 * 1024
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    # Read once per process on first use, importing the app validates
+    # nothing
+    return Settings()
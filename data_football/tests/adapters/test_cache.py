@@ -0,0 +1,255 @@
+import fnmatch
+import os
+import socketserver
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from time import monotonic, time
+from typing import Optional
+
+import pytest
+
+from football.adapters.cache import (
+    Cache,
+    MemoryCache,
+    RedisCache,
+    Revalidated,
+    SharedMemoryCache,
+)
+
+
+class RespHandler(socketserver.StreamRequestHandler):
+    # Just enough of the Redis protocol for the commands the cache sends
+    def read_command(self) -> Optional[list[bytes]]:
+        line: bytes = self.rfile.readline()
+        if not line:
+            return None
+        arguments: list[bytes] = []
+        for _ in range(int(line[1:])):
+            length: int = int(self.rfile.readline()[1:])
+            arguments.append(self.rfile.read(length + 2)[:-2])
+        return arguments
+
+    def handle(self):
+        store: dict[bytes, bytes] = self.server.store
+        while (command := self.read_command()) is not None:
+            name, *arguments = command
+            if name == b"GET":
+                value: Optional[bytes] = store.get(arguments[0])
+                self.wfile.write(
+                    b"$-1\r\n"
+                    if value is None
+                    else b"$%d\r\n%s\r\n" % (len(value), value)
+                )
+            elif name == b"SET":
+                store[arguments[0]] = arguments[1]
+                self.wfile.write(b"+OK\r\n")
+            elif name == b"DEL":
+                removed: int = sum(
+                    store.pop(key, None) is not None for key in arguments
+                )
+                self.wfile.write(b":%d\r\n" % removed)
+            elif name == b"SCAN":
+                pattern: str = arguments[2].decode()
+                keys: list[bytes] = [
+                    key
+                    for key in store
+                    if fnmatch.fnmatchcase(key.decode(), pattern)
+                ]
+                self.wfile.write(b"*2\r\n$1\r\n0\r\n*%d\r\n" % len(keys))
+                for key in keys:
+                    self.wfile.write(b"$%d\r\n%s\r\n" % (len(key), key))
+            else:
+                self.wfile.write(b"-ERR unknown command\r\n")
+
+
+@pytest.fixture
+def redis_url() -> Iterator[str]:
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), RespHandler)
+    server.daemon_threads = True
+    server.store = {}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"redis://127.0.0.1:{server.server_address[1]}/0"
+    server.shutdown()
+    server.server_close()
+
+
+def test_memory_cache_evicts_least_recently_used():
+    # Arrange
+    backend: MemoryCache = MemoryCache(max_entries=2)
+    backend.set("a", b"1", 60)
+    backend.set("b", b"2", 60)
+    backend.get("a")
+
+    # Act
+    backend.set("c", b"3", 60)
+
+    # Assert
+    assert backend.get("a") == b"1"
+    assert backend.get("b") is None
+    assert backend.get("c") == b"3"
+
+
+def test_memory_cache_expires_entries():
+    # Arrange
+    backend: MemoryCache = MemoryCache()
+
+    # Act
+    backend.set("a", b"1", 0)
+
+    # Assert
+    assert backend.get("a") is None
+
+
+def test_shared_memory_cache_is_shared_between_processes(tmp_path: Path):
+    # Arrange
+    path: str = str(tmp_path / "cache")
+    backend: SharedMemoryCache = SharedMemoryCache(path, 16, 256)
+
+    # Act
+    pid: int = os.fork()
+    if not pid:
+        SharedMemoryCache(path, 16, 256).set("key", b"from child", 60)
+        os._exit(0)
+    os.waitpid(pid, 0)
+
+    # Assert
+    assert backend.get("key") == b"from child"
+    backend.delete_prefix("ke")
+    assert backend.get("key") is None
+
+
+def test_shared_memory_cache_replaces_and_skips_oversized(tmp_path: Path):
+    # Arrange
+    backend: SharedMemoryCache = SharedMemoryCache(
+        str(tmp_path / "cache"), 16, 256
+    )
+    backend.set("key", b"old", 60)
+
+    # Act
+    backend.set("key", b"new", 60)
+    backend.set("large", b"x" * 256, 60)
+
+    # Assert
+    assert backend.get("key") == b"new"
+    assert backend.get("large") is None
+
+
+def test_shared_memory_cache_recovers_slot_of_dead_writer(tmp_path: Path):
+    # Arrange
+    backend: SharedMemoryCache = SharedMemoryCache(
+        str(tmp_path / "cache"), 16, 256
+    )
+    backend.set("key", b"old", 60)
+    offset: int = next(
+        offset
+        for offset in backend.offsets(backend.digest(b"key"))
+        if backend.read(offset)[2] == b"key"
+    )
+    # Killed between the two halves of a write
+    backend.SLOT.pack_into(backend.memory, offset, 7, 0, 0, 0, 0)
+
+    # Act
+    torn: Optional[bytes] = backend.get("key")
+    backend.set("key", b"new", 60)
+
+    # Assert
+    assert torn is None
+    assert backend.get("key") == b"new"
+
+
+def test_redis_cache_round_trip(redis_url: str):
+    # Arrange
+    backend: RedisCache = RedisCache(redis_url)
+
+    # Act
+    backend.set("football:teams:1", b"team", 60)
+    backend.set("football:teams:2", b"other", 60)
+    first: Optional[bytes] = backend.get("football:teams:1")
+    backend.delete_prefix("football:teams:")
+
+    # Assert
+    assert first == b"team"
+    assert backend.get("football:teams:2") is None
+
+
+def test_cache_invalidate_follows_dependencies():
+    # Arrange
+    cache: Cache = Cache(MemoryCache())
+    cache.set("teams", 1, value=b"one")
+    cache.set("teams", 2, value=b"two")
+    cache.set("standings", 7, value=b"table")
+
+    # Act
+    cache.invalidate("teams", [1])
+
+    # Assert
+    assert cache.get("teams", 1) is None
+    assert cache.get("teams", 2) == b"two"
+    assert cache.get("standings", 7) is None
+
+
+def test_cache_fails_open_when_backend_is_down():
+    # Arrange
+    cache: Cache = Cache(RedisCache("redis://127.0.0.1:1/0"))
+
+    # Act
+    cache.set("teams", 1, value=b"one")
+
+    # Assert
+    assert cache.get("teams", 1) is None
+    assert cache.down_until > 0
+
+
+def test_cache_serves_changed_entries_stale_within_limit():
+    # Arrange
+    cache: Cache = Cache(MemoryCache(), stale={"standings": 60.0})
+    cache.set_revalidated("standings", 1, value=b"table", computed=time())
+
+    # Act
+    fresh: Optional[Revalidated] = cache.get_revalidated("standings", 1)
+    cache.invalidate("matches", [3])
+    stale: Optional[Revalidated] = cache.get_revalidated("standings", 1)
+    cache.stale["standings"] = 0.0
+    expired: Optional[Revalidated] = cache.get_revalidated("standings", 1)
+
+    # Assert
+    assert fresh.body == b"table"
+    assert not fresh.stale
+    assert stale.body == b"table"
+    assert stale.stale
+    assert expired is None
+
+
+def test_cache_runs_one_refresh_per_entry():
+    # Arrange
+    cache: Cache = Cache(MemoryCache(), stale={"standings": 60.0})
+    refresh = cache.refresher("standings", 1, compute=lambda: b"new")
+
+    # Act
+    duplicate = cache.refresher("standings", 1, compute=lambda: b"other")
+    refresh()
+
+    # Assert
+    assert duplicate is None
+    assert cache.get_revalidated("standings", 1).body == b"new"
+    assert cache.refresher("standings", 1, compute=lambda: b"") is not None
+
+
+def test_cache_refresh_claim_lapses_when_never_run(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    # Arrange
+    cache: Cache = Cache(MemoryCache(), stale={"standings": 60.0})
+    cache.refresher("standings", 1, compute=lambda: b"never run")
+
+    # Act
+    claimed = cache.refresher("standings", 1, compute=lambda: b"")
+    later: float = monotonic() + 61
+    monkeypatch.setattr("football.adapters.cache.monotonic", lambda: later)
+    reclaimed = cache.refresher("standings", 1, compute=lambda: b"")
+
+    # Assert
+    assert claimed is None
+    assert reclaimed is not None
@@ -1,7 +1,306 @@
+import threading
+from functools import lru_cache
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI
+from fastapi.testclient import TestClient
+from httpx import Response
+from pydantic import BaseModel, model_validator
+from sqlalchemy import Engine, select
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import QueuePool
+
+from football.adapters import database
+from football.adapters.database import (
+    QueryStats,
+    ReplicaRouter,
+    SessionRoute,
+    build_engine,
+    count_queries,
+    warm_pool,
+)
+from football.adapters.models import Team
+from football.metrics import registry
+from football.middlewares.metrics import MetricsMiddleware
 
 
 def test_get_session(session: Session):
     # Assert
     assert session.is_active is True
     assert type(session) is Session
+
+
+def test_count_queries_flags_repeated_statements(session: Session):
+    # Arrange
+    team_ids: list[int] = [1, 2, 3]
+
+    # Act
+    with count_queries(session.get_bind()) as stats:
+        for team_id in team_ids:
+            session.scalar(select(Team).where(Team.id == team_id))
+        session.scalar(select(Team).where(Team.id == 1))
+
+    # Assert
+    assert stats.count == len(team_ids) + 1
+    assert stats.duration > 0
+    assert list(stats.repeated(len(team_ids)).values()) == [len(team_ids)]
+    assert not stats.repeated(len(team_ids) + 1)
+
+
+def test_query_stats_only_count_by_default():
+    # Arrange
+    stats: QueryStats = QueryStats()
+
+    # Act
+    for team_id in range(3):
+        stats.record("SELECT 1", {"id": team_id}, 0.001)
+
+    # Assert
+    assert stats.count == 3  # noqa: PLR2004
+    assert stats.statements is None
+    assert not stats.repeated(2)
+
+
+def test_debug_query_headers(session: Session):
+    # Arrange
+    app: FastAPI = FastAPI()
+
+    @app.get("/")
+    def teams(session: Session = Depends(lambda: session)):
+        session.scalars(select(Team)).all()
+        return {}
+
+    client: TestClient = TestClient(MetricsMiddleware(app, debug=True))
+
+    # Act
+    response: Response = client.get("/")
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["X-DB-Queries"] == "1"
+    assert float(response.headers["X-DB-Time"]) > 0
+
+
+def test_query_headers_off_by_default(client: TestClient):
+    # Act
+    response: Response = client.get("/teams/")
+
+    # Assert
+    assert "X-DB-Queries" not in response.headers
+
+
+def test_build_engine_pool_options(tmp_path: Path):
+    # Arrange
+    pool_size: int = 3
+
+    # Act
+    engine: Engine = build_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        pool_size=pool_size,
+        max_overflow=0,
+    )
+
+    # Assert
+    assert isinstance(engine.pool, QueuePool)
+    assert engine.pool.size() == pool_size
+    engine.dispose()
+
+
+def test_build_engine_single_connection_pool():
+    # Act
+    engine: Engine = build_engine("sqlite://", pool_size=3, pool_recycle=60)
+
+    # Assert
+    assert not isinstance(engine.pool, QueuePool)
+
+
+def test_warm_pool(tmp_path: Path):
+    # Arrange
+    pool_size: int = 3
+    engine: Engine = build_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}", pool_size=pool_size
+    )
+
+    # Act
+    opened: int = warm_pool(engine)
+
+    # Assert
+    assert opened == pool_size
+    assert engine.pool.checkedin() == pool_size
+    assert warm_pool(engine) == 0
+    engine.dispose()
+
+
+@pytest.fixture
+def replica_router(tmp_path: Path) -> ReplicaRouter:
+    router: ReplicaRouter = ReplicaRouter(
+        build_engine(f"sqlite:///{tmp_path / 'primary.db'}"),
+        [
+            build_engine(f"sqlite:///{tmp_path / f'replica{index}.db'}")
+            for index in range(2)
+        ],
+        retry_after=60,
+    )
+    yield router
+    for engine in (router.primary, *router.replicas):
+        engine.dispose()
+
+
+def test_replica_router_round_robin(replica_router: ReplicaRouter):
+    # Act
+    chosen: list[Engine] = [replica_router.engine() for _ in range(4)]
+
+    # Assert
+    assert chosen == replica_router.replicas * 2
+    assert replica_router.engine(primary=True) is replica_router.primary
+
+
+def test_replica_router_skips_replicas_down(replica_router: ReplicaRouter):
+    # Arrange
+    first, second = replica_router.replicas
+
+    # Act
+    replica_router.mark_down(first)
+
+    # Assert
+    assert {replica_router.engine() for _ in range(4)} == {second}
+    replica_router.mark_down(second)
+    assert replica_router.engine() is replica_router.primary
+
+
+def test_replica_router_probes_again(replica_router: ReplicaRouter):
+    # Arrange
+    first, _ = replica_router.replicas
+    replica_router.retry_after = 0
+    replica_router.mark_down(first)
+
+    # Act
+    replica_router.engine()
+    for thread in threading.enumerate():
+        if thread.name == "football-replica-probe":
+            thread.join()
+
+    # Assert
+    assert not replica_router.down
+    assert first in {replica_router.engine() for _ in range(2)}
+
+
+def test_replica_router_marks_failing_replica_down(tmp_path: Path):
+    # Arrange
+    broken: Engine = build_engine(f"sqlite:///{tmp_path / 'missing' / 'x.db'}")
+    router: ReplicaRouter = ReplicaRouter(
+        build_engine("sqlite://"), [broken], retry_after=60
+    )
+
+    # Act
+    with pytest.raises(OperationalError):
+        with Session(router.engine()) as session:
+            session.execute(select(1))
+
+    # Assert
+    assert router.engine() is router.primary
+
+
+def test_pool_metrics_per_engine(
+    replica_router: ReplicaRouter, monkeypatch: pytest.MonkeyPatch
+):
+    # Arrange
+    monkeypatch.setattr(
+        database, "databases", lru_cache(maxsize=1)(lambda: replica_router)
+    )
+    database.databases()
+
+    # Act
+    with replica_router.replicas[1].connect():
+        text: str = registry.render()
+
+    # Assert
+    assert 'db_pool_checked_out{engine="primary"} 0' in text
+    assert 'db_pool_checked_out{engine="replica0"} 0' in text
+    assert 'db_pool_checked_out{engine="replica1"} 1' in text
+
+
+def test_read_your_writes(
+    replica_router: ReplicaRouter, monkeypatch: pytest.MonkeyPatch
+):
+    # Arrange
+    monkeypatch.setattr(database, "databases", lambda: replica_router)
+    app: FastAPI = FastAPI()
+
+    @app.get("/")
+    def read(session: Session = Depends(database.get_read_session)):
+        return {"primary": session.get_bind() is replica_router.primary}
+
+    @app.post("/")
+    def write(session: Session = Depends(database.get_session)):
+        return {}
+
+    client: TestClient = TestClient(app)
+
+    # Act
+    before: Response = client.get("/")
+    forced: Response = client.get("/", headers={"X-Read-Primary": "1"})
+    client.post("/")
+    after: Response = client.get("/")
+
+    # Assert
+    assert before.json() == {"primary": False}
+    assert forced.json() == {"primary": True}
+    assert after.json() == {"primary": True}
+
+
+def test_session_route_releases_connection(
+    replica_router: ReplicaRouter, monkeypatch: pytest.MonkeyPatch
+):
+    # Arrange
+    monkeypatch.setattr(database, "databases", lambda: replica_router)
+    pool = replica_router.primary.pool
+    awaited: list[Session] = []
+
+    class Pool(BaseModel):
+        checked_out: int
+
+        @model_validator(mode="before")
+        @classmethod
+        def inspect(cls, data: dict) -> dict:
+            # Response validation runs after the handler returned
+            return {"checked_out": pool.checkedout()}
+
+    router: APIRouter = APIRouter(route_class=SessionRoute)
+
+    @router.get("/used", response_model=Pool)
+    def used(session: Session = Depends(database.get_read_session)):
+        session.execute(select(1))
+        return {}
+
+    @router.get("/used-async", response_model=Pool)
+    async def used_async(
+        session: Session = Depends(database.get_read_session),
+    ):
+        session.execute(select(1))
+        awaited.append(session)
+        return {}
+
+    @router.get("/unused", response_model=Pool)
+    def unused(session: Session = Depends(database.get_read_session)):
+        return {}
+
+    app: FastAPI = FastAPI()
+    app.include_router(router)
+    client: TestClient = TestClient(app, headers={"X-Read-Primary": "1"})
+
+    # Act
+    unused_response: Response = client.get("/unused")
+    connections: int = pool.checkedin()
+    used_response: Response = client.get("/used")
+    async_response: Response = client.get("/used-async")
+
+    # Assert
+    assert connections == 0
+    assert unused_response.json() == {"checked_out": 0}
+    assert used_response.json() == {"checked_out": 0}
+    assert async_response.json() == {"checked_out": 0}
+    assert len(awaited) == 1
@@ -0,0 +1,186 @@
+import json
+import os
+import threading
+from time import time
+
+import pytest
+from sqlalchemy import Engine, create_engine, update
+from sqlalchemy.orm import Session
+
+from football.adapters import invalidation
+from football.adapters.cache import DEPENDENCIES, Cache
+from football.adapters.invalidation import (
+    MAX_PAYLOAD,
+    Changes,
+    MemoryBus,
+    PostgresBus,
+    build_bus,
+)
+from football.adapters.models import Team
+from football.settings import Settings
+
+POSTGRES_URL: str = os.environ.get("TEST_POSTGRES_URL", "")
+
+
+def test_commit_evicts_changed_rows(
+    session: Session, team: Team, memory_cache: Cache
+):
+    # Arrange
+    memory_cache.set("teams", team.id, value=b"team")
+    memory_cache.set("teams", team.id + 1, value=b"other")
+    memory_cache.set_revalidated(
+        "standings", 1, value=b"table", computed=time() - 1
+    )
+
+    # Act
+    team.name = "Renamed"
+    session.commit()
+
+    # Assert
+    assert memory_cache.get("teams", team.id) is None
+    assert memory_cache.get("teams", team.id + 1) == b"other"
+    assert memory_cache.get_revalidated("standings", 1).stale
+
+
+def test_rollback_evicts_nothing(
+    session: Session, team: Team, memory_cache: Cache
+):
+    # Arrange
+    memory_cache.set("teams", team.id, value=b"team")
+
+    # Act
+    team.name = "Renamed"
+    session.flush()
+    session.rollback()
+
+    # Assert
+    assert memory_cache.get("teams", team.id) == b"team"
+
+
+def test_bulk_update_evicts_whole_namespace(
+    session: Session, team: Team, memory_cache: Cache
+):
+    # Arrange
+    memory_cache.set("teams", team.id + 1, value=b"other")
+
+    # Act
+    session.execute(update(Team).values(country="Elsewhere"))
+    session.commit()
+
+    # Assert
+    assert memory_cache.get("teams", team.id + 1) is None
+
+
+def test_commit_announces_changes_inside_its_transaction(
+    session: Session,
+    team: Team,
+    memory_cache: Cache,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    # Arrange
+    announced: list[tuple[bool, Changes]] = []
+
+    class RecordingBus(MemoryBus):
+        @staticmethod
+        def announce(session: Session, changes: Changes):
+            announced.append((session.in_transaction(), dict(changes)))
+
+    monkeypatch.setattr(invalidation, "invalidation_bus", RecordingBus)
+    team_id: int = team.id
+
+    # Act
+    team.name = "Renamed"
+    session.commit()
+
+    # Assert
+    assert announced == [(True, {"teams": {team_id}})]
+
+
+def test_postgres_bus_skips_its_own_notifications():
+    # Arrange
+    sender: PostgresBus = PostgresBus(lambda: None, "football_cache")
+    receiver: PostgresBus = PostgresBus(lambda: None, "football_cache")
+    sender.origin, receiver.origin = "sender", "receiver"
+    received: list[Changes] = []
+    sender.subscribe(received.append)
+    receiver.subscribe(received.append)
+    payload: str = sender.encode({"teams": {1, 2}, "matches": None})
+
+    # Act
+    sender.receive(payload)
+    receiver.receive(payload)
+
+    # Assert
+    assert received == [{"teams": {1, 2}, "matches": None}]
+
+
+def test_postgres_bus_survives_malformed_notifications():
+    # Arrange
+    bus: PostgresBus = PostgresBus(lambda: None, "football_cache")
+    received: list[Changes] = []
+    bus.subscribe(received.append)
+
+    # Act
+    bus.receive("not json")
+    bus.receive('{"origin": "other"}')
+
+    # Assert
+    assert received == [dict.fromkeys(DEPENDENCIES)] * 2
+
+
+def test_postgres_bus_names_tables_of_large_change_sets():
+    # Arrange
+    bus: PostgresBus = PostgresBus(lambda: None, "football_cache")
+
+    # Act
+    payload: str = bus.encode({"matches": set(range(MAX_PAYLOAD))})
+
+    # Assert
+    assert len(payload) < MAX_PAYLOAD
+    assert json.loads(payload)["tables"] == {"matches": None}
+
+
+def test_build_bus_by_database():
+    # Arrange
+    def settings(url: str, backend: str = "memory") -> Settings:
+        return Settings(DATABASE_URL=url, CACHE_BACKEND=backend)
+
+    # Act
+    buses: list[MemoryBus] = [
+        build_bus(settings("sqlite://")),
+        build_bus(settings("postgresql+psycopg://test@db/test")),
+        build_bus(settings("postgresql://test@db/test", backend="")),
+    ]
+
+    # Assert
+    assert [type(bus) for bus in buses] == [MemoryBus, PostgresBus, MemoryBus]
+    with pytest.raises(ValueError, match="psycopg driver"):
+        build_bus(settings("postgresql+psycopg2://test@db/test"))
+
+
+@pytest.mark.skipif(not POSTGRES_URL, reason="No postgresql configured")
+def test_postgres_bus_reaches_other_workers():
+    # Arrange
+    engine: Engine = create_engine(POSTGRES_URL)
+    sender: PostgresBus = PostgresBus(lambda: engine, "football_test")
+    receiver: PostgresBus = PostgresBus(lambda: engine, "football_test")
+    delivered: threading.Event = threading.Event()
+    received: list[Changes] = []
+    receiver.subscribe(received.append)
+    receiver.subscribe(lambda changes: delivered.set())
+    receiver.start()
+
+    # Act
+    try:
+        for _ in range(50):
+            with Session(engine) as session:
+                sender.announce(session, {"teams": {7}})
+                session.commit()
+            if delivered.wait(0.1):
+                break
+    finally:
+        receiver.stop()
+        engine.dispose()
+
+    # Assert
+    assert received[0] == {"teams": {7}}
@@ -0,0 +1,61 @@
+from sqlalchemy.orm import Session
+
+from football.adapters.models import Match, Team
+from football.adapters.queries import (
+    fetch_one,
+    lookup,
+    parse_expand,
+    parse_fields,
+    select_by_id,
+    select_records,
+)
+
+
+def test_select_records_with_fields():
+    # Arrange
+    selected: tuple[str, ...] = parse_fields(Match, "goals_home,goals_away")
+
+    # Act
+    statement = select_records(Match, {}, selected)
+
+    # Assert
+    assert selected == ("id", "goals_home", "goals_away")
+    assert [column.name for column in statement.selected_columns] == [
+        "id",
+        "goals_home",
+        "goals_away",
+    ]
+
+
+def test_select_records_with_fields_and_expand():
+    # Arrange
+    paths: dict = parse_expand(Match, "home_team")
+    selected: tuple[str, ...] = parse_fields(Match, "goals_home")
+
+    # Act
+    sql: str = str(select_records(Match, paths, selected))
+
+    # Assert
+    assert "matches.goals_away" not in sql
+    assert "JOIN teams" in sql
+
+
+def test_statements_reused_across_calls():
+    # Act
+    first = select_records(Match, parse_expand(Match, "home_team"))
+    second = select_records(Match, parse_expand(Match, "home_team"))
+
+    # Assert
+    assert first is second
+    assert select_by_id(Match, {}) is select_by_id(Match, {})
+    assert lookup(Team, "name") is lookup(Team, "name")
+
+
+def test_select_by_id_binds_id(session: Session, team: Team):
+    # Act
+    record = fetch_one(session, select_by_id(Team, {}), {"id": team.id})
+    missing = session.scalar(lookup(Team), {"id": team.id + 1})
+
+    # Assert
+    assert record.name == team.name
+    assert missing is None
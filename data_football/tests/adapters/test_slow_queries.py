@@ -0,0 +1,133 @@
+import logging
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from football import app as application
+from football.adapters.database import ReplicaRouter, build_engine
+from football.adapters.models import Team
+from football.adapters.slow_queries import SlowQueryLog
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord):
+        self.records.append(record)
+
+
+def test_slow_query_log_with_explain(session: Session, team: Team):
+    # Arrange
+    handler: ListHandler = ListHandler()
+    slow_queries: SlowQueryLog = SlowQueryLog(threshold_ms=0, handler=handler)
+    slow_queries.install(session.get_bind())
+    slow_queries.start()
+
+    # Act
+    session.scalar(select(Team).where(Team.name == team.name))
+    session.scalar(select(Team).where(Team.name == team.name))
+    slow_queries.stop()
+    slow_queries.uninstall(session.get_bind())
+
+    # Assert
+    messages: list[str] = [record.getMessage() for record in handler.records]
+    assert len(messages) == len(["first", "second"])
+    assert "FROM teams" in messages[0]
+    assert f"'{team.name}'" in messages[0]
+    assert "no route" in messages[0]
+    assert "Plan:\n" in messages[0]
+    assert "SCAN teams" in messages[0] or "SEARCH teams" in messages[0]
+    # EXPLAIN is rate limited per statement
+    assert "Plan:\n" not in messages[1]
+
+
+def test_slow_query_log_below_threshold(session: Session, team: Team):
+    # Arrange
+    handler: ListHandler = ListHandler()
+    slow_queries: SlowQueryLog = SlowQueryLog(
+        threshold_ms=60_000, handler=handler
+    )
+    slow_queries.install(session.get_bind())
+    slow_queries.start()
+
+    # Act
+    session.scalar(select(Team))
+    slow_queries.stop()
+    slow_queries.uninstall(session.get_bind())
+
+    # Assert
+    assert handler.records == []
+
+
+def test_slow_query_log_with_route(
+    client: TestClient, session: Session, team_url: str
+):
+    # Arrange
+    handler: ListHandler = ListHandler()
+    slow_queries: SlowQueryLog = SlowQueryLog(
+        threshold_ms=0, explain=False, handler=handler
+    )
+    slow_queries.install(session.get_bind())
+    slow_queries.start()
+
+    # Act
+    client.get(team_url)
+    slow_queries.stop()
+    slow_queries.uninstall(session.get_bind())
+
+    # Assert
+    assert "on GET /teams/:" in handler.records[0].getMessage()
+
+
+def test_slow_query_explained_off_the_request_path(
+    session: Session, team: Team
+):
+    # Arrange
+    handler: ListHandler = ListHandler()
+    slow_queries: SlowQueryLog = SlowQueryLog(threshold_ms=0, handler=handler)
+    slow_queries.install(session.get_bind())
+    slow_queries.start()
+    # Records queue up while nothing runs the EXPLAINs
+    slow_queries.listener.stop()
+
+    # Act
+    session.scalar(select(Team).where(Team.name == team.name))
+    slow_queries.uninstall(session.get_bind())
+    queued: str = slow_queries.listener.queue.queue[0].getMessage()
+    slow_queries.listener.start()
+    slow_queries.stop()
+
+    # Assert
+    assert "Plan:\n" not in queued
+    assert "Plan:\n" in handler.records[0].getMessage()
+
+
+def test_slow_query_log_installed_on_every_engine(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    # Arrange
+    router: ReplicaRouter = ReplicaRouter(
+        build_engine(f"sqlite:///{tmp_path / 'primary.db'}"),
+        [build_engine(f"sqlite:///{tmp_path / 'replica.db'}")],
+    )
+    monkeypatch.setattr(application, "databases", lambda: router)
+    monkeypatch.setattr(application.settings, "SLOW_QUERY_THRESHOLD_MS", 1.0)
+    after = application.slow_queries.after
+
+    # Act
+    with TestClient(application.app):
+        installed: list[bool] = [
+            event.contains(engine, "after_cursor_execute", after)
+            for engine in (router.primary, *router.replicas)
+        ]
+
+    # Assert
+    assert installed == [True, True]
+    assert not event.contains(
+        router.replicas[0], "after_cursor_execute", after
+    )
@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from copy import deepcopy
 from datetime import datetime
 
@@ -7,7 +8,12 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
 from sqlalchemy.pool import StaticPool
 
-from football.adapters.database import get_session
+from football.adapters.cache import Cache, MemoryCache, cache
+from football.adapters.database import (
+    count_queries,
+    get_read_session,
+    get_session,
+)
 from football.adapters.models import (
     Championship,
     Goal,
@@ -30,11 +36,33 @@ def client(session):
 
     with TestClient(app) as client:
         app.dependency_overrides[get_session] = get_session_override
+        app.dependency_overrides[get_read_session] = get_session_override
         yield client
 
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def memory_cache(monkeypatch: pytest.MonkeyPatch) -> Cache:
+    # Caching is off by default, this turns the app's cache on
+    monkeypatch.setattr(cache, "backend", MemoryCache())
+    return cache
+
+
+@pytest.fixture
+def lagging_replica(client):
+    # Reads through get_read_session see none of the committed rows
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    table_registry.metadata.create_all(engine)
+    with Session(engine) as replica:
+        app.dependency_overrides[get_read_session] = lambda: replica
+        yield replica
+
+
 @pytest.fixture
 def session():
     engine = create_engine(
@@ -50,6 +78,24 @@ def session():
     table_registry.metadata.drop_all(engine)
 
 
+@pytest.fixture
+def query_budget(session):
+    @contextmanager
+    def budget(max_queries: int, repeat_threshold: int = 3):
+        with count_queries(session.get_bind()) as stats:
+            yield stats
+
+        statements: str = "\n".join(stats.statements)
+        assert stats.count <= max_queries, (
+            f"{stats.count} queries over a budget of {max_queries}:\n"
+            f"{statements}"
+        )
+        repeated: dict[str, int] = stats.repeated(repeat_threshold)
+        assert not repeated, f"Possible N+1 queries: {repeated}"
+
+    return budget
+
+
 @pytest.fixture
 def user_url() -> str:
     return "/users/"
@@ -1,10 +1,14 @@
 from copy import deepcopy
 from http import HTTPStatus
 
+import pytest
 from fastapi.testclient import TestClient
 from httpx import Response
+from sqlalchemy import text
+from sqlalchemy.orm import Session
 
-from football.adapters.models import Championship
+from football.adapters.cache import Cache
+from football.adapters.models import Championship, Match, Round, Stadium, Team
 from football.domain.entities import ChampionshipModel
 from football.utils import random_str
 
@@ -187,3 +191,144 @@ def test_delete_championship_with_error(
     # Assert
     assert response.status_code == HTTPStatus.NOT_FOUND
     assert response.json() == {"detail": "Championship not found"}
+
+
+def test_get_standings(  # noqa: PLR0913, PLR0917
+    client: TestClient,
+    championship_url: str,
+    championship: Championship,
+    round: Round,
+    team: Team,
+    away_team: Team,
+    match: Match,
+):
+    # Arrange
+    home, away = match.goals_home, match.goals_away
+
+    # Act
+    response: Response = client.get(
+        f"{championship_url}{championship.id}/standings"
+    )
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    rows: dict[int, dict] = {
+        row["team_id"]: row for row in response.json()["standings"]
+    }
+    assert rows[team.id]["goals_for"] == home
+    assert rows[team.id]["goals_against"] == away
+    assert rows[away_team.id]["goal_difference"] == away - home
+    assert rows[team.id]["points"] == (
+        3 if home > away else 1 if home == away else 0
+    )
+    assert sorted(row["position"] for row in rows.values()) == [1, 2]
+
+
+def test_get_standings_computed_on_primary(
+    client: TestClient,
+    championship_url: str,
+    championship: Championship,
+    memory_cache: Cache,
+    lagging_replica: Session,
+):
+    # Act
+    response: Response = client.get(
+        f"{championship_url}{championship.id}/standings"
+    )
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert memory_cache.get_revalidated("standings", championship.id)
+
+
+def test_get_standings_reads_replica_without_cache(
+    client: TestClient,
+    championship_url: str,
+    championship: Championship,
+    lagging_replica: Session,
+):
+    # Act
+    detail: Response = client.get(f"{championship_url}{championship.id}")
+    standings: Response = client.get(
+        f"{championship_url}{championship.id}/standings"
+    )
+
+    # Assert
+    assert detail.status_code == HTTPStatus.NOT_FOUND
+    assert standings.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_get_standings_not_found(client: TestClient, championship_url: str):
+    # Act
+    response: Response = client.get(f"{championship_url}1/standings")
+
+    # Assert
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert response.json() == {"detail": "Championship not found"}
+
+
+def test_standings_served_stale_while_recomputed(  # noqa: PLR0913, PLR0917
+    client: TestClient,
+    championship_url: str,
+    match_url: str,
+    match_base: dict,
+    championship: Championship,
+    round: Round,
+    stadium: Stadium,
+    team: Team,
+    away_team: Team,
+    match: Match,
+    session: Session,
+    memory_cache: Cache,
+):
+    # Arrange
+    url: str = f"{championship_url}{championship.id}/standings"
+    first: Response = client.get(url)
+    # Plain SQL, the ORM commit hooks never see it
+    session.execute(text("UPDATE matches SET goals_home = 5, goals_away = 0"))
+    session.commit()
+
+    # Act
+    cached: Response = client.get(url)
+    client.put(
+        f"{match_url}{match.id}",
+        json={**match_base, "goals_home": 0, "goals_away": 4},
+    )
+    stale: Response = client.get(url)
+    updated: Response = client.get(url)
+
+    # Assert
+    assert cached.json() == first.json()
+    assert stale.json() == first.json()
+    assert "stale-while-revalidate" in stale.headers["cache-control"]
+    assert int(stale.headers["age"]) >= 0
+    assert updated.json() != first.json()
+    assert updated.json()["standings"][0]["team_id"] == match.away_team_id
+
+
+def test_standings_recomputed_past_max_staleness(  # noqa: PLR0913, PLR0917
+    client: TestClient,
+    championship_url: str,
+    championship: Championship,
+    round: Round,
+    stadium: Stadium,
+    team: Team,
+    away_team: Team,
+    match: Match,
+    session: Session,
+    memory_cache: Cache,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    # Arrange
+    monkeypatch.setattr(memory_cache, "stale", {"standings": 0.0})
+    url: str = f"{championship_url}{championship.id}/standings"
+    first: Response = client.get(url)
+
+    # Act
+    match.goals_home, match.goals_away = 0, 4
+    session.commit()
+    updated: Response = client.get(url)
+
+    # Assert
+    assert updated.json() != first.json()
+    assert updated.headers["age"] == "0"
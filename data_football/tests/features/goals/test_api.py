@@ -3,6 +3,7 @@ from http import HTTPStatus
 
 from fastapi.testclient import TestClient
 from httpx import Response
+from sqlalchemy.orm import Session
 
 from football.adapters.models import (
     Goal,
@@ -10,7 +11,11 @@ from football.adapters.models import (
     Player,
     Team,
 )
-from football.domain.entities import GoalModel
+from football.domain.entities import (
+    GoalModel,
+    PlayerModel,
+    TeamModel,
+)
 from football.utils import random_int
 
 
@@ -192,6 +197,87 @@ def test_get_goals_with_no_results(
     assert response.json() == {"goals": []}
 
 
+def test_get_goals_by_match_ids(
+    client: TestClient,
+    goal_url: str,
+    goal: Goal,
+):
+    # Arrange
+    goal_base: dict = GoalModel.model_validate(goal).model_dump()
+    parameters: dict = {"match_ids": f"{goal.match_id},-1"}
+
+    # Act
+    response: Response = client.get(goal_url, params=parameters)
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"goals": [goal_base]}
+
+
+def test_get_goals_by_ids(
+    client: TestClient,
+    goal_url: str,
+    goal: Goal,
+):
+    # Arrange
+    goal_base: dict = GoalModel.model_validate(goal).model_dump()
+    parameters: dict = {"ids": f"-1,{goal.id}"}
+
+    # Act
+    response: Response = client.get(goal_url, params=parameters)
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"goals": [goal_base], "missing": [-1]}
+
+
+def test_get_goals_with_expand(  # noqa: PLR0913, PLR0917
+    client: TestClient,
+    session: Session,
+    goal_url: str,
+    goal: Goal,
+    player: Player,
+    team: Team,
+):
+    # Arrange
+    parameters: dict = {
+        "match_id": goal.match_id,
+        "expand": "player,team",
+    }
+    session.expire_all()
+
+    # Act
+    response: Response = client.get(
+        goal_url,
+        params=parameters,
+    )
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["goals"][0]["player"] == (
+        PlayerModel.model_validate(player).model_dump()
+    )
+    assert response.json()["goals"][0]["team"] == (
+        TeamModel.model_validate(team).model_dump()
+    )
+
+
+def test_get_goal_with_invalid_expand(
+    client: TestClient,
+    goal_url: str,
+    goal: Goal,
+):
+    # Act
+    response: Response = client.get(
+        f"{goal_url}{goal.id}",
+        params={"expand": "minute"},
+    )
+
+    # Assert
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == {"detail": "Invalid expand path 'minute'"}
+
+
 def test_update_goal(  # noqa: PLR0913, PLR0917
     client: TestClient,
     goal_url: str,
@@ -3,14 +3,22 @@ from http import HTTPStatus
 
 from fastapi.testclient import TestClient
 from httpx import Response
+from sqlalchemy.orm import Session
 
 from football.adapters.models import (
+    Championship,
+    Goal,
     Match,
     Round,
     Stadium,
     Team,
 )
-from football.domain.entities import MatchModel
+from football.domain.entities import (
+    ChampionshipModel,
+    MatchModel,
+    StadiumModel,
+    TeamModel,
+)
 from football.utils import random_int, random_str
 
 
@@ -35,6 +43,31 @@ def test_create_match(  # noqa: PLR0913, PLR0917
     assert response.json() == match_model
 
 
+def test_create_match_keeps_round_matches(  # noqa: PLR0913, PLR0917
+    client: TestClient,
+    session: Session,
+    match_url: str,
+    match_base: dict,
+    match: Match,
+    stadium: Stadium,
+    round: Round,
+    team: Team,
+    away_team: Team,
+):
+    # Arrange
+    match_id: int = match.id
+    reverse: dict = deepcopy(match_base)
+    reverse["home_team_id"] = match_base["away_team_id"]
+    reverse["away_team_id"] = match_base["home_team_id"]
+
+    # Act
+    response: Response = client.post(match_url, json=reverse)
+
+    # Assert
+    assert response.status_code == HTTPStatus.CREATED
+    assert session.get(Match, match_id) is not None
+
+
 def test_create_match_with_empty_data(
     client: TestClient,
     match_url: str,
@@ -264,6 +297,227 @@ def test_get_matches_with_no_results(
     assert response.json() == {"matches": []}
 
 
+def test_get_matches_by_team_ids(
+    client: TestClient,
+    match_url: str,
+    match: Match,
+):
+    # Arrange
+    match_base: dict = MatchModel.model_validate(match).model_dump()
+    parameters: dict = {"team_ids": f"{match.away_team_id}"}
+
+    # Act
+    response: Response = client.get(match_url, params=parameters)
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"matches": [match_base]}
+
+
+def test_get_matches_with_fields(
+    client: TestClient,
+    match_url: str,
+    match: Match,
+):
+    # Arrange
+    parameters: dict = {
+        "round_id": match.round_id,
+        "fields": "goals_home,goals_away",
+    }
+    scoreboard: dict = {
+        "id": match.id,
+        "goals_home": match.goals_home,
+        "goals_away": match.goals_away,
+    }
+
+    # Act
+    response: Response = client.get(match_url, params=parameters)
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"matches": [scoreboard]}
+
+
+def test_get_match_with_fields_and_expand(
+    client: TestClient,
+    match_url: str,
+    match: Match,
+    stadium: Stadium,
+):
+    # Arrange
+    parameters: dict = {"fields": "date_hour", "expand": "stadium"}
+
+    # Act
+    response: Response = client.get(
+        f"{match_url}{match.id}", params=parameters
+    )
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {
+        "id": match.id,
+        "date_hour": match.date_hour,
+        "stadium": StadiumModel.model_validate(stadium).model_dump(),
+    }
+
+
+def test_get_match_with_invalid_fields(
+    client: TestClient,
+    match_url: str,
+    match: Match,
+):
+    # Act
+    response: Response = client.get(
+        f"{match_url}{match.id}", params={"fields": "created_at"}
+    )
+
+    # Assert
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == {"detail": "Invalid field 'created_at'"}
+
+
+def test_get_match_with_expand(  # noqa: PLR0913, PLR0917
+    client: TestClient,
+    session: Session,
+    match_url: str,
+    match: Match,
+    stadium: Stadium,
+    round: Round,
+    championship: Championship,
+    team: Team,
+    away_team: Team,
+):
+    # Arrange
+    match_id: int = match.id
+    parameters: dict = {
+        "expand": "home_team,away_team,stadium,round.championship"
+    }
+    session.expire_all()
+
+    # Act
+    response: Response = client.get(
+        f"{match_url}{match_id}",
+        params=parameters,
+    )
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["home_team"] == (
+        TeamModel.model_validate(team).model_dump()
+    )
+    assert response.json()["away_team"] == (
+        TeamModel.model_validate(away_team).model_dump()
+    )
+    assert response.json()["stadium"] == (
+        StadiumModel.model_validate(stadium).model_dump()
+    )
+    assert response.json()["round"]["championship"] == (
+        ChampionshipModel.model_validate(championship).model_dump()
+    )
+
+
+def test_get_matches_with_expand_query_budget(  # noqa: PLR0913, PLR0917
+    client: TestClient,
+    session: Session,
+    query_budget,
+    match_url: str,
+    match_base: dict,
+    goal_base: dict,
+):
+    # Arrange
+    matches: int = 5
+    for _ in range(matches):
+        new_match: Match = Match(**match_base)
+        session.add(new_match)
+        session.flush()
+        session.add(Goal(**{**goal_base, "match_id": new_match.id}))
+    session.commit()
+    parameters: dict = {
+        "expand": "home_team,away_team,stadium,round.championship,goals"
+    }
+    session.expire_all()
+
+    # Act
+    with query_budget(max_queries=2):
+        response: Response = client.get(match_url, params=parameters)
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert len(response.json()["matches"]) == matches
+    assert all(len(item["goals"]) == 1 for item in response.json()["matches"])
+
+
+def test_get_matches_with_expand(
+    client: TestClient,
+    session: Session,
+    match_url: str,
+    match: Match,
+    team: Team,
+):
+    # Arrange
+    parameters: dict = {
+        "round_id": match.round_id,
+        "team_id": match.home_team_id,
+        "expand": "home_team",
+    }
+    session.expire_all()
+
+    # Act
+    response: Response = client.get(
+        match_url,
+        params=parameters,
+    )
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["matches"][0]["home_team"] == (
+        TeamModel.model_validate(team).model_dump()
+    )
+    assert "away_team" not in response.json()["matches"][0]
+
+
+def test_get_match_with_invalid_expand(
+    client: TestClient,
+    match_url: str,
+    match: Match,
+):
+    # Arrange
+    parameters: dict = {"expand": "home_team.players"}
+
+    # Act
+    response: Response = client.get(
+        f"{match_url}{match.id}",
+        params=parameters,
+    )
+
+    # Assert
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == {
+        "detail": "Invalid expand path 'home_team.players'"
+    }
+
+
+def test_get_match_with_too_deep_expand(
+    client: TestClient,
+    match_url: str,
+    match: Match,
+):
+    # Arrange
+    parameters: dict = {"expand": "goals.player.current_team"}
+
+    # Act
+    response: Response = client.get(
+        f"{match_url}{match.id}",
+        params=parameters,
+    )
+
+    # Assert
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == {
+        "detail": "Expand path 'goals.player.current_team' exceeds depth 2"
+    }
+
+
 def test_update_match(  # noqa: PLR0913, PLR0917
     client: TestClient,
     match_url: str,
@@ -5,7 +5,7 @@ from fastapi.testclient import TestClient
 from httpx import Response
 
 from football.adapters.models import Player, Team
-from football.domain.entities import PlayerModel
+from football.domain.entities import PlayerModel, TeamModel
 from football.utils import random_str
 
 random_str()
@@ -159,6 +159,51 @@ def test_get_players_with_no_results(
     assert response.json() == {"players": []}
 
 
+def test_get_player_with_expand(
+    client: TestClient,
+    player_url: str,
+    player: Player,
+    team: Team,
+):
+    # Arrange
+    parameters: dict = {"expand": "current_team"}
+
+    # Act
+    response: Response = client.get(
+        f"{player_url}{player.id}",
+        params=parameters,
+    )
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["current_team"] == (
+        TeamModel.model_validate(team).model_dump()
+    )
+
+
+def test_get_players_with_expand(
+    client: TestClient,
+    player_url: str,
+    player: Player,
+    team: Team,
+):
+    # Arrange
+    player_expanded: dict = PlayerModel.model_validate(player).model_dump()
+    player_expanded["current_team"] = TeamModel.model_validate(
+        team
+    ).model_dump()
+
+    # Act
+    response: Response = client.get(
+        player_url,
+        params={"expand": "current_team"},
+    )
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"players": [player_expanded]}
+
+
 def test_update_player(
     client: TestClient,
     player_url: str,
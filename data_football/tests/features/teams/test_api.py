@@ -3,8 +3,13 @@ from http import HTTPStatus
 
 from fastapi.testclient import TestClient
 from httpx import Response
+from sqlalchemy import text
+from sqlalchemy.orm import Session
 
+from football.adapters.cache import Cache
+from football.adapters.database import READ_PRIMARY_COOKIE
 from football.adapters.models import Team
+from football.adapters.queries import MAX_IDS
 from football.domain.entities import TeamModel
 from football.utils import random_str
 
@@ -107,6 +112,81 @@ def test_get_team(
     assert response.json() == team_model
 
 
+def test_get_team_cached_until_updated(  # noqa: PLR0913, PLR0917
+    client: TestClient,
+    team_url: str,
+    team_base: dict,
+    team: Team,
+    session: Session,
+    memory_cache: Cache,
+):
+    # Arrange
+    client.get(f"{team_url}{team.id}")
+    # Plain SQL, the ORM commit hooks never see it
+    session.execute(text("UPDATE teams SET name = 'Changed Behind The Cache'"))
+    session.commit()
+
+    # Act
+    cached: Response = client.get(f"{team_url}{team.id}")
+    client.put(f"{team_url}{team.id}", json={**team_base, "name": "Updated"})
+    updated: Response = client.get(f"{team_url}{team.id}")
+
+    # Assert
+    assert cached.json()["name"] == team_base["name"]
+    assert updated.json()["name"] == "Updated"
+
+
+def test_get_team_cache_filled_from_primary(
+    client: TestClient,
+    team_url: str,
+    team: Team,
+    memory_cache: Cache,
+    lagging_replica: Session,
+):
+    # Act
+    response: Response = client.get(f"{team_url}{team.id}")
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert memory_cache.get("teams", team.id) == response.content
+
+
+def test_get_team_reads_replica_without_cache(
+    client: TestClient,
+    team_url: str,
+    team: Team,
+    lagging_replica: Session,
+):
+    # Act
+    response: Response = client.get(f"{team_url}{team.id}")
+
+    # Assert
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_get_team_skips_cache_after_a_write(  # noqa: PLR0913, PLR0917
+    client: TestClient,
+    team_url: str,
+    team: Team,
+    session: Session,
+    memory_cache: Cache,
+):
+    # Arrange
+    original: str = client.get(f"{team_url}{team.id}").json()["name"]
+    session.execute(text("UPDATE teams SET name = 'Written'"))
+    session.commit()
+
+    # Act
+    cached: Response = client.get(f"{team_url}{team.id}")
+    primary: Response = client.get(
+        f"{team_url}{team.id}", cookies={READ_PRIMARY_COOKIE: "1"}
+    )
+
+    # Assert
+    assert cached.json()["name"] == original
+    assert primary.json()["name"] == "Written"
+
+
 def test_get_not_found_team(
     client: TestClient,
     team_url: str,
@@ -148,6 +228,65 @@ def test_get_teams_with_no_results(client: TestClient, team_url: str):
     assert response.json() == {"teams": []}
 
 
+def test_get_teams_by_ids(
+    client: TestClient,
+    team_url: str,
+    team: Team,
+    away_team: Team,
+):
+    # Arrange
+    parameters: dict = {"ids": f"{away_team.id},-1,{team.id}"}
+    teams: list[dict] = [
+        TeamModel.model_validate(away_team).model_dump(),
+        TeamModel.model_validate(team).model_dump(),
+    ]
+
+    # Act
+    response: Response = client.get(team_url, params=parameters)
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"teams": teams, "missing": [-1]}
+
+
+def test_get_teams_with_invalid_ids(client: TestClient, team_url: str):
+    # Act
+    response: Response = client.get(team_url, params={"ids": "1,a"})
+
+    # Assert
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == {"detail": "Invalid value for 'ids'"}
+
+
+def test_get_teams_with_too_many_ids(client: TestClient, team_url: str):
+    # Arrange
+    ids: str = ",".join(str(team_id) for team_id in range(MAX_IDS + 1))
+
+    # Act
+    response: Response = client.get(team_url, params={"ids": ids})
+
+    # Assert
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == {
+        "detail": f"Too many values for 'ids' (max {MAX_IDS})"
+    }
+
+
+def test_get_team_with_fields(
+    client: TestClient,
+    team_url: str,
+    team: Team,
+):
+    # Act
+    response: Response = client.get(
+        f"{team_url}{team.id}", params={"fields": "code"}
+    )
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"id": team.id, "code": team.code}
+
+
 def test_update_team(
     client: TestClient,
     team_url: str,
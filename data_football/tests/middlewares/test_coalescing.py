@@ -0,0 +1,131 @@
+import asyncio
+from time import perf_counter
+
+import httpx
+import pytest
+from fastapi import BackgroundTasks, FastAPI, Response
+
+from football.adapters.database import READ_PRIMARY_HEADER
+from football.middlewares.coalescing import CoalescingMiddleware
+
+CONCURRENCY: int = 5
+BACKGROUND_SECONDS: float = 0.5
+
+
+@pytest.fixture
+def calls() -> list[str]:
+    return []
+
+
+@pytest.fixture
+def coalescing_app(calls: list[str]) -> FastAPI:
+    app: FastAPI = FastAPI()
+    app.add_middleware(CoalescingMiddleware)
+
+    @app.get("/slow")
+    async def slow(a: str = "", b: str = ""):
+        calls.append(a + b)
+        # Long enough for every request of the test to arrive
+        await asyncio.sleep(0.05)
+        return {"calls": len(calls)}
+
+    @app.get("/cookie")
+    async def cookie(response: Response):
+        calls.append("cookie")
+        await asyncio.sleep(0.05)
+        response.set_cookie("seen", "1")
+        return {}
+
+    @app.get("/refresh")
+    async def refresh(background_tasks: BackgroundTasks):
+        calls.append("refresh")
+        await asyncio.sleep(0.05)
+        background_tasks.add_task(asyncio.sleep, BACKGROUND_SECONDS)
+        return {}
+
+    return app
+
+
+def fetch_all(app: FastAPI, requests: list[tuple[str, dict]]) -> list:
+    async def run() -> list:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            return await asyncio.gather(
+                *(
+                    client.get(url, headers=headers)
+                    for url, headers in requests
+                )
+            )
+
+    return asyncio.run(run())
+
+
+def test_identical_gets_share_one_execution(
+    coalescing_app: FastAPI, calls: list[str]
+):
+    # Act
+    responses: list[httpx.Response] = fetch_all(
+        coalescing_app,
+        [("/slow?a=1&b=2", {}), ("/slow?b=2&a=1", {})] * (CONCURRENCY // 2),
+    )
+
+    # Assert
+    assert calls == ["12"]
+    assert {response.status_code for response in responses} == {200}  # noqa: PLR2004
+    assert {response.text for response in responses} == {'{"calls":1}'}
+
+
+def test_different_requests_run_separately(
+    coalescing_app: FastAPI, calls: list[str]
+):
+    # Act
+    fetch_all(
+        coalescing_app,
+        [
+            ("/slow?a=1", {}),
+            ("/slow?a=2", {}),
+            ("/slow?a=1", {"accept": "application/msgpack"}),
+            ("/slow?a=1", {READ_PRIMARY_HEADER: "1"}),
+        ],
+    )
+
+    # Assert
+    assert sorted(calls) == ["1", "1", "1", "2"]
+
+
+def test_responses_setting_cookies_are_not_shared(
+    coalescing_app: FastAPI, calls: list[str]
+):
+    # Act
+    fetch_all(coalescing_app, [("/cookie", {})] * CONCURRENCY)
+
+    # Assert
+    assert len(calls) == CONCURRENCY
+
+
+def test_followers_do_not_wait_for_background_tasks(
+    coalescing_app: FastAPI, calls: list[str]
+):
+    # Arrange
+    async def run() -> list[float]:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=coalescing_app),
+            base_url="http://test",
+        ) as client:
+
+            async def timed() -> float:
+                started: float = perf_counter()
+                await client.get("/refresh")
+                return perf_counter() - started
+
+            return await asyncio.gather(*(timed() for _ in range(CONCURRENCY)))
+
+    # Act
+    durations: list[float] = sorted(asyncio.run(run()))
+
+    # Assert
+    assert calls == ["refresh"]
+    # Only the request that ran the handler also runs its background task
+    assert durations[-2] < BACKGROUND_SECONDS
+    assert durations[-1] >= BACKGROUND_SECONDS
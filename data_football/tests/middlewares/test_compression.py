@@ -0,0 +1,148 @@
+import gzip
+from http import HTTPStatus
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+from httpx import Response
+
+from football.middlewares.compression import (
+    STREAMS,
+    CompressionMiddleware,
+    negotiate,
+)
+
+PAYLOAD: str = "Data Football Service! " * 100
+
+
+@pytest.fixture
+def compression_app() -> FastAPI:
+    app: FastAPI = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=100)
+
+    @app.get("/large")
+    def large():
+        return PlainTextResponse(PAYLOAD)
+
+    @app.get("/small")
+    def small():
+        return PlainTextResponse("small")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(
+            (PAYLOAD for _ in range(3)), media_type="text/plain"
+        )
+
+    return app
+
+
+@pytest.fixture
+def compression_client(compression_app: FastAPI):
+    with TestClient(compression_app) as client:
+        yield client
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("gzip", "gzip"),
+        ("gzip;q=0.5, deflate", "gzip"),
+        ("*", "gzip"),
+        ("gzip;q=0", ""),
+        ("identity", ""),
+        ("", ""),
+    ],
+)
+def test_negotiate(accept_encoding: str, expected: str):
+    # Act
+    encoding: str = negotiate(accept_encoding, ("gzip",))
+
+    # Assert
+    assert encoding == expected
+
+
+def test_negotiate_prefers_server_order_on_ties():
+    # Act
+    encoding: str = negotiate("gzip, br, zstd", ("zstd", "br", "gzip"))
+
+    # Assert
+    assert encoding == "zstd"
+
+
+def test_compress_large_response(compression_client: TestClient):
+    # Act
+    response: Response = compression_client.get(
+        "/large", headers={"Accept-Encoding": "gzip"}
+    )
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(PAYLOAD)
+    assert response.text == PAYLOAD
+
+
+def test_skip_small_response(compression_client: TestClient):
+    # Act
+    response: Response = compression_client.get(
+        "/small", headers={"Accept-Encoding": "gzip"}
+    )
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert "content-encoding" not in response.headers
+    assert response.text == "small"
+
+
+def test_skip_without_accept_encoding(compression_client: TestClient):
+    # Act
+    response: Response = compression_client.get(
+        "/large", headers={"Accept-Encoding": "identity"}
+    )
+
+    # Assert
+    assert "content-encoding" not in response.headers
+    assert response.text == PAYLOAD
+
+
+def test_compress_streaming_response(compression_client: TestClient):
+    # Act
+    response: Response = compression_client.get(
+        "/stream", headers={"Accept-Encoding": "gzip"}
+    )
+
+    # Assert
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert response.text == PAYLOAD * 3
+
+
+@pytest.mark.parametrize("encoding", sorted(STREAMS))
+def test_compress_with_available_encodings(
+    compression_client: TestClient, encoding: str
+):
+    # Act
+    response: Response = compression_client.get(
+        "/large", headers={"Accept-Encoding": encoding}
+    )
+
+    # Assert
+    assert response.headers["content-encoding"] == encoding
+    assert response.text == PAYLOAD
+
+
+def test_reuse_compressed_payload():
+    # Arrange
+    middleware: CompressionMiddleware = CompressionMiddleware(None)
+    body: bytes = PAYLOAD.encode()
+
+    # Act
+    first: bytes = middleware.compress("gzip", body)
+    second: bytes = middleware.compress("gzip", body)
+
+    # Assert
+    assert first is second
+    assert gzip.decompress(first) == body
@@ -0,0 +1,111 @@
+import sys
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from httpx import Response
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from football.adapters.models import Team
+from football.middlewares.profiler import ProfilerMiddleware
+
+TOKEN: str = "secret-token"
+
+
+def busy_work() -> int:
+    return sum(index * index for index in range(10_000))
+
+
+@pytest.fixture
+def profiler_app(session: Session) -> FastAPI:
+    app: FastAPI = FastAPI()
+
+    @app.get("/teams")
+    def teams(session: Session = Depends(lambda: session)):
+        session.scalars(select(Team)).all()
+        return {"total": busy_work()}
+
+    return app
+
+
+def test_profile_returned_as_speedscope(profiler_app: FastAPI):
+    # Arrange
+    client: TestClient = TestClient(ProfilerMiddleware(profiler_app, TOKEN))
+
+    # Act
+    response: Response = client.get("/teams", headers={"X-Profile": TOKEN})
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    document: dict = response.json()
+    frames: list[str] = [
+        frame["name"] for frame in document["shared"]["frames"]
+    ]
+    # The sync handler runs in a worker thread and is still recorded
+    assert any(frame.startswith("busy_work ") for frame in frames)
+    assert document["status"] == HTTPStatus.OK
+    [query] = document["queries"]
+    assert "FROM teams" in query["statement"]
+    assert query["duration_ms"] >= 0
+    assert sys.getprofile() is None
+
+
+def test_profile_collapsed_includes_sql(profiler_app: FastAPI):
+    # Arrange
+    client: TestClient = TestClient(ProfilerMiddleware(profiler_app, TOKEN))
+
+    # Act
+    response: Response = client.get(
+        "/teams", params={"profile": TOKEN, "profile_format": "collapsed"}
+    )
+
+    # Assert
+    assert response.headers["content-type"].startswith("text/plain")
+    lines: list[str] = response.text.splitlines()
+    assert any("busy_work " in line for line in lines)
+    assert any(line.startswith("SQL;SQL SELECT") for line in lines)
+
+
+@pytest.mark.parametrize(
+    ("token", "allowed_clients"),
+    [
+        ("", ()),
+        ("wrong-token", ()),
+        (TOKEN, ("10.0.0.1",)),
+    ],
+)
+def test_profile_not_requested_or_not_allowed(
+    profiler_app: FastAPI, token: str, allowed_clients: tuple[str, ...]
+):
+    # Arrange
+    client: TestClient = TestClient(
+        ProfilerMiddleware(
+            profiler_app, TOKEN, allowed_clients=allowed_clients
+        )
+    )
+
+    # Act
+    response: Response = client.get("/teams", headers={"X-Profile": token})
+
+    # Assert
+    assert response.json() == {"total": busy_work()}
+
+
+def test_profile_stored_in_directory(profiler_app: FastAPI, tmp_path: Path):
+    # Arrange
+    client: TestClient = TestClient(
+        ProfilerMiddleware(profiler_app, TOKEN, directory=str(tmp_path))
+    )
+
+    # Act
+    response: Response = client.get("/teams", headers={"X-Profile": TOKEN})
+
+    # Assert
+    assert response.json() == {"total": busy_work()}
+    stored: Path = (
+        tmp_path / f"{response.headers['X-Profile-Id']}.speedscope.json"
+    )
+    assert stored.exists()
@@ -0,0 +1,74 @@
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import Engine, create_engine, event, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from football.adapters.database import get_read_session, get_session
+from football.adapters.models import table_registry
+from football.app import app
+from football.dataset import Scale, generate
+
+SEED: int = 35
+SCALE: Scale = Scale(
+    championships=20,
+    seasons=1,
+    rounds=38,
+    teams=400,
+    players_per_team=25,
+    stadiums=200,
+    matches_per_round=10,
+    users=2_000,
+)
+
+BACKENDS: dict[str, str] = {
+    "sqlite": "sqlite://",
+    "postgresql": os.environ.get("TEST_POSTGRES_URL", ""),
+}
+
+
+@pytest.fixture(scope="module", params=list(BACKENDS))
+def dataset_engine(request) -> Engine:
+    url: str = BACKENDS[request.param]
+    if not url:
+        pytest.skip(f"No {request.param} database configured")
+
+    engine: Engine = create_engine(url)
+    if engine.dialect.name == "sqlite":
+        # A single in-memory database shared by every connection
+        engine = create_engine(
+            url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+    table_registry.metadata.create_all(engine)
+    with engine.begin() as connection:
+        generate(connection, SCALE, SEED)
+        connection.execute(text("ANALYZE"))
+
+    yield engine
+
+    table_registry.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def plan_client(dataset_engine: Engine):
+    statements: list[tuple[str, object]] = []
+
+    def capture(connection, cursor, statement, parameters, *args):
+        statements.append((statement, parameters))
+
+    def get_session_override():
+        with Session(dataset_engine) as session:
+            yield session
+
+    event.listen(dataset_engine, "before_cursor_execute", capture)
+    with TestClient(app) as client:
+        app.dependency_overrides[get_session] = get_session_override
+        app.dependency_overrides[get_read_session] = get_session_override
+        yield client, statements
+    app.dependency_overrides.clear()
+    event.remove(dataset_engine, "before_cursor_execute", capture)
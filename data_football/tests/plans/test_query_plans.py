@@ -0,0 +1,112 @@
+import re
+from http import HTTPStatus
+
+import pytest
+from fastapi.testclient import TestClient
+from httpx import Response
+from sqlalchemy import Connection, Engine
+
+MATCH_EXPAND: str = "home_team,away_team,stadium,round.championship,goals"
+SORT: str = "sort"
+
+# Path, query parameters and what the plan may do beyond index lookups:
+# scan a table in full (only the unfiltered listings of that table) or
+# sort in a temp B-tree (SORT, only where the rows are already bounded).
+CASES: list[tuple[str, dict, set[str]]] = [
+    ("/users/", {}, {"users"}),
+    ("/users/12", {}, set()),
+    ("/championships/", {}, {"championships"}),
+    ("/championships/", {"ids": "1,2,3"}, set()),
+    ("/championships/3", {}, set()),
+    ("/stadiums/", {}, {"stadiums"}),
+    ("/stadiums/", {"ids": "4,5,6"}, set()),
+    ("/stadiums/9", {}, set()),
+    ("/teams/", {}, {"teams"}),
+    ("/teams/", {"ids": "7,8,9"}, set()),
+    ("/teams/7", {}, set()),
+    ("/rounds/", {}, {"rounds"}),
+    ("/rounds/", {"championship_ids": "3,4"}, set()),
+    ("/rounds/", {"ids": "40,41"}, set()),
+    ("/rounds/42", {}, set()),
+    ("/players/", {}, {"players"}),
+    ("/players/", {"expand": "current_team"}, {"players"}),
+    # Each team is an ordered index range, merging several needs a sort
+    ("/players/", {"team_ids": "7,8"}, {SORT}),
+    ("/players/", {"ids": "55,56"}, set()),
+    ("/players/team/7", {}, set()),
+    ("/players/55", {"expand": "current_team"}, set()),
+    ("/matches/", {}, {"matches"}),
+    ("/matches/", {"round_id": 42}, set()),
+    ("/matches/", {"team_id": 7}, set()),
+    ("/matches/", {"round_id": 42, "team_id": 7}, set()),
+    ("/matches/", {"round_ids": "1,2"}, set()),
+    ("/matches/", {"stadium_ids": "9"}, set()),
+    ("/matches/", {"team_ids": "7,8"}, set()),
+    ("/matches/", {"ids": "100,101"}, set()),
+    ("/matches/", {"round_id": 42, "expand": MATCH_EXPAND}, set()),
+    ("/matches/100", {"expand": MATCH_EXPAND}, set()),
+    ("/goals/", {}, {"goals"}),
+    ("/goals/", {"match_id": 100}, set()),
+    ("/goals/", {"match_ids": "100,101"}, set()),
+    ("/goals/", {"player_ids": "55"}, set()),
+    ("/goals/", {"team_ids": "7"}, set()),
+    ("/goals/", {"ids": "500,501"}, set()),
+    ("/goals/500", {"expand": "match.round,player.current_team"}, set()),
+]
+
+
+def explain(
+    connection: Connection, statement: str, parameters: object
+) -> list[str]:
+    if connection.dialect.name == "sqlite":
+        rows = connection.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        )
+        return [row[-1] for row in rows]
+    rows = connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+    return [row[0] for row in rows]
+
+
+def regressions(plan: list[str], allowed: set[str]) -> list[str]:
+    found: list[str] = []
+    for line in plan:
+        # Joined tables show up under aliases such as teams_1
+        scan = re.search(r"(?:^SCAN|Seq Scan on) (\w+?)(?:_\d+)?\b", line)
+        if scan and scan.group(1) not in allowed:
+            found.append(line)
+        sort = "TEMP B-TREE" in line or re.search(r"(^|->)\s*Sort\b", line)
+        if sort and SORT not in allowed:
+            found.append(line)
+    return found
+
+
+@pytest.mark.parametrize(
+    ("path", "parameters", "allowed"),
+    CASES,
+    ids=[f"{path}?{parameters}" for path, parameters, _ in CASES],
+)
+def test_query_plan(
+    plan_client: tuple[TestClient, list],
+    dataset_engine: Engine,
+    path: str,
+    parameters: dict,
+    allowed: set[str],
+):
+    # Arrange
+    client, statements = plan_client
+
+    # Act
+    response: Response = client.get(path, params=parameters)
+    executed: list[tuple[str, object]] = list(statements)
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert executed
+    with dataset_engine.connect() as connection:
+        for statement, statement_parameters in executed:
+            plan: list[str] = explain(
+                connection, statement, statement_parameters
+            )
+            assert not regressions(plan, allowed), (
+                f"{statement}\n" + "\n".join(plan)
+            )
@@ -0,0 +1,135 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Engine, create_engine, func, select, text
+from sqlalchemy.pool import StaticPool
+
+from football.adapters.models import Goal, Match, Player, table_registry
+from football.dataset import SCALES, Scale, columns, generate, main
+
+SCALE: Scale = Scale(
+    championships=2,
+    seasons=2,
+    rounds=4,
+    teams=40,
+    players_per_team=5,
+    stadiums=10,
+    matches_per_round=5,
+    users=10,
+)
+
+
+@pytest.fixture
+def dataset_engine() -> Engine:
+    engine: Engine = create_engine("sqlite://", poolclass=StaticPool)
+    table_registry.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def dump(engine: Engine) -> dict[str, list]:
+    # Generated columns only, created_at is set by the database
+    with engine.connect() as connection:
+        return {
+            table.name: connection.execute(
+                select(*(table.c[name] for name in columns(table))).order_by(
+                    table.c.id
+                )
+            ).all()
+            for table in table_registry.metadata.sorted_tables
+        }
+
+
+def test_generate_counts(dataset_engine: Engine):
+    # Act
+    with dataset_engine.begin() as connection:
+        counts: dict[str, int] = generate(connection, SCALE, seed=1)
+
+    # Assert
+    assert counts["teams"] == SCALE.teams
+    assert counts["players"] == SCALE.players
+    assert counts["matches"] == SCALE.matches
+    assert counts["rounds"] == (
+        SCALE.championships * SCALE.seasons * SCALE.rounds
+    )
+    with dataset_engine.connect() as connection:
+        assert (
+            connection.scalar(select(func.count(Goal.id))) == counts["goals"]
+        )
+
+
+def test_generate_is_consistent(dataset_engine: Engine):
+    # Act
+    with dataset_engine.begin() as connection:
+        generate(connection, SCALE, seed=1)
+
+    # Assert
+    with dataset_engine.connect() as connection:
+        # Every goal is scored by a player of the scoring team
+        assert not connection.scalar(
+            select(func.count(Goal.id))
+            .join(Player, Player.id == Goal.player_id)
+            .where(Player.current_team_id != Goal.team_id)
+        )
+        # The score matches the goals of each match
+        goals = (
+            select(func.count(Goal.id))
+            .where(Goal.match_id == Match.id)
+            .scalar_subquery()
+        )
+        assert not connection.scalar(
+            select(func.count(Match.id)).where(
+                Match.goals_home + Match.goals_away != goals
+            )
+        )
+        assert not connection.execute(text("PRAGMA foreign_key_check")).all()
+
+
+def test_generate_is_deterministic(dataset_engine: Engine):
+    # Arrange
+    other: Engine = create_engine("sqlite://", poolclass=StaticPool)
+    table_registry.metadata.create_all(other)
+
+    # Act
+    with dataset_engine.begin() as connection:
+        generate(connection, SCALE, seed=7)
+    with other.begin() as connection:
+        generate(connection, SCALE, seed=7)
+
+    # Assert
+    assert dump(dataset_engine) == dump(other)
+
+
+def test_main(tmp_path: Path, capsys: pytest.CaptureFixture):
+    # Arrange
+    url: str = f"sqlite:///{tmp_path / 'football.db'}"
+
+    # Act
+    main([url, "--create", "--teams", "40", "--championships", "2"])
+
+    # Assert
+    assert "Loaded" in capsys.readouterr().out
+    with create_engine(url).connect() as connection:
+        assert connection.scalar(select(func.count(Player.id))) == (
+            40 * Scale().players_per_team
+        )
+
+
+def test_scale_needs_two_teams_per_match(capsys: pytest.CaptureFixture):
+    # Act
+    with pytest.raises(ValueError, match="at least 20 are needed"):
+        Scale(teams=19, matches_per_round=10)
+    with pytest.raises(SystemExit):
+        main(["sqlite://", "--teams", "10"])
+
+    # Assert
+    assert "10 teams cannot play 10 matches" in capsys.readouterr().err
+
+
+def test_largest_scale_reaches_millions_of_matches():
+    # Act
+    scale: Scale = SCALES["xlarge"]
+
+    # Assert
+    assert scale.matches >= 1_000_000  # noqa: PLR2004
+    assert scale.teams // scale.championships >= scale.matches_per_round * 2
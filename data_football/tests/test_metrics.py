@@ -0,0 +1,79 @@
+from http import HTTPStatus
+
+from fastapi.testclient import TestClient
+from httpx import Response
+
+from football.adapters.models import Team
+from football.metrics import Counter, Histogram, Registry
+
+
+def scrape(client: TestClient) -> dict[str, float]:
+    response: Response = client.get("/metrics")
+    assert response.status_code == HTTPStatus.OK
+    return {
+        sample: float(value)
+        for sample, value in (
+            line.rsplit(" ", 1)
+            for line in response.text.splitlines()
+            if not line.startswith("#")
+        )
+    }
+
+
+def test_histogram_render():
+    # Arrange
+    registry: Registry = Registry()
+    histogram: Histogram = registry.register(
+        Histogram("latency", "Latency.", ("route",), buckets=(0.1, 1.0))
+    )
+    counter: Counter = registry.register(Counter("hits", "Hits."))
+
+    # Act
+    histogram.observe("/", value=0.1)
+    histogram.observe("/", value=0.5)
+    histogram.observe("/", value=3.0)
+    counter.inc()
+    text: str = registry.render()
+
+    # Assert
+    assert text.splitlines() == [
+        "# HELP latency Latency.",
+        "# TYPE latency histogram",
+        'latency_bucket{route="/",le="0.1"} 1',
+        'latency_bucket{route="/",le="1"} 2',
+        'latency_bucket{route="/",le="+Inf"} 3',
+        'latency_sum{route="/"} 3.6',
+        'latency_count{route="/"} 3',
+        "# HELP hits Hits.",
+        "# TYPE hits counter",
+        "hits 1",
+    ]
+
+
+def test_metrics_by_route_template(
+    client: TestClient,
+    team_url: str,
+    team: Team,
+):
+    # Arrange
+    labels: str = 'method="GET",route="/teams/{team_id}"'
+    requests: int = 2
+    before: dict[str, float] = scrape(client)
+
+    # Act
+    for _ in range(requests):
+        client.get(f"{team_url}{team.id}")
+    after: dict[str, float] = scrape(client)
+
+    # Assert
+    def delta(sample: str) -> float:
+        return after.get(sample, 0) - before.get(sample, 0)
+
+    status: str = 'status="200"'
+    assert delta(f"http_requests_total{{{labels},{status}}}") == requests
+    assert delta(f"http_request_duration_seconds_count{{{labels}}}") == (
+        requests
+    )
+    assert delta(f"http_request_db_queries_sum{{{labels}}}") == requests
+    assert after["http_requests_in_flight"] == 0
+    assert not any(f"/teams/{team.id}" in sample for sample in after)
@@ -0,0 +1,50 @@
+import json
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from httpx import Response
+
+from football.openapi import main, use_prebuilt_schema
+
+
+def test_schema_written_at_build_time(tmp_path: Path):
+    # Arrange
+    output: Path = tmp_path / "openapi.json"
+
+    # Act
+    main([str(output)])
+
+    # Assert
+    schema: dict = json.loads(output.read_text())
+    assert "/teams/{team_id}" in schema["paths"]
+
+
+def test_prebuilt_schema_served(tmp_path: Path):
+    # Arrange
+    schema_file: Path = tmp_path / "openapi.json"
+    app: FastAPI = FastAPI()
+    schema: dict = {**app.openapi(), "info": {"title": "Prebuilt"}}
+    app.openapi_schema = None
+    schema_file.write_text(json.dumps(schema))
+
+    # Act
+    used: bool = use_prebuilt_schema(app, str(schema_file))
+    response: Response = TestClient(app).get("/openapi.json")
+
+    # Assert
+    assert used is True
+    assert response.json() == schema
+
+
+def test_missing_prebuilt_schema_generated(tmp_path: Path):
+    # Arrange
+    app: FastAPI = FastAPI(title="Generated")
+
+    # Act
+    used: bool = use_prebuilt_schema(app, str(tmp_path / "missing.json"))
+    response: Response = TestClient(app).get("/openapi.json")
+
+    # Assert
+    assert used is False
+    assert response.json()["info"]["title"] == "Generated"
@@ -0,0 +1,66 @@
+from pathlib import Path
+from time import perf_counter
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from football.profiling import Sampler, render_collapsed, speedscope
+
+STACKS: dict[tuple[str, ...], float] = {
+    ("main", "handler"): 30.0,
+    ("main", "handler", "query"): 70.0,
+}
+
+
+def spin(seconds: float):
+    started: float = perf_counter()
+    while perf_counter() - started < seconds:
+        pass
+
+
+def test_render_collapsed():
+    # Act
+    collapsed: str = render_collapsed(STACKS)
+
+    # Assert
+    assert collapsed == "main;handler 30\nmain;handler;query 70\n"
+
+
+def test_speedscope():
+    # Act
+    document: dict = speedscope("request", STACKS)
+
+    # Assert
+    [profile] = document["profiles"]
+    assert [frame["name"] for frame in document["shared"]["frames"]] == [
+        "main",
+        "handler",
+        "query",
+    ]
+    assert profile["samples"] == [[0, 1], [0, 1, 2]]
+    assert profile["endValue"] == sum(STACKS.values())
+
+
+def test_sampler_writes_stacks_per_route(tmp_path: Path):
+    # Arrange
+    app: FastAPI = FastAPI()
+
+    @app.get("/spin")
+    def spinning():
+        spin(0.3)
+        return {}
+
+    sampler: Sampler = Sampler(hz=200, directory=str(tmp_path), interval=60)
+
+    # Act
+    sampler.start(app.routes)
+    with TestClient(app) as client:
+        client.get("/spin")
+    sampler.stop()
+
+    # Assert
+    [written] = tmp_path.glob("*.collapsed")
+    lines: list[str] = written.read_text().splitlines()
+    assert any(
+        line.startswith("GET /spin;") and "spin (" in line for line in lines
+    )
@@ -0,0 +1,148 @@
+from http import HTTPStatus
+
+import pytest
+from fastapi.testclient import TestClient
+from httpx import Response
+from sqlalchemy.orm import Session
+
+from football.adapters.models import Match, Team
+from football.domain.entities import TeamModel
+from football.responses import (
+    ARROW,
+    JSON,
+    MEDIA_TYPES,
+    MSGPACK,
+    negotiate_media_type,
+)
+
+
+@pytest.mark.parametrize(
+    ("accept", "media_type"),
+    [
+        ("*/*", JSON),
+        ("text/html", JSON),
+        (MSGPACK, MSGPACK),
+        (f"*/*, {MSGPACK}", MSGPACK),
+        (f"{MSGPACK};q=0.5, {JSON}", JSON),
+        (f"{JSON};q=0.1, {ARROW};q=0.9", ARROW),
+        (f"{MSGPACK};q=0", JSON),
+        (f"{MSGPACK};v=1;q=0.1, {JSON};q=0.5", JSON),
+        (f"{MSGPACK}; q=0.9, {JSON};q=0.5", MSGPACK),
+    ],
+)
+def test_negotiate_media_type(accept: str, media_type: str):
+    if media_type not in MEDIA_TYPES:
+        pytest.skip(f"{media_type} is not available")
+
+    # Act
+    negotiated: str = negotiate_media_type(accept)
+
+    # Assert
+    assert negotiated == media_type
+
+
+def test_get_teams_as_msgpack(
+    client: TestClient,
+    team_url: str,
+    team: Team,
+    away_team: Team,
+):
+    # Arrange
+    msgpack = pytest.importorskip("msgpack")
+    parameters: dict = {"ids": f"{away_team.id},-1,{team.id}"}
+    teams: list[dict] = [
+        TeamModel.model_validate(away_team).model_dump(),
+        TeamModel.model_validate(team).model_dump(),
+    ]
+
+    # Act
+    response: Response = client.get(
+        team_url,
+        params=parameters,
+        headers={"Accept": MSGPACK},
+    )
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"] == MSGPACK
+    assert response.headers["vary"] == "Accept"
+    assert msgpack.unpackb(response.content) == {
+        "teams": teams,
+        "missing": [-1],
+    }
+
+
+def test_get_teams_as_arrow(
+    client: TestClient,
+    team_url: str,
+    team: Team,
+    away_team: Team,
+):
+    # Arrange
+    pyarrow = pytest.importorskip("pyarrow")
+    parameters: dict = {"ids": f"{away_team.id},-1,{team.id}"}
+    teams: list[dict] = [
+        TeamModel.model_validate(away_team).model_dump(),
+        TeamModel.model_validate(team).model_dump(),
+    ]
+
+    # Act
+    response: Response = client.get(
+        team_url,
+        params=parameters,
+        headers={"Accept": ARROW},
+    )
+
+    # Assert
+    table = pyarrow.ipc.open_stream(response.content).read_all()
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"] == ARROW
+    assert table.to_pylist() == teams
+    assert table.schema.metadata == {b"missing": b"[-1]"}
+
+
+def test_get_matches_as_arrow_with_expand(
+    client: TestClient,
+    session: Session,
+    match_url: str,
+    match: Match,
+    team: Team,
+):
+    # Arrange
+    pyarrow = pytest.importorskip("pyarrow")
+    parameters: dict = {"round_id": match.round_id, "expand": "home_team"}
+    home_team: dict = TeamModel.model_validate(team).model_dump()
+    session.expire_all()
+
+    # Act
+    response: Response = client.get(
+        match_url,
+        params=parameters,
+        headers={"Accept": ARROW},
+    )
+
+    # Assert
+    table = pyarrow.ipc.open_stream(response.content).read_all()
+    assert response.status_code == HTTPStatus.OK
+    assert table.column("home_team").to_pylist() == [home_team]
+
+
+def test_get_teams_as_arrow_with_no_results(
+    client: TestClient,
+    team_url: str,
+):
+    # Arrange
+    pyarrow = pytest.importorskip("pyarrow")
+
+    # Act
+    response: Response = client.get(
+        team_url,
+        params={"fields": "name"},
+        headers={"Accept": ARROW},
+    )
+
+    # Assert
+    table = pyarrow.ipc.open_stream(response.content).read_all()
+    assert response.status_code == HTTPStatus.OK
+    assert table.num_rows == 0
+    assert sorted(table.column_names) == ["id", "name"]
@@ -0,0 +1,215 @@
+import os
+import signal
+import socket
+import subprocess
+import sys
+from pathlib import Path
+from time import monotonic, sleep
+
+import httpx
+import pytest
+
+from football.adapters.database import ReplicaRouter, databases
+from football.server import (
+    available_cpus,
+    pool_sizing,
+    preload_databases,
+    worker_config,
+    worker_count,
+)
+from football.settings import Settings
+
+WORKERS: int = 2
+
+
+@pytest.mark.parametrize(
+    ("cpu_max", "expected"),
+    [
+        ("max 100000\n", len(os.sched_getaffinity(0))),
+        ("50000 100000\n", 1),
+        ("100000 100000\n", 1),
+    ],
+)
+def test_available_cpus_follows_cgroup_quota(
+    tmp_path: Path, cpu_max: str, expected: int
+):
+    # Arrange
+    path: Path = tmp_path / "cpu.max"
+    path.write_text(cpu_max)
+
+    # Act
+    cpus: int = available_cpus(path)
+
+    # Assert
+    assert cpus == expected
+
+
+def test_available_cpus_without_cgroup(tmp_path: Path):
+    # Act
+    cpus: int = available_cpus(tmp_path / "missing")
+
+    # Assert
+    assert cpus == len(os.sched_getaffinity(0))
+
+
+def test_worker_count_setting_wins():
+    # Act
+    workers: int = worker_count(
+        Settings(DATABASE_URL="sqlite://", SERVER_WORKERS=3)
+    )
+
+    # Assert
+    assert workers == 3  # noqa: PLR2004
+
+
+def test_pool_sizing_splits_connection_budget():
+    # Arrange
+    settings: Settings = Settings(
+        DATABASE_URL="sqlite://", DATABASE_MAX_CONNECTIONS=50
+    )
+
+    # Act
+    overrides: dict[str, str] = pool_sizing(settings, 4)
+
+    # Assert
+    assert overrides == {
+        "DATABASE_POOL_SIZE": "12",
+        "DATABASE_MAX_OVERFLOW": "0",
+    }
+    assert not pool_sizing(Settings(DATABASE_URL="sqlite://"), 4)
+
+
+def test_preloaded_pools_get_their_share(monkeypatch: pytest.MonkeyPatch):
+    # Arrange
+    monkeypatch.setenv("DATABASE_URL", "postgresql+psycopg://test@db/test")
+    monkeypatch.setenv("DATABASE_MAX_CONNECTIONS", "8")
+    # Restored afterwards, preloading writes them
+    monkeypatch.delenv("DATABASE_POOL_SIZE", raising=False)
+    monkeypatch.delenv("DATABASE_MAX_OVERFLOW", raising=False)
+    databases.cache_clear()
+
+    # Act
+    try:
+        router: ReplicaRouter = preload_databases(Settings(), 4)
+        size, overflow = (
+            router.primary.pool.size(),
+            router.primary.pool._max_overflow,
+        )
+        router.primary.dispose()
+    finally:
+        databases.cache_clear()
+
+    # Assert
+    assert size == 2  # noqa: PLR2004
+    assert overflow == 0
+
+
+def test_worker_trusts_only_configured_proxies():
+    # Act
+    default = worker_config(None, Settings(DATABASE_URL="sqlite://"))
+    configured = worker_config(
+        None,
+        Settings(
+            DATABASE_URL="sqlite://",
+            SERVER_FORWARDED_ALLOW_IPS=["10.0.0.1", "10.0.0.2"],
+        ),
+    )
+
+    # Assert
+    assert default.forwarded_allow_ips == ["127.0.0.1"]
+    assert configured.forwarded_allow_ips == ["10.0.0.1", "10.0.0.2"]
+
+
+def free_port() -> int:
+    with socket.socket() as listener:
+        listener.bind(("127.0.0.1", 0))
+        return listener.getsockname()[1]
+
+
+def wait_serving(url: str, timeout: float = 20.0):
+    deadline: float = monotonic() + timeout
+    while monotonic() < deadline:
+        try:
+            if httpx.get(url).is_success:
+                return
+        except httpx.TransportError:
+            sleep(0.1)
+    raise TimeoutError(url)
+
+
+def test_server_reloads_without_dropping_requests(tmp_path: Path):
+    # Arrange
+    port: int = free_port()
+    url: str = f"http://127.0.0.1:{port}/"
+    server: subprocess.Popen = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "football.server",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(WORKERS),
+        ],
+        env={
+            **os.environ,
+            "DATABASE_URL": f"sqlite:///{tmp_path / 'server.db'}",
+            "SERVER_GRACEFUL_TIMEOUT": "5",
+        },
+    )
+    try:
+        wait_serving(url)
+
+        # Act
+        server.send_signal(signal.SIGHUP)
+        statuses: set[int] = set()
+        deadline: float = monotonic() + 3
+        while monotonic() < deadline:
+            statuses.add(httpx.get(url).status_code)
+        server.send_signal(signal.SIGTERM)
+        code: int = server.wait(timeout=20)
+
+        # Assert
+        assert statuses == {200}  # noqa: PLR2004
+        assert code == 0
+    finally:
+        server.kill()
+        server.wait()
+
+
+def test_server_gives_up_when_workers_keep_failing(tmp_path: Path):
+    # Arrange
+    server: subprocess.Popen = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "football.server",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(free_port()),
+            "--workers",
+            str(WORKERS),
+        ],
+        env={
+            **os.environ,
+            # Pre-warming the pool fails, so does every worker's startup
+            "DATABASE_URL": f"sqlite:///{tmp_path / 'missing' / 'x.db'}",
+            "DATABASE_POOL_PREWARM": "true",
+            "SERVER_WORKER_FAILURES": "4",
+        },
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        # Act
+        code: int = server.wait(timeout=20)
+
+        # Assert
+        assert code == 1
+        assert "giving up" in server.stderr.read()
+    finally:
+        server.kill()
+        server.wait()
@@ -0,0 +1,78 @@
+import json
+import os
+import subprocess
+import sys
+
+# Seconds a worker may take to import the app and run its startup, raise
+# it through the environment on slow machines
+STARTUP_BUDGET: float = float(os.environ.get("STARTUP_BUDGET_SECONDS", "3"))
+# Loaded on first use only, never while booting
+DEFERRED: tuple[str, ...] = ("pyarrow",)
+# Loaded by the lifespan when it builds the engines, not by the import
+DRIVER: str = "psycopg"
+
+BOOT: str = """
+import json
+import sys
+from time import perf_counter
+
+started = perf_counter()
+from fastapi.testclient import TestClient
+
+from football.app import app
+
+imported = sorted(sys.modules)
+with TestClient(app) as client:
+    client.get("/")
+print(json.dumps({
+    "seconds": perf_counter() - started,
+    "imported": imported,
+    "modules": sorted(sys.modules),
+}))
+"""
+
+
+def test_worker_starts_within_budget():
+    # Act
+    completed = subprocess.run(
+        [sys.executable, "-c", BOOT],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={
+            **os.environ,
+            # Never connected to, nothing is pre-warmed or cached
+            "DATABASE_URL": "postgresql+psycopg://test@db/test",
+            "DATABASE_POOL_PREWARM": "false",
+            "CACHE_BACKEND": "",
+            "SAMPLING_PROFILER_HZ": "0",
+        },
+    )
+
+    # Assert
+    boot: dict = json.loads(completed.stdout.splitlines()[-1])
+    assert boot["seconds"] < STARTUP_BUDGET
+    assert not set(DEFERRED) & set(boot["modules"])
+    assert DRIVER not in boot["imported"]
+    assert DRIVER in boot["modules"]
+
+
+def test_app_imports_without_settings():
+    # Arrange
+    environment: dict = {
+        name: value
+        for name, value in os.environ.items()
+        if name != "DATABASE_URL"
+    }
+
+    # Act
+    completed = subprocess.run(
+        [sys.executable, "-c", "import football.app"],
+        check=False,
+        capture_output=True,
+        text=True,
+        env=environment,
+    )
+
+    # Assert
+    assert completed.returncode == 0, completed.stderr